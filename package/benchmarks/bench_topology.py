@@ -0,0 +1,93 @@
+# Licensed Materials - Property of IBM
+# Copyright IBM Corp. 2019
+
+"""Benchmarks of the topology construction with the HBase composites.
+
+The benchmarks do not require IBM Streams or HBase, run them with::
+
+    cd package
+    pip install pytest-benchmark
+    python -m pytest benchmarks/bench_topology.py
+
+The results depend on the machine, save a baseline before a change and compare the change with it::
+
+    python -m pytest benchmarks/bench_topology.py --benchmark-storage=benchmarks/results --benchmark-save=baseline
+    python -m pytest benchmarks/bench_topology.py --benchmark-storage=benchmarks/results --benchmark-compare
+"""
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from streamsx.topology.topology import Topology
+from streamsx.topology.schema import StreamSchema
+import streamsx.spl.types
+import streamsx.hbase as hbase
+import streamsx.hbase._hbase
+
+
+OPERATOR_COUNTS = [1, 100, 1000]
+CONNECTION = 'localhost:8020'
+GET_SCHEMA = StreamSchema('tuple<rstring who, rstring value, int32 numResults>')
+PUT_SCHEMA = StreamSchema('tuple<rstring who, boolean success>')
+ROUNDS = {1: 50, 100: 5, 1000: 2}
+
+
+def _input_stream():
+    topo = Topology()
+    s = topo.source(['row1']).map(lambda x: {'who': x, 'value': x}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+    return (topo, s), {}
+
+
+def _topology():
+    return (Topology(),), {}
+
+
+def _run(benchmark, fn, setup, count):
+    benchmark.extra_info['operators'] = count
+    benchmark.pedantic(fn, setup=setup, rounds=ROUNDS[count], iterations=1)
+
+
+@pytest.mark.parametrize('count', OPERATOR_COUNTS)
+def test_construct_get(benchmark, count):
+    def build(topo, s):
+        for i in range(count):
+            s.map(hbase.HBaseGet(tableName='table' + str(i), rowAttrName='who', connection=CONNECTION, schema=GET_SCHEMA,
+                outAttrName='value', outputCountAttr='numResults', maxVersions=1, minTimestamp=0))
+    _run(benchmark, build, _input_stream, count)
+
+
+@pytest.mark.parametrize('count', OPERATOR_COUNTS)
+def test_construct_put(benchmark, count):
+    def build(topo, s):
+        for i in range(count):
+            s.map(hbase.HBasePut(tableName='table' + str(i), rowAttrName='who', valueAttrName='value', connection=CONNECTION, schema=PUT_SCHEMA,
+                staticColumnFamily='cf', staticColumnQualifier='cq', successAttr='success', batchSize=100, Timestamp=0))
+    _run(benchmark, build, _input_stream, count)
+
+
+@pytest.mark.parametrize('count', OPERATOR_COUNTS)
+def test_construct_scan(benchmark, count):
+    def build(topo):
+        for i in range(count):
+            topo.source(hbase.HBaseScan(tableName='table' + str(i), connection=CONNECTION, maxVersions=1, initDelay=0.5, scannerCaching=500))
+    _run(benchmark, build, _topology, count)
+
+
+@pytest.mark.parametrize('count', OPERATOR_COUNTS)
+def test_file_dependency(benchmark, count):
+    # every operator adds the hbase-site.xml file of its connection and client properties to the bundle
+    def register(topo):
+        for i in range(count):
+            streamsx.hbase._hbase._generate_hbase_site_xml(topo, CONNECTION, {'hbase.client.scanner.caching': i % 10 + 1})
+    _run(benchmark, register, _topology, count)
+
+
+@pytest.mark.parametrize('count', OPERATOR_COUNTS)
+def test_parameter_coercion(benchmark, count):
+    def coerce():
+        for i in range(count):
+            streamsx.spl.types.int32(i)
+            streamsx.spl.types.int64(i)
+            streamsx.spl.types.float64(i)
+    _run(benchmark, coerce, lambda: ((), {}), count)
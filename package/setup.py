@@ -21,6 +21,7 @@ setup(
     'Programming Language :: Python :: 3.7',
   ],
   install_requires=['streamsx', 'streamsx.toolkits'],
+  extras_require={'export': ['pyarrow'], 'benchmark': ['pytest', 'pytest-benchmark']},
   
   test_suite='nose.collector',
   tests_require=['nose']
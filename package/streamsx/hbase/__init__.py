@@ -30,7 +30,27 @@ Alternative is specify the location of HBase configuration file **hbase-site.xml
 For example::
 
     export HBASE_SITE_XML=/usr/hdp/current/hbase-client/conf/hbase-site.xml
-                                 
+
+
+.. _fused-operators:
+
+Fused operators
++++++++++++++++
+
+The options ``cellsPerSecond``, ``bytesPerSecond``, ``rpcsPerSecond``, ``metrics``, ``traceSampleRate``, ``warmupRows``, ``hotKeys`` and ``saltBuckets``
+of the composites add operators to the input and output ports of the HBase operator. These operators are fused with the HBase operator
+into one processing element, a tuple is passed to the HBase operator by a function call and not sent over the network.
+A rate limit throttles the HBase operator directly, and the probes see the tuples at the time the HBase operator receives and submits them.
+The state of the operators is local to the processing element, in a parallel region every channel has its own state.
+
+A rate limit is a token bucket. It can be a submission parameter or a callable that returns the current limit,
+the callable is called again every second while the job is running.
+The custom metrics of the operators are published by the processing element, use :py:func:`operator_metrics` to read them.
+
+The option ``fuseWithHBaseOperators`` fuses the HBase operators of a topology with each other. The operators with the same ``connection``,
+``authPrincipal`` and ``vmArg`` are fused into one processing element and run in one JVM.
+They do not share the HBase connection, see :py:func:`colocate`.
+
 
     
 Sample
@@ -58,8 +78,12 @@ the scanned rows::
     
 """
 
-__version__='1.5.2'
+__version__='1.6.0'
 
-__all__ = ['HBaseGet', 'HBasePut', 'HBaseScan', 'download_toolkit', 'scan', 'get', 'put', 'delete']
-from streamsx.hbase._hbase import download_toolkit, scan, get, put, delete, HBaseGet, HBasePut, HBaseScan
+__all__ = ['HBaseGet', 'HBasePut', 'HBaseScan', 'HBaseScanExport', 'HBaseTriggeredScan', 'HBaseWorkload', 'HBaseHotKeys', 'HBaseRowKeySample', 'HBaseMutate', 'download_toolkit', 'scan', 'get', 'put', 'delete', 'commit_watermark', 'operator_metrics', 'colocate', 'ColumnFamily', 'create_table', 'alter_table', 'compute_split_points', 'HBASEHotKeySchema',
+           'ValueFilter', 'RowRegexFilter', 'FamilyRegexFilter', 'QualifierRegexFilter', 'ColumnPrefixFilter', 'PrefixFilter', 'KeyOnlyFilter']
+from streamsx.hbase._hbase import download_toolkit, scan, get, put, delete, commit_watermark, operator_metrics, colocate, HBaseGet, HBasePut, HBaseScan, HBaseScanExport, HBaseTriggeredScan, HBaseWorkload, HBaseHotKeys, HBaseRowKeySample, HBaseMutate
+from streamsx.hbase._hbase import ColumnFamily, create_table, alter_table, compute_split_points
+from streamsx.hbase._hbase import HBASEHotKeySchema
+from streamsx.hbase._hbase import ValueFilter, RowRegexFilter, FamilyRegexFilter, QualifierRegexFilter, ColumnPrefixFilter, PrefixFilter, KeyOnlyFilter
 
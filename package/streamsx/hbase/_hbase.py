@@ -2,14 +2,33 @@
 # Licensed Materials - Property of IBM
 # Copyright IBM Corp. 2019
 
+import collections
 import datetime
+import hashlib
+import json
+import logging
 import os
+import queue
+import random
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import warnings
+import weakref
+import xml.etree.ElementTree
+import zlib
 from tempfile import gettempdir
+import streamsx.ec
 import streamsx.spl.op
 import streamsx.spl.types
 from streamsx.topology.schema import CommonSchema, StreamSchema
 from streamsx.toolkits import download_toolkit
 import streamsx.topology.composite
+from streamsx.topology.state import ConsistentRegionConfig
 
 _TOOLKIT_NAME = 'com.ibm.streamsx.hbase'
 
@@ -20,6 +39,18 @@ HBASEScanOutputSchema = StreamSchema('tuple<rstring row, int32 numResults, rstri
 ``'tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>'``
 """
 
+HBASEScanRowOutputSchema = StreamSchema('tuple<rstring row, int32 numResults, map<rstring, map<rstring, rstring>> value>')
+"""Structured output schema of the scan response tuple in row mode. One tuple per row contains all cells of the row as map of column families to maps of column qualifiers to values.
+
+``'tuple<rstring row, int32 numResults, map<rstring, map<rstring, rstring>> value>'``
+"""
+
+HBASEScanFamilyRowOutputSchema = StreamSchema('tuple<rstring row, int32 numResults, map<rstring, rstring> value>')
+"""Structured output schema of the scan response tuple in row mode with one static column family. One tuple per row contains the cells of the column family as map of column qualifiers to values.
+
+``'tuple<rstring row, int32 numResults, map<rstring, rstring> value>'``
+"""
+
 HBASEGetOutputSchema = StreamSchema('tuple<rstring row, int32 numResults, rstring value, rstring infoType, rstring requestedDetail>')
 """Structured output schema of the get response tuple. This schema is the output schema of the get method.
 
@@ -32,6 +63,18 @@ HBASEPutOutputSchema = StreamSchema('tuple<boolean success>')
 ``'tuple<boolean  success>'``
 """
 
+HBASEHotKeySchema = StreamSchema('tuple<rstring keyType, rstring key, int32 rank, int64 count, float64 rate, float64 share>')
+"""Structured output schema of the hot key report tuple. The key type is ``row`` or ``prefix``, the rate is in requests per second and the share is the fraction of all requests in the interval.
+
+``'tuple<rstring keyType, rstring key, int32 rank, int64 count, float64 rate, float64 share>'``
+"""
+
+HBASEWorkloadSummarySchema = StreamSchema('tuple<rstring operation, int64 operations, int64 failures, float64 throughput, float64 latencyAvgMillis, float64 latencyP50Millis, float64 latencyP95Millis, float64 latencyP99Millis, boolean final>')
+"""Structured output schema of the workload summary tuple. One tuple for each operation type and one tuple with the operation ``OVERALL`` are submitted periodically, the throughput is in operations per second.
+
+``'tuple<rstring operation, int64 operations, int64 failures, float64 throughput, float64 latencyAvgMillis, float64 latencyP50Millis, float64 latencyP95Millis, float64 latencyP99Millis, boolean final>'``
+"""
+
 def _add_toolkit_dependency(topo):
     # IMPORTANT: Dependency of this python wrapper to a specific toolkit version
     # This is important when toolkit is not set with streamsx.spl.toolkit.add_toolkit (selecting toolkit from remote build service)
@@ -40,8 +83,28 @@ def _add_toolkit_dependency(topo):
 
 
 
-def _generate_hbase_site_xml(topo, connection=None):
+def _generate_hbase_site_xml(topo, connection=None, properties=None):
     # The environment variable HADOOP_HOST_PORT has to be set.
+    # Returns the location of the HBase configuration file in the application bundle.
+    hbaseSiteXmlFile = _hbase_site_xml_file(connection)
+    if (len(hbaseSiteXmlFile) > 2):
+        if os.path.exists(hbaseSiteXmlFile):
+            if properties:
+                # operator specific client properties are written into a copy of the configuration file
+                hbaseSiteXmlFile = _write_hbase_site_properties(hbaseSiteXmlFile, properties)
+            # add the HBase configuration file (hbase-site.xml) to the 'etc' directory in bundle
+            hbaseSite = topo.add_file_dependency(hbaseSiteXmlFile, 'etc')
+            print ("HBase configuration xml file " + hbaseSiteXmlFile + ' added to the application directory.')
+            return hbaseSite
+        else:
+            raise AssertionError("The configuration file " + hbaseSiteXmlFile + " doesn't exists'")
+
+    print ("Please set one of the environment variables HADOOP_HOST_PORT or HBASE_SITE_XML or apply the connection parameter")
+    raise AssertionError("Missing HADOOP_HOST_PORT or HBASE_SITE_XML or connection parameter.")
+
+
+def _hbase_site_xml_file(connection=None):
+    # Returns the location of the HBase configuration file of the connection, an empty string if no connection is configured.
     host_port = ""
     hbaseSiteXmlFile = ""
     if connection is None:
@@ -84,18 +147,35 @@ def _generate_hbase_site_xml(topo, connection=None):
             f.write(newText)
         print ("HBase configuration xml file: " + hbaseSiteXmlFile + "   host: " + host + "   port: " + port)
 
-
-    if (len(hbaseSiteXmlFile) > 2):
-        if os.path.exists(hbaseSiteXmlFile):
-            # add the HBase configuration file (hbase-site.xml) to the 'etc' directory in bundle
-            topo.add_file_dependency(hbaseSiteXmlFile, 'etc')
-            print ("HBase configuration xml file " + hbaseSiteXmlFile + ' added to the application directory.')
-            return True
-        else:
-            raise AssertionError("The configuration file " + hbaseSiteXmlFile + " doesn't exists'")
-
-    print ("Please set one of the environment variables HADOOP_HOST_PORT or HBASE_SITE_XML or apply the connection parameter")
-    raise AssertionError("Missing HADOOP_HOST_PORT or HBASE_SITE_XML or connection parameter.")
+    return hbaseSiteXmlFile
+
+
+def _write_hbase_site_properties(hbaseSiteXmlFile, properties):
+    # Creates a copy of the HBase configuration file with the given client properties set.
+    # The file name contains a digest of the content, operators with the same configuration share the file.
+    tree = xml.etree.ElementTree.parse(hbaseSiteXmlFile)
+    configuration = tree.getroot()
+    for prop_name in sorted(properties):
+        prop_value = properties[prop_name]
+        if isinstance(prop_value, bool):
+            prop_value = 'true' if prop_value else 'false'
+        prop = None
+        for p in configuration.findall('property'):
+            if p.findtext('name') == prop_name:
+                prop = p
+                break
+        if prop is None:
+            prop = xml.etree.ElementTree.SubElement(configuration, 'property')
+            xml.etree.ElementTree.SubElement(prop, 'name').text = prop_name
+            xml.etree.ElementTree.SubElement(prop, 'value')
+        prop.find('value').text = str(prop_value)
+
+    newText = xml.etree.ElementTree.tostring(configuration, encoding='unicode')
+    digest = hashlib.sha1(newText.encode('utf-8')).hexdigest()[:12]
+    newFile = os.path.join(gettempdir(), 'hbase-site-' + digest + '.xml')
+    with open(newFile, "w") as f:
+        f.write(newText)
+    return newFile
 
 
 def _check_time_param(time_value, parameter_name):
@@ -110,6 +190,48 @@ def _check_time_param(time_value, parameter_name):
     return result
 
 
+def _check_duration_param(time_value, parameter_name):
+    # like _check_time_param, but fractions of a second are allowed
+    if isinstance(time_value, datetime.timedelta):
+        result = time_value.total_seconds()
+    elif isinstance(time_value, int) or isinstance(time_value, float):
+        result = time_value
+    else:
+        raise TypeError(time_value)
+    if result <= 0:
+        raise ValueError("Invalid "+parameter_name+" value. Value must be greater than zero.")
+    return result
+
+
+def _spl_list_literal(values):
+    # SPL list literal of rstring values
+    return '[' + ', '.join(json.dumps(value, ensure_ascii=False) for value in values) + ']'
+
+
+def _read_split_points(split_points):
+    # split points are given as list of row keys or as file name of a file with one row key per line
+    if isinstance(split_points, str):
+        with open(split_points) as f:
+            split_points = [line.rstrip('\r\n') for line in f]
+    return sorted(set(point for point in split_points if point))
+
+
+def _balanced_key_ranges(split_points, width, start_row=None, end_row=None):
+    # Divides the regions between start_row and end_row into width contiguous key ranges.
+    # Every range covers about the same number of regions. An empty end row means end of table.
+    start_row = start_row if start_row else ''
+    end_row = end_row if end_row else ''
+    bounds = [point for point in split_points if point > start_row and (not end_row or point < end_row)]
+    regions = len(bounds) + 1
+    if width > regions:
+        raise ValueError("Invalid parallelWidth value. The key range covers only " + str(regions) + " regions.")
+    bounds = [start_row] + bounds + [end_row]
+    key_ranges = []
+    for channel in range(width):
+        key_ranges.append((bounds[channel * regions // width], bounds[(channel + 1) * regions // width]))
+    return key_ranges
+
+
 def download_toolkit(url=None, target_dir=None):
     r"""Downloads the latest Hbase toolkit from GitHub.
 
@@ -145,7 +267,70 @@ def download_toolkit(url=None, target_dir=None):
     return _toolkit_location
 
 
-def scan(topology, table_name, max_versions=None, init_delay=None, connection=None, name=None):
+def _read_watermark(watermark_file):
+    # the watermark file contains the timestamp in milliseconds of the last successful scan
+    if os.path.exists(watermark_file):
+        with open(watermark_file) as f:
+            return int(f.read().strip())
+    return None
+
+
+def _write_watermark(watermark_file, watermark):
+    with open(watermark_file, "w") as f:
+        f.write(str(watermark) + '\n')
+
+
+def _store_pending_watermark(watermark_file, clock_skew):
+    # The pending watermark is recorded once on the host where the topology is built, before the job is submitted,
+    # so that a restart of the processing element does not move it. A pending watermark of an earlier build that has
+    # not been committed is kept, an earlier watermark returns cells again, a later one could miss cells.
+    directory = os.path.dirname(os.path.abspath(watermark_file))
+    if not os.path.isdir(directory) or not os.access(directory, os.W_OK):
+        raise ValueError("Invalid watermarkFile value. The directory " + directory + " does not exist or is not writable.")
+    pending_file = watermark_file + '.pending'
+    watermark = _read_watermark(pending_file)
+    if watermark is None:
+        # the cell timestamps are set by the clocks of the region servers, which may be behind the local clock
+        watermark = int((time.time() - clock_skew) * 1000)
+        _write_watermark(pending_file, watermark)
+    return watermark
+
+
+def commit_watermark(watermark_file):
+    """Commits the watermark of an incremental scan after the scan has completed successfully.
+
+    When a topology with a :py:class:`HBaseScan` with the ``watermarkFile`` option is built, the build time minus
+    the ``watermarkClockSkew`` of the scan is stored as pending watermark in the file ``watermarkFile`` + ``.pending``.
+    A pending watermark that has not been committed yet is kept when the topology is built again.
+    Call this function when the job has scanned the table successfully, the next topology built with
+    the same ``watermarkFile`` scans only cells that are newer than this watermark::
+
+        import streamsx.hbase as hbase
+
+        topo = Topology('incremental_scan')
+        changed_rows = topo.source(hbase.HBaseScan(tableName='sample', watermarkFile='sample.watermark'))
+        ...
+        # submit the job and wait until the scan is completed
+        ...
+        hbase.commit_watermark('sample.watermark')
+
+    Args:
+        watermark_file(str): The watermark file used in the ``watermarkFile`` option of the scan.
+
+    Returns:
+        int: The committed watermark, a timestamp in milliseconds.
+
+    .. versionadded:: 1.6
+    """
+    pending_file = watermark_file + '.pending'
+    watermark = _read_watermark(pending_file)
+    if watermark is None:
+        raise ValueError("No pending watermark for " + watermark_file)
+    os.replace(pending_file, watermark_file)
+    return watermark
+
+
+def scan(topology, table_name, max_versions=None, init_delay=None, connection=None, name=None, row_mode=False):
     """Scans a HBASE table and delivers the number of results, rows and values in output stream.
     
     The output streams has to be defined as StreamSchema.
@@ -156,20 +341,24 @@ def scan(topology, table_name, max_versions=None, init_delay=None, connection=No
         init_delay(int|float|datetime.timedelta): The time to wait in seconds before the operator scans the directory for the first time. If not set, then the default value is 0.
         connection(dict|filename|string): Specify the connection to HBASE either with a filename of a HBase configuration file or as string in format "HOST:PORT" or as dict containing the properties 'host' and 'port'. If not specified the environment variables ``HADOOP_HOST_PORT`` or ``HBASE_SITE_XML`` are used.
         name(str): Source name in the Streams context, defaults to a generated name.
+        row_mode(bool): When set to ``True`` the output stream contains one tuple per row with all cells of the row instead of one tuple per cell.
 
     Returns:
         StreamSchema: Output Stream containing the row numResults and values. It is a structured streams schema.
         
         HBASEScanOutputSchema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+
+        In row mode: HBASEScanRowOutputSchema = StreamSchema('tuple<rstring row, int32 numResults, map<rstring, map<rstring, rstring>> value>')
     """
     # check streamsx.hbase version
     _add_toolkit_dependency(topology)
 
-    if (_generate_hbase_site_xml(topology, connection)):
-        _op = _HBASEScan(topology, tableName=table_name, schema=HBASEScanOutputSchema, name=name)
+    hbaseSite = _generate_hbase_site_xml(topology, connection)
+    if (hbaseSite):
+        _op = _HBASEScan(topology, tableName=table_name, schema=HBASEScanRowOutputSchema if row_mode else HBASEScanOutputSchema, name=name)
     # configuration file is specified in hbase-site.xml. This file will be copied to the 'etc' directory of the application bundle.     
     #    topology.add_file_dependency(hbaseSite, 'etc')
-        _op.params['hbaseSite'] = "etc/hbase-site.xml"
+        _op.params['hbaseSite'] = hbaseSite
     
         if init_delay is not None:
             _op.params['initDelay'] = streamsx.spl.types.float64(_check_time_param(init_delay, 'init_delay'))
@@ -203,11 +392,12 @@ def get(stream, table_name, row_attr_name, connection=None, name=None):
     # check streamsx.hbase version
     _add_toolkit_dependency(stream.topology)
 
-    if (_generate_hbase_site_xml(stream.topology, connection)):
+    hbaseSite = _generate_hbase_site_xml(stream.topology, connection)
+    if (hbaseSite):
         _op = _HBASEGet(stream, tableName=table_name, rowAttrName=row_attr_name, schema=HBASEGetOutputSchema, name=name)
         # configuration file is specified in hbase-site.xml. This file will be copied to the 'etc' directory of the application bundle.     
         # stream.topology.add_file_dependency(hbaseSite, 'etc')
-        _op.params['hbaseSite'] = "etc/hbase-site.xml"
+        _op.params['hbaseSite'] = hbaseSite
     
         _op.params['outAttrName'] = "value" 
         _op.params['columnFamilyAttrName'] = "infoType" 
@@ -236,10 +426,11 @@ def put(stream, table_name, connection=None, name=None):
     # check streamsx.hbase version
     _add_toolkit_dependency(stream.topology)
 
-    if (_generate_hbase_site_xml(stream.topology, connection)):
+    hbaseSite = _generate_hbase_site_xml(stream.topology, connection)
+    if (hbaseSite):
         _op = _HBASEPut(stream, tableName=table_name, schema=HBASEPutOutputSchema, name=name)
         # configuration file is specified in hbase-site.xml. This file will be copied to the 'etc' directory of the application bundle.     
-        _op.params['hbaseSite'] = "etc/hbase-site.xml"
+        _op.params['hbaseSite'] = hbaseSite
         _op.params['rowAttrName'] = "character" ;
         _op.params['valueAttrName'] = "value" 
         _op.params['columnFamilyAttrName'] = "colF" 
@@ -269,9 +460,10 @@ def delete(stream, table_name, connection=None, name=None):
     # check streamsx.hbase version
     _add_toolkit_dependency(stream.topology)
 
-    if (_generate_hbase_site_xml(stream.topology, connection)):
+    hbaseSite = _generate_hbase_site_xml(stream.topology, connection)
+    if (hbaseSite):
         _op = _HBASEDelete(stream, tableName=table_name, schema=HBASEScanOutputSchema, name=name)
-        _op.params['hbaseSite'] = "etc/hbase-site.xml"
+        _op.params['hbaseSite'] = hbaseSite
         _op.params['rowAttrName'] = "character" ;
         _op.params['valueAttrName'] = "value" 
         _op.params['columnFamilyAttrName'] = "colF" 
@@ -281,6 +473,1220 @@ def delete(stream, table_name, connection=None, name=None):
     return _op.outputs[0]
 
 
+# Table administration with the HBase shell
+_COMPRESSIONS = ('NONE', 'GZ', 'LZO', 'LZ4', 'SNAPPY', 'ZSTD', 'BZIP2')
+_DATA_BLOCK_ENCODINGS = ('NONE', 'PREFIX', 'DIFF', 'FAST_DIFF', 'ROW_INDEX_V1')
+_BLOOM_FILTERS = ('NONE', 'ROW', 'ROWCOL')
+_DURABILITIES = ('USE_DEFAULT', 'SKIP_WAL', 'ASYNC_WAL', 'SYNC_WAL', 'FSYNC_WAL')
+
+
+def _ruby_string(value):
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+class ColumnFamily(object):
+    """Column family settings of a table for :py:func:`create_table` and :py:func:`alter_table`.
+
+    Settings that are not specified keep their defaults (create) or current values (alter).
+
+    Example, a column family with Snappy compression, fast diff encoding, row Bloom filter and one week TTL::
+
+        cf = hbase.ColumnFamily('cf', compression='SNAPPY', data_block_encoding='FAST_DIFF', bloom_filter='ROW', block_size=65536, ttl=datetime.timedelta(days=7))
+
+    Args:
+        name(str): Name of the column family.
+        compression(str): Compression algorithm: 'NONE', 'GZ', 'LZO', 'LZ4', 'SNAPPY', 'ZSTD' or 'BZIP2'.
+        data_block_encoding(str): Data block encoding: 'NONE', 'PREFIX', 'DIFF', 'FAST_DIFF' or 'ROW_INDEX_V1'.
+        bloom_filter(str): Bloom filter type: 'NONE', 'ROW' or 'ROWCOL'.
+        block_size(int): Block size in bytes.
+        ttl(int|datetime.timedelta): Time to live of the cells in seconds, a positive integer number of seconds.
+        max_versions(int): Maximum number of versions of a cell.
+
+    .. versionadded:: 1.6
+    """
+    def __init__(self, name, compression=None, data_block_encoding=None, bloom_filter=None, block_size=None, ttl=None, max_versions=None):
+        for value, valid_values, parameter_name in ((compression, _COMPRESSIONS, 'compression'), (data_block_encoding, _DATA_BLOCK_ENCODINGS, 'data_block_encoding'),
+                                                    (bloom_filter, _BLOOM_FILTERS, 'bloom_filter')):
+            if value is not None and str(value).upper() not in valid_values:
+                raise ValueError("Invalid " + parameter_name + " value. Valid values are " + ', '.join(valid_values) + ".")
+        for value, parameter_name in ((block_size, 'block_size'), (max_versions, 'max_versions')):
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+                raise ValueError("Invalid " + parameter_name + " value. Value must be at least one.")
+        if ttl is not None:
+            # HBase stores the TTL as integer number of seconds
+            seconds = ttl.total_seconds() if isinstance(ttl, datetime.timedelta) else ttl
+            if not isinstance(seconds, (int, float)) or isinstance(seconds, bool) or seconds != int(seconds) or seconds < 1:
+                raise ValueError("Invalid ttl value. Value must be a positive integer number of seconds.")
+            ttl = int(seconds)
+        self.name = name
+        self.compression = compression
+        self.data_block_encoding = data_block_encoding
+        self.bloom_filter = bloom_filter
+        self.block_size = block_size
+        self.ttl = ttl
+        self.max_versions = max_versions
+
+    def _descriptor(self):
+        settings = [('NAME', _ruby_string(self.name))]
+        if self.compression is not None:
+            settings.append(('COMPRESSION', _ruby_string(self.compression.upper())))
+        if self.data_block_encoding is not None:
+            settings.append(('DATA_BLOCK_ENCODING', _ruby_string(self.data_block_encoding.upper())))
+        if self.bloom_filter is not None:
+            settings.append(('BLOOMFILTER', _ruby_string(self.bloom_filter.upper())))
+        if self.block_size is not None:
+            settings.append(('BLOCKSIZE', _ruby_string(self.block_size)))
+        if self.ttl is not None:
+            settings.append(('TTL', str(self.ttl)))
+        if self.max_versions is not None:
+            settings.append(('VERSIONS', str(self.max_versions)))
+        return '{' + ', '.join(key + ' => ' + value for key, value in settings) + '}'
+
+
+def _column_families(families):
+    if isinstance(families, (str, ColumnFamily)):
+        families = [families]
+    families = [ColumnFamily(f) if isinstance(f, str) else f for f in families]
+    if not families:
+        raise ValueError("At least one column family is required.")
+    return families
+
+
+def _table_attributes(split_points=None, durability=None):
+    # table attributes as hash of the HBase shell, an empty string if no attribute is set
+    attributes = []
+    if split_points is not None:
+        points = _read_split_points(split_points)
+        if points:
+            attributes.append('SPLITS => [' + ', '.join(_ruby_string(point) for point in points) + ']')
+    if durability is not None:
+        if str(durability).upper() not in _DURABILITIES:
+            raise ValueError("Invalid durability value. Valid values are " + ', '.join(_DURABILITIES) + ".")
+        attributes.append('DURABILITY => ' + _ruby_string(str(durability).upper()))
+    return '{' + ', '.join(attributes) + '}' if attributes else ''
+
+
+def _run_hbase_shell(commands, connection, hbase_shell):
+    # Runs the commands with the HBase shell in non interactive mode, the shell fails on the first failing command.
+    if hbase_shell is None:
+        hbase_home = os.environ.get('HBASE_HOME')
+        hbase_shell = os.path.join(hbase_home, 'bin', 'hbase') if hbase_home else 'hbase'
+    env = dict(os.environ)
+    conf_dir = None
+    hbaseSiteXmlFile = _hbase_site_xml_file(connection)
+    if len(hbaseSiteXmlFile) > 2:
+        if not os.path.exists(hbaseSiteXmlFile):
+            raise AssertionError("The configuration file " + hbaseSiteXmlFile + " doesn't exists'")
+        # the shell reads the hbase-site.xml file of the configuration directory
+        conf_dir = tempfile.mkdtemp()
+        shutil.copyfile(hbaseSiteXmlFile, os.path.join(conf_dir, 'hbase-site.xml'))
+        env['HBASE_CONF_DIR'] = conf_dir
+    script = '\n'.join(commands) + '\nexit\n'
+    try:
+        result = subprocess.run([hbase_shell, 'shell', '-n'], input=script, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                universal_newlines=True, env=env)
+    finally:
+        if conf_dir is not None:
+            shutil.rmtree(conf_dir, ignore_errors=True)
+    if result.returncode != 0:
+        raise RuntimeError("The HBase shell failed with exit code " + str(result.returncode) + ":\n" + result.stdout)
+    return result.stdout
+
+
+def compute_split_points(sample, regions):
+    """Computes the split points of a table from a sample of the expected row keys.
+
+    The split points divide the sorted sample into ``regions`` parts with the same number of keys.
+
+    Args:
+        sample(list|str): The sampled row keys as list or as name of a file with one row key per line, for example written by :py:class:`HBaseRowKeySample`.
+        regions(int): The number of regions of the table.
+
+    Returns:
+        list: The ``regions - 1`` split points, fewer if the sample has fewer distinct keys.
+
+    .. versionadded:: 1.6
+    """
+    if not isinstance(regions, int) or regions < 1:
+        raise ValueError("Invalid regions value. Value must be at least one.")
+    keys = _read_split_points(sample)
+    points = [keys[i * len(keys) // regions] for i in range(1, regions)] if keys else []
+    return sorted(set(points))
+
+
+def create_table(table_name, families, split_points=None, connection=None, hbase_shell=None, durability=None):
+    """Creates a table with the HBase shell.
+
+    Pre-split tables with split points, for example computed with :py:func:`compute_split_points` from a sample of the expected row keys,
+    so that the first writes are distributed over the region servers.
+
+    Example, creates a table with 16 regions::
+
+        split_points = hbase.compute_split_points('/tmp/row_keys.txt', 16)
+        hbase.create_table('events', [hbase.ColumnFamily('cf', compression='SNAPPY', bloom_filter='ROW')], split_points=split_points)
+
+    Args:
+        table_name(str): Name of the table.
+        families(list): The column families as :py:class:`ColumnFamily` or names.
+        split_points(list|str): Optional split points as list of row keys or as name of a file with one row key per line.
+        connection(dict|str): Specify the connection to HBASE either with a filename of a HBase configuration file or as string in format "HOST:PORT" or as dict containing the properties 'host' and 'port'. If not specified the environment variables ``HADOOP_HOST_PORT`` or ``HBASE_SITE_XML`` are used, or the configuration of the HBase shell.
+        hbase_shell(str): Path of the ``hbase`` command. Defaults to ``$HBASE_HOME/bin/hbase`` or ``hbase``.
+        durability(str): Optional durability of the mutations of the table: 'USE_DEFAULT', 'SKIP_WAL', 'ASYNC_WAL', 'SYNC_WAL' or 'FSYNC_WAL'. See :py:func:`alter_table`.
+
+    Returns:
+        str: The output of the HBase shell.
+
+    .. versionadded:: 1.6
+    """
+    command = 'create ' + _ruby_string(table_name) + ', ' + ', '.join(f._descriptor() for f in _column_families(families))
+    attributes = _table_attributes(split_points, durability)
+    if attributes:
+        command += ', ' + attributes
+    return _run_hbase_shell([command], connection, hbase_shell)
+
+
+def alter_table(table_name, families=None, connection=None, hbase_shell=None, durability=None):
+    """Adds or changes column families or the durability of a table with the HBase shell.
+
+    The durability of a table applies to all mutations of the table, including the mutations of :py:class:`HBasePut`:
+    'SKIP_WAL' does not write the mutations to the write ahead log, 'ASYNC_WAL' writes them asynchronously,
+    'SYNC_WAL' and 'FSYNC_WAL' write them before the mutation returns. Mutations that are not in the write ahead log
+    are lost when a region server fails, use 'SKIP_WAL' or 'ASYNC_WAL' only for tables with data that can be rebuilt,
+    for example caches and rollups.
+
+    Example, skips the write ahead log for a rollup table::
+
+        hbase.alter_table('rollups', durability='SKIP_WAL')
+
+    Args:
+        table_name(str): Name of the table.
+        families(list): The column families as :py:class:`ColumnFamily` or names.
+        connection(dict|str): Specify the connection to HBASE, see :py:func:`create_table`.
+        hbase_shell(str): Path of the ``hbase`` command. Defaults to ``$HBASE_HOME/bin/hbase`` or ``hbase``.
+        durability(str): Durability of the mutations of the table: 'USE_DEFAULT', 'SKIP_WAL', 'ASYNC_WAL', 'SYNC_WAL' or 'FSYNC_WAL'.
+
+    Returns:
+        str: The output of the HBase shell.
+
+    .. versionadded:: 1.6
+    """
+    specs = [f._descriptor() for f in _column_families(families)] if families is not None else []
+    attributes = _table_attributes(durability=durability)
+    if attributes:
+        specs.append(attributes)
+    if not specs:
+        raise ValueError("Either families or durability is required.")
+    command = 'alter ' + _ruby_string(table_name) + ', ' + ', '.join(specs)
+    return _run_hbase_shell([command], connection, hbase_shell)
+
+
+# Filter expressions, evaluated by SPL operators on the output of the HBase operators
+_COMPARE_OPS = {'=': '==', '!=': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+_NEGATED_COMPARE_OPS = {'=': '!=', '!=': '=', '<': '>=', '<=': '>', '>': '<=', '>=': '<'}
+
+def _check_posix_regex(regex):
+    # The SPL function regexMatch evaluates POSIX extended regular expressions. Syntax errors are found by compiling the expression
+    # with re, the constructs of Python regular expressions that POSIX does not have, or that have another meaning there, are rejected.
+    try:
+        with warnings.catch_warnings():
+            # POSIX character classes like [[:digit:]] are nested sets for re
+            warnings.simplefilter('ignore', FutureWarning)
+            re.compile(regex)
+    except re.error as e:
+        raise ValueError("Invalid regular expression " + regex + ": " + str(e))
+    i = 0
+    while i < len(regex):
+        c = regex[i]
+        if c == '\\':
+            if regex[i + 1:i + 2].isalnum():
+                raise ValueError("Invalid regular expression " + regex + ": the escape sequence \\" + regex[i + 1] + " is not a POSIX extended regular expression.")
+            i += 2
+        elif c == '[':
+            # bracket expression, a backslash is an ordinary character in POSIX
+            j = i + 1
+            if regex[j:j + 1] == '^':
+                j += 1
+            if regex[j:j + 1] == ']':
+                j += 1
+            while j < len(regex) and regex[j] != ']':
+                if regex[j] == '[' and regex[j + 1:j + 2] in (':', '.', '='):
+                    end = regex.find(regex[j + 1] + ']', j + 2)
+                    j = end + 2 if end >= 0 else len(regex)
+                    continue
+                if regex[j] == '\\':
+                    raise ValueError("Invalid regular expression " + regex + ": a backslash in a bracket expression is an ordinary character in a POSIX extended regular expression.")
+                j += 1
+            i = j + 1
+        elif c == '(' and regex[i + 1:i + 2] == '?':
+            raise ValueError("Invalid regular expression " + regex + ": the group (?...) is not a POSIX extended regular expression.")
+        elif c in '*+?}' and regex[i + 1:i + 2] in ('?', '+'):
+            raise ValueError("Invalid regular expression " + regex + ": lazy and possessive quantifiers are not POSIX extended regular expressions.")
+        else:
+            i += 1
+
+
+def _hbase_string(value):
+    # string literal of the HBase filter language, quotes are escaped by doubling them
+    return "'" + value.replace("'", "''") + "'"
+
+
+class _HBaseFilter(object):
+    """
+        Base class of the filter expressions. Filters are combined with the operators ``&`` (and), ``|`` (or)
+        and negated with ``~``. The string representation uses the notation of the HBase filter language, it is for display only
+        and is never sent to HBase.
+
+        The operators of the toolkit have no parameter for server side filters, the expressions are evaluated on the client side
+        by a Filter operator on the output of the HBase operator, after the cells have been transferred from the region servers.
+        Only a PrefixFilter that is combined with ``&`` in the clientFilter of :py:class:`HBaseScan` is executed by the region servers,
+        as the rowPrefix parameter of the scan.
+    """
+    def __and__(self, other):
+        return _BooleanFilter('AND', self, other)
+
+    def __or__(self, other):
+        return _BooleanFilter('OR', self, other)
+
+    def __invert__(self):
+        raise ValueError(str(self) + " cannot be negated.")
+
+    def __repr__(self):
+        return self._hbase_filter()
+
+    def _conjuncts(self):
+        return [self]
+
+    def _targets(self):
+        return []
+
+    def _spl_filter(self, attrs):
+        raise ValueError(str(self) + " can be combined with other filters with & only.")
+
+
+class _CompareFilter(_HBaseFilter):
+    # compares the row, family, qualifier or value of a cell with the operand of the comparator
+    def __init__(self, target, op, comparator, operand, name=None):
+        if op not in _COMPARE_OPS:
+            raise ValueError("Invalid compare operator " + str(op) + ". Valid operators are: " + ', '.join(_COMPARE_OPS))
+        if comparator != 'binary' and op not in ('=', '!='):
+            raise ValueError("Invalid compare operator " + op + " for " + comparator + " comparator. Valid operators are: =, !=")
+        if not isinstance(operand, str):
+            raise TypeError(operand)
+        if comparator == 'regexstring':
+            _check_posix_regex(operand)
+        self._target = target
+        self._op = op
+        self._comparator = comparator
+        self._operand = operand
+        self._name = name
+
+    def __invert__(self):
+        return _CompareFilter(self._target, _NEGATED_COMPARE_OPS[self._op], self._comparator, self._operand)
+
+    def _targets(self):
+        return [self._target]
+
+    def _hbase_filter(self):
+        if self._name is not None:
+            return self._name + '(' + _hbase_string(self._operand) + ')'
+        return self._target.capitalize() + 'Filter(' + self._op + ', ' + _hbase_string(self._comparator + ':' + self._operand) + ')'
+
+    def _spl_filter(self, attrs):
+        attr = attrs[self._target]
+        if attr is None:
+            raise ValueError(str(self) + " cannot be applied to the output of the operator.")
+        operand = json.dumps(self._operand, ensure_ascii=False)
+        if self._comparator == 'regexstring':
+            return 'size(regexMatch(' + attr + ', ' + operand + ')) ' + ('>' if self._op == '=' else '==') + ' 0'
+        if self._comparator == 'binaryprefix':
+            return 'findFirst(' + attr + ', ' + operand + ', 0) ' + ('==' if self._op == '=' else '!=') + ' 0'
+        return attr + ' ' + _COMPARE_OPS[self._op] + ' ' + operand
+
+
+class _BooleanFilter(_HBaseFilter):
+    def __init__(self, op, left, right):
+        for f in (left, right):
+            if not isinstance(f, _HBaseFilter):
+                raise TypeError(f)
+        self._op = op
+        self._left = left
+        self._right = right
+
+    def __invert__(self):
+        # De Morgan, the HBase filter language has no negation
+        return _BooleanFilter('OR' if self._op == 'AND' else 'AND', ~self._left, ~self._right)
+
+    def _hbase_filter(self):
+        return '(' + self._left._hbase_filter() + ' ' + self._op + ' ' + self._right._hbase_filter() + ')'
+
+    def _conjuncts(self):
+        if self._op == 'AND':
+            return self._left._conjuncts() + self._right._conjuncts()
+        return [self]
+
+    def _targets(self):
+        return self._left._targets() + self._right._targets()
+
+    def _spl_filter(self, attrs):
+        return '(' + self._left._spl_filter(attrs) + (' && ' if self._op == 'AND' else ' || ') + self._right._spl_filter(attrs) + ')'
+
+
+def ValueFilter(op, value):
+    """Filter on the value of the cells.
+
+    Example, returns only cells with a value greater or equal than '100'::
+
+        hbase.ValueFilter('>=', '100')
+
+    Args:
+        op(str): Compare operator, one of ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``. Values are compared as byte strings.
+        value(str): The value to compare with.
+
+    .. versionadded:: 1.6
+    """
+    return _CompareFilter('value', op, 'binary', value)
+
+def RowRegexFilter(regex):
+    """Filter on the row key of the cells with a regular expression.
+
+    Args:
+        regex(str): POSIX extended regular expression as evaluated by the SPL function regexMatch, rows with a matching row key are returned.
+
+    .. versionadded:: 1.6
+    """
+    return _CompareFilter('row', '=', 'regexstring', regex)
+
+def FamilyRegexFilter(regex):
+    """Filter on the column family of the cells with a regular expression.
+
+    Args:
+        regex(str): POSIX extended regular expression as evaluated by the SPL function regexMatch, cells of matching column families are returned.
+
+    .. versionadded:: 1.6
+    """
+    return _CompareFilter('family', '=', 'regexstring', regex)
+
+def QualifierRegexFilter(regex):
+    """Filter on the column qualifier of the cells with a regular expression.
+
+    Args:
+        regex(str): POSIX extended regular expression as evaluated by the SPL function regexMatch, cells with a matching column qualifier are returned.
+
+    .. versionadded:: 1.6
+    """
+    return _CompareFilter('qualifier', '=', 'regexstring', regex)
+
+def ColumnPrefixFilter(prefix):
+    """Filter on the column qualifier of the cells with a prefix.
+
+    Args:
+        prefix(str): Cells with a column qualifier starting with this prefix are returned.
+
+    .. versionadded:: 1.6
+    """
+    return _CompareFilter('qualifier', '=', 'binaryprefix', prefix, name='ColumnPrefixFilter')
+
+def PrefixFilter(prefix):
+    """Filter on the row key with a prefix.
+
+    Args:
+        prefix(str): Rows with a row key starting with this prefix are returned.
+
+    .. versionadded:: 1.6
+    """
+    return _CompareFilter('row', '=', 'binaryprefix', prefix, name='PrefixFilter')
+
+
+class KeyOnlyFilter(_HBaseFilter):
+    """Returns only the keys of the cells, the values are empty.
+
+    This filter can be combined with other filters with ``&`` only.
+
+    .. versionadded:: 1.6
+    """
+    def _hbase_filter(self):
+        return 'KeyOnlyFilter()'
+
+
+def _check_filter(filter_expression):
+    if not isinstance(filter_expression, _HBaseFilter):
+        raise TypeError(filter_expression)
+    return filter_expression._conjuncts()
+
+
+def _push_down_row_prefix(conjuncts):
+    # A PrefixFilter is executed by the region servers with the rowPrefix parameter of the HBASEScan operator
+    for f in conjuncts:
+        if isinstance(f, _CompareFilter) and f._name == 'PrefixFilter':
+            return f._operand, [c for c in conjuncts if c is not f]
+    return None, conjuncts
+
+
+def _schema_attr_names(schema):
+    schema = streamsx.topology.schema._normalize(schema)
+    if not isinstance(schema, StreamSchema):
+        return []
+    return [attr_name for attr_type, attr_name in schema._types]
+
+
+def _apply_filter(stream, conjuncts, attrs):
+    # Applies the filter expression to the output stream of an HBase operator on the client side.
+    # Row, family, qualifier and value predicates are evaluated by a Filter operator that is fused with the HBase operator,
+    # KeyOnlyFilter clears the value attribute.
+    attr_names = _schema_attr_names(stream.oport.schema)
+    for f in conjuncts:
+        for target in f._targets():
+            if attrs[target] is not None and attrs[target] not in attr_names:
+                raise ValueError(str(f) + " requires the attribute " + attrs[target] + " in the output schema.")
+    predicates = []
+    key_only = False
+    for f in conjuncts:
+        if isinstance(f, KeyOnlyFilter):
+            if attrs['value'] is None or attrs['value'] not in attr_names:
+                raise ValueError(str(f) + " cannot be applied to the output of the operator.")
+            key_only = True
+        else:
+            predicates.append(f._spl_filter(attrs))
+
+    schema = stream.oport.schema
+    if predicates:
+        _op = streamsx.spl.op.Map('spl.relational::Filter', stream, schema=schema, params={'filter': streamsx.spl.op.Expression.expression(' && '.join(predicates))}, name='HBaseFilter')
+        _op.colocate(stream)
+        stream = _op.stream
+    if key_only:
+        _op = streamsx.spl.op.Map('spl.relational::Functor', stream, schema=schema, name='HBaseKeyOnly')
+        _op.colocate(stream)
+        setattr(_op, attrs['value'], _op.output('""'))
+        stream = _op.stream
+    return stream
+
+
+def _apply_sampling(stream, sample_rate, seed):
+    # Bernoulli sample of the rows selected by the hash of the row key on the client side, all cells of a sampled row are submitted.
+    # The rows are sampled evenly from all regions, the weight of a sampled row is the inverse of the sample rate.
+    threshold = int(sample_rate * 1000000)
+    if 'row' not in _schema_attr_names(stream.oport.schema):
+        raise ValueError("A sampling scan requires an output schema with the attribute row.")
+    schema = stream.oport.schema.extend(StreamSchema('tuple<float64 samplingWeight>'))
+    predicate = '((uint64)hashCode(row + ' + json.dumps(seed, ensure_ascii=False) + ')) % 1000000ul < ' + str(threshold) + 'ul'
+    _op = streamsx.spl.op.Map('spl.relational::Functor', stream, schema=schema, params={'filter': streamsx.spl.op.Expression.expression(predicate)}, name='HBaseSample')
+    _op.colocate(stream)
+    _op.samplingWeight = _op.output(streamsx.spl.types.float64(1000000.0 / threshold))
+    return _op.stream
+
+
+class _RowLimit(object):
+    # Passes the cells of the first rows of a scan, or of the first rows of each row key prefix.
+    # The rows of a scan are sorted by the row key, the rows of a prefix are submitted one after the other.
+    def __init__(self, limit, prefix_length):
+        self.limit = limit
+        self.prefix_length = prefix_length
+        self._prefix = None
+        self._row = None
+        self._rows = 0
+
+    def __call__(self, tuple_):
+        row = tuple_['row']
+        if row != self._row:
+            self._row = row
+            prefix = row[:self.prefix_length] if self.prefix_length else ''
+            if prefix != self._prefix:
+                self._prefix = prefix
+                self._rows = 0
+            self._rows += 1
+        return self._rows <= self.limit
+
+
+def _check_rate_param(rate, parameter_name):
+    # A rate is a positive number, a submission parameter or a callable that returns the current rate at runtime.
+    if rate is None or callable(rate):
+        return rate
+    if isinstance(rate, bool) or not isinstance(rate, (int, float)) or rate <= 0:
+        raise ValueError("Invalid " + parameter_name + " value. Value must be a positive number, a submission parameter or a callable.")
+    return rate
+
+
+def _tuple_bytes(value):
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_tuple_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return sum(_tuple_bytes(v) for v in value)
+    return 8
+
+
+class _RateLimiter(object):
+    # Token buckets for cells, bytes and RPCs per second, a bucket holds the tokens of one second.
+    # The tuple is delayed until all buckets have enough tokens, the delay throttles the fused HBase operator.
+    # Rates that are submission parameters or callables are read again every second.
+    # The rates are shared by the channels of a parallel region, every channel gets its part of the rates.
+    # A tuple counts as one cell, or as the number of cells in the count attribute, for example a row of a scan in row mode.
+    def __init__(self, cells_per_second, bytes_per_second, rpcs_per_second, cells_per_rpc, channels=1, count_attr=None, clock=time.monotonic, sleep=time.sleep):
+        self.cells_per_second = cells_per_second
+        self.bytes_per_second = bytes_per_second
+        self.rpcs_per_second = rpcs_per_second
+        self.cells_per_rpc = cells_per_rpc
+        self.channels = channels
+        self.count_attr = count_attr
+        self.clock = clock
+        self.sleep = sleep
+
+    def __enter__(self):
+        self._rates = None
+        self._refreshed = None
+        self._tokens = [None, None, None]
+        self._last = self.clock()
+        self._create_metrics()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __getstate__(self):
+        # metrics are not saved in a checkpoint
+        state = self.__dict__.copy()
+        state.pop('_throttled_metric', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_tokens' in state:
+            self._create_metrics()
+
+    def _create_metrics(self):
+        self._throttled_metric = None
+        if streamsx.ec.is_active():
+            self._throttled_metric = streamsx.ec.CustomMetric(self, name='throttledTimeMillis', kind='Counter',
+                description='Time in milliseconds that the HBase operator was throttled by the rate limits.')
+
+    def _current_rates(self, now):
+        if self._refreshed is None or now - self._refreshed >= 1.0:
+            self._refreshed = now
+            rates = []
+            for rate in (self.cells_per_second, self.bytes_per_second, self.rpcs_per_second):
+                if callable(rate):
+                    rate = rate()
+                rates.append(float(rate) / self.channels if rate is not None and float(rate) > 0 else None)
+            self._rates = rates
+        return self._rates
+
+    def __call__(self, tuple_):
+        now = self.clock()
+        rates = self._current_rates(now)
+        cells = float(tuple_[self.count_attr]) if self.count_attr is not None else 1.0
+        costs = (cells, _tuple_bytes(tuple_) if rates[1] is not None else 0.0, 1.0 / self.cells_per_rpc)
+        elapsed = now - self._last
+        self._last = now
+        delay = 0.0
+        for i, rate in enumerate(rates):
+            if rate is None:
+                self._tokens[i] = None
+                continue
+            tokens = rate if self._tokens[i] is None else min(rate, self._tokens[i] + elapsed * rate)
+            tokens -= costs[i]
+            if tokens < 0:
+                delay = max(delay, -tokens / rate)
+            self._tokens[i] = tokens
+        if delay > 0:
+            self.sleep(delay)
+            self._last = self.clock()
+            # the tokens that were missing are refilled during the delay
+            for i, rate in enumerate(rates):
+                if rate is not None:
+                    self._tokens[i] = min(rate, self._tokens[i] + delay * rate)
+            if self._throttled_metric is not None:
+                self._throttled_metric += int(delay * 1000)
+        return True
+
+
+def _apply_rate_limit(stream, cells_per_second, bytes_per_second, rpcs_per_second, cells_per_rpc=1, channels=1, count_attr=None):
+    # Returns the stream throttled by a filter that is fused with the producing operator.
+    if cells_per_second is None and bytes_per_second is None and rpcs_per_second is None:
+        return stream
+    limiter = _RateLimiter(cells_per_second, bytes_per_second, rpcs_per_second, cells_per_rpc, channels, count_attr)
+    return stream.filter(limiter, name='HBaseRateLimit')
+
+
+class _PendingRequests(object):
+    # The pending requests of a fused HBase operator, the results are paired with the requests by the row key.
+    # The requests of the same row key are paired in order. Requests without a result, for example failed
+    # requests without an output tuple, are removed when the number of pending requests exceeds the limit.
+    _LIMIT = 100000
+
+    def __init__(self):
+        self._rows = collections.OrderedDict()
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def add(self, row, value):
+        with self._lock:
+            self._rows.setdefault(row, collections.deque()).append(value)
+            self._count += 1
+            while self._count > self._LIMIT:
+                oldest_row, values = self._rows.popitem(last=False)
+                self._count -= len(values)
+
+    def pop(self, row):
+        with self._lock:
+            values = self._rows.get(row)
+            if not values:
+                return None
+            self._count -= 1
+            value = values.popleft()
+            if not values:
+                del self._rows[row]
+            return value
+
+    def __len__(self):
+        return self._count
+
+
+# pending requests of the fused HBase operators by probe id and channel, shared by the request and response probes.
+# The map is local to the processing element, the channel separates the channels of a parallel region that are fused.
+_pending_requests = dict()
+
+
+def _get_pending_requests(probe, probe_id):
+    channel = streamsx.ec.channel(probe) if streamsx.ec.is_active() else -1
+    return _pending_requests.setdefault((probe_id, channel), _PendingRequests())
+
+
+class _HBaseMetrics(object):
+    # Probe that is fused with an HBase operator and publishes its I/O as custom metrics.
+    # The request probe is on the input port, the response probe on the output port of the operator.
+    # The latency of a request is the time between the probes, the result is paired with the request by the row attribute.
+    _WINDOW = 1024
+
+    def __init__(self, probe_id, side, cells_per_rpc=1, success_attr=None, latency=False, row_attr=None):
+        self.probe_id = probe_id
+        self.side = side
+        self.cells_per_rpc = cells_per_rpc
+        self.success_attr = success_attr
+        self.latency = latency
+        self.row_attr = row_attr
+
+    def __enter__(self):
+        self._tuples = 0
+        self._create_metrics()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __getstate__(self):
+        # metrics are not saved in a checkpoint
+        state = self.__dict__.copy()
+        state.pop('_metrics', None)
+        state.pop('_start_times', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_tuples' in state:
+            self._create_metrics()
+
+    def _create_metrics(self):
+        self._metrics = None
+        self._latencies = collections.deque(maxlen=self._WINDOW)
+        if self.latency:
+            self._start_times = _get_pending_requests(self, self.probe_id)
+        if not streamsx.ec.is_active():
+            return
+        if self.side == 'request':
+            names = [('nRequests', 'Counter', 'Number of requests.'),
+                     ('nRPCs', 'Counter', 'Estimated number of RPCs, batchSize requests are sent with one RPC.'),
+                     ('batchSize', 'Gauge', 'Number of requests that are sent with one RPC.'),
+                     ('bytesOut', 'Counter', 'Size in bytes of the requests.')]
+        else:
+            names = [('nResults', 'Counter', 'Number of results.'),
+                     ('bytesIn', 'Counter', 'Size in bytes of the results.')]
+            if self.success_attr is not None:
+                names.append(('nFailures', 'Counter', 'Number of failed requests.'))
+            if self.latency:
+                names += [('latencyP50Micros', 'Gauge', 'Median request latency in microseconds.'),
+                          ('latencyP95Micros', 'Gauge', '95th percentile of the request latency in microseconds.'),
+                          ('latencyP99Micros', 'Gauge', '99th percentile of the request latency in microseconds.')]
+        self._metrics = dict((name, streamsx.ec.CustomMetric(self, name=name, kind=kind, description=description)) for name, kind, description in names)
+        if 'batchSize' in self._metrics:
+            self._metrics['batchSize'].value = self.cells_per_rpc
+
+    def __call__(self, tuple_):
+        now = time.monotonic()
+        self._tuples += 1
+        if self.side == 'request':
+            if self.latency:
+                self._start_times.add(tuple_[self.row_attr], now)
+            if self._metrics is not None:
+                self._metrics['nRequests'] += 1
+                self._metrics['bytesOut'] += _tuple_bytes(tuple_)
+                if self._tuples % self.cells_per_rpc == 0:
+                    self._metrics['nRPCs'] += 1
+            return True
+
+        if self.latency:
+            start = self._start_times.pop(tuple_[self.row_attr])
+            if start is not None:
+                self._latencies.append(now - start)
+        if self._metrics is not None:
+            self._metrics['nResults'] += 1
+            self._metrics['bytesIn'] += _tuple_bytes(tuple_)
+            if self.success_attr is not None and not tuple_.get(self.success_attr, True):
+                self._metrics['nFailures'] += 1
+            if self.latency and self._latencies and self._tuples % 100 == 0:
+                latencies = sorted(self._latencies)
+                for name, quantile in (('latencyP50Micros', 0.5), ('latencyP95Micros', 0.95), ('latencyP99Micros', 0.99)):
+                    self._metrics[name].value = int(latencies[int(quantile * (len(latencies) - 1))] * 1000000)
+        return True
+
+
+def _time_unix_nano():
+    # time.time_ns requires Python 3.7
+    return int(time.time() * 1e9)
+
+
+def _parse_traceparent(value):
+    # W3C trace context: version-traceid-parentid-flags
+    if not isinstance(value, str):
+        return None
+    match = re.match(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$', value.strip())
+    if match is None:
+        return None
+    return match.group(1), match.group(2), int(match.group(3), 16) & 1 == 1
+
+
+class _HBaseTracer(object):
+    # Sampled tracing of the requests of a fused HBase operator, the spans are appended to a file as JSON lines
+    # in the OpenTelemetry span format. The request tracer is on the input port and starts the span,
+    # the response tracer on the output port ends the span and sets the trace context attribute of the result.
+    # A span covers the time between the request and the result, including the wait of a mutation in the batch.
+    # The result is paired with the span of the request by the row attribute.
+    def __init__(self, probe_id, side, operation, table_name, row_attr, sample_rate=None, trace_attr=None, trace_file=None, table_attr=None, count_attr=None, success_attr=None):
+        self.probe_id = probe_id
+        self.row_attr = row_attr
+        self.side = side
+        self.operation = operation
+        self.table_name = table_name
+        self.sample_rate = sample_rate
+        self.trace_attr = trace_attr
+        self.trace_file = trace_file
+        self.table_attr = table_attr
+        self.count_attr = count_attr
+        self.success_attr = success_attr
+
+    def __enter__(self):
+        self._open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_pending', None)
+        state.pop('_file', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if state.get('_opened'):
+            self._open()
+
+    def _open(self):
+        self._opened = True
+        self._pending = _get_pending_requests(self, self.probe_id)
+        self._file = None
+        if self.side == 'response':
+            directory = os.path.dirname(self.trace_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.trace_file, 'a', encoding='utf-8')
+
+    def __call__(self, tuple_):
+        if self.side == 'request':
+            parent = _parse_traceparent(tuple_.get(self.trace_attr)) if self.trace_attr is not None else None
+            sampled = parent[2] if parent is not None else random.random() < self.sample_rate
+            if sampled:
+                table = tuple_.get(self.table_attr) if self.table_attr is not None else self.table_name
+                trace_id = parent[0] if parent is not None else os.urandom(16).hex()
+                self._pending.add(tuple_[self.row_attr], (trace_id, parent[1] if parent is not None else None, table, _time_unix_nano()))
+            else:
+                # the requests of a row key that are not sampled keep the order of the pending spans of the row key
+                self._pending.add(tuple_[self.row_attr], None)
+            return True
+
+        span = self._pending.pop(tuple_[self.row_attr])
+        if span is None:
+            return tuple_
+        trace_id, parent_span_id, table, start = span
+        span_id = os.urandom(8).hex()
+        result = tuple_ if isinstance(tuple_, dict) else dict()
+        row_count = result.get(self.count_attr, 1) if self.count_attr is not None else 1
+        failed = self.success_attr is not None and not result.get(self.success_attr, True)
+        record = {'traceId': trace_id, 'spanId': span_id, 'parentSpanId': parent_span_id or '',
+                  'name': 'HBase ' + self.operation + ' ' + str(table), 'kind': 'SPAN_KIND_CLIENT',
+                  'startTimeUnixNano': start, 'endTimeUnixNano': _time_unix_nano(),
+                  'attributes': {'db.system': 'hbase', 'db.operation': self.operation, 'db.name': str(table), 'hbase.row_count': row_count},
+                  'status': {'code': 'STATUS_CODE_ERROR' if failed else 'STATUS_CODE_OK'}}
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        if self.trace_attr is not None and self.trace_attr in result:
+            result[self.trace_attr] = '00-' + trace_id + '-' + span_id + '-01'
+        return tuple_
+
+
+def _check_tracing(sample_rate, trace_file, row_attr, schema):
+    if sample_rate is None:
+        return None
+    if not isinstance(sample_rate, (int, float)) or sample_rate < 0 or sample_rate > 1:
+        raise ValueError("Invalid traceSampleRate value. Value must be between 0 and 1.")
+    if trace_file is None:
+        raise ValueError("The parameter traceFile is required with traceSampleRate.")
+    if row_attr not in _schema_attr_names(schema):
+        raise ValueError("Tracing requires the attribute " + row_attr + " in the output schema.")
+    return float(sample_rate)
+
+
+# warm-up state of the fused HBase operators by warm-up id and channel, shared by the gate and the response filter
+_warmups = dict()
+
+# attribute that tags the warm-up requests and their results
+_WARMUP_ATTR = 'hbaseWarmupRequest'
+
+
+def _read_warmup_rows(warmup_rows):
+    # the row keys of the warm-up requests as list of (table, row) pairs, table None is the table of the operator
+    if isinstance(warmup_rows, dict):
+        return [(table, row) for table in sorted(warmup_rows) for row in _read_split_points(warmup_rows[table])]
+    return [(None, row) for row in _read_split_points(warmup_rows)]
+
+
+class _WarmupRequests(object):
+    # Source of the warm-up requests, one tagged request for each region start key
+    def __init__(self, requests, row_attr, table_attr):
+        self.requests = requests
+        self.row_attr = row_attr
+        self.table_attr = table_attr
+
+    def __iter__(self):
+        for table, row in self.requests:
+            request = {self.row_attr: row, _WARMUP_ATTR: True}
+            if table is not None:
+                request[self.table_attr] = table
+            yield request
+
+
+class _Warmup(object):
+    # The gate on the input port holds the tuples until the results of the warm-up requests have arrived,
+    # the region locations are in the cache of the operator then. The gate tags the tuples as no warm-up requests.
+    # The response map drops all results of the warm-up requests, also the late results after the timeout,
+    # removes the tag from the other results and reports the warm-up time.
+    def __init__(self, warmup_id, side, requests, timeout):
+        self.warmup_id = warmup_id
+        self.side = side
+        self.requests = requests
+        self.timeout = timeout
+
+    def __enter__(self):
+        channel = streamsx.ec.channel(self) if streamsx.ec.is_active() else -1
+        self._state = _warmups.setdefault((self.warmup_id, channel), {'done': threading.Event(), 'results': 0, 'start': time.time()})
+        self._metric = None
+        if self.side == 'response' and streamsx.ec.is_active():
+            self._metric = streamsx.ec.CustomMetric(self, name='warmupTimeMillis', kind='Gauge',
+                description='Time in milliseconds to prefetch the region locations at startup.')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_state', None)
+        state.pop('_metric', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __call__(self, tuple_):
+        state = self._state
+        if self.side == 'gate':
+            if not state['done'].is_set() and not state['done'].wait(self.timeout):
+                logging.getLogger(__name__).warning("Warm-up of the region locations expired after " + str(self.timeout) + " seconds, " +
+                    str(state['results']) + " of " + str(self.requests) + " regions prefetched.")
+                state['done'].set()
+            tuple_[_WARMUP_ATTR] = False
+            return tuple_
+
+        if tuple_.pop(_WARMUP_ATTR):
+            state['results'] += 1
+            if state['results'] == self.requests:
+                warmup_time = time.time() - state['start']
+                logging.getLogger(__name__).info("Region locations of " + str(self.requests) + " regions prefetched in " + '%.3f' % warmup_time + " seconds.")
+                if self._metric is not None:
+                    self._metric.value = int(warmup_time * 1000)
+                state['done'].set()
+            return None
+        return tuple_
+
+
+class _SpaceSaving(object):
+    # Space-Saving heavy hitters summary (Metwally et al.), the count of a key is overestimated by at most the minimum count.
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = dict()
+        self.total = 0
+
+    def add(self, key):
+        self.total += 1
+        if key in self.counts:
+            self.counts[key] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = 1
+        else:
+            # the new key replaces the key with the minimum count and inherits its count
+            min_key = min(self.counts, key=self.counts.get)
+            self.counts[key] = self.counts.pop(min_key) + 1
+
+    def top(self, k):
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+
+class _HotKeys(object):
+    # Tracks the hot row keys and row key prefixes of the requests, the summaries are reset after each interval.
+    # With report the top keys of an interval are returned as tuples, else the tuple passes (filter).
+    def __init__(self, row_attr, top_k, prefix_length, interval, report):
+        self.row_attr = row_attr
+        self.top_k = top_k
+        self.prefix_length = prefix_length
+        self.interval = interval
+        self.report = report
+
+    def __enter__(self):
+        self._reset(time.time())
+        self._create_metrics()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_metrics', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the metrics are not saved in a checkpoint, they are created again when the state is restored
+        if '_start' in state:
+            self._create_metrics()
+
+    def _create_metrics(self):
+        self._metrics = None
+        if streamsx.ec.is_active():
+            names = [('hotKeyRate', 'Requests per second of the hottest row key in the last interval.'),
+                     ('hotKeyPercent', 'Percentage of the requests of the hottest row key in the last interval.')]
+            if self.prefix_length:
+                names += [('hotPrefixRate', 'Requests per second of the hottest row key prefix in the last interval.'),
+                          ('hotPrefixPercent', 'Percentage of the requests of the hottest row key prefix in the last interval.')]
+            self._metrics = dict((name, streamsx.ec.CustomMetric(self, name=name, kind='Gauge', description=description)) for name, description in names)
+
+    def _reset(self, now):
+        self._start = now
+        # the summary keeps more keys than reported, so that the counts of the top keys are accurate
+        self._rows = _SpaceSaving(self.top_k * 10)
+        self._prefixes = _SpaceSaving(self.top_k * 10) if self.prefix_length else None
+
+    def __call__(self, tuple_):
+        row = str(tuple_[self.row_attr])
+        self._rows.add(row)
+        if self._prefixes is not None:
+            self._prefixes.add(row[:self.prefix_length])
+        now = time.time()
+        hot_keys = []
+        if now - self._start >= self.interval:
+            elapsed = now - self._start
+            for key_type, summary in (('row', self._rows), ('prefix', self._prefixes)):
+                if summary is None:
+                    continue
+                for rank, (key, count) in enumerate(summary.top(self.top_k)):
+                    hot_keys.append({'keyType': key_type, 'key': key, 'rank': rank + 1, 'count': count,
+                                     'rate': count / elapsed, 'share': float(count) / summary.total})
+                    if rank == 0 and self._metrics is not None:
+                        metric_prefix = 'hotKey' if key_type == 'row' else 'hotPrefix'
+                        self._metrics[metric_prefix + 'Rate'].value = int(count / elapsed)
+                        self._metrics[metric_prefix + 'Percent'].value = int(100 * count / summary.total)
+            self._reset(now)
+        return hot_keys if self.report else True
+
+
+def _check_hot_keys(prefix_length, interval):
+    if prefix_length is not None and (not isinstance(prefix_length, int) or prefix_length < 1):
+        raise ValueError("Invalid hotKeysPrefixLength value. Value must be at least one.")
+    return _check_duration_param(interval, 'hotKeysInterval')
+
+
+def _salt_prefix(bucket, salt_buckets):
+    return str(bucket).zfill(len(str(salt_buckets - 1)))
+
+
+def _salt(row, salt_buckets):
+    # the salt is the zero padded bucket number, the bucket is the CRC32 checksum of the row key modulo the number of buckets
+    return _salt_prefix(zlib.crc32(row.encode('utf-8')) % salt_buckets, salt_buckets) + row
+
+
+class _SaltRowKey(object):
+    def __init__(self, row_attr, salt_buckets):
+        self.row_attr = row_attr
+        self.salt_buckets = salt_buckets
+
+    def __call__(self, tuple_):
+        tuple_[self.row_attr] = _salt(tuple_[self.row_attr], self.salt_buckets)
+        return tuple_
+
+
+def _check_salt_buckets(salt_buckets):
+    if salt_buckets is not None and (not isinstance(salt_buckets, int) or salt_buckets < 2):
+        raise ValueError("Invalid saltBuckets value. Value must be at least two.")
+    return salt_buckets
+
+
+def _apply_salt(stream, row_attr, salt_buckets):
+    # Returns the stream with salted row keys, the map is fused with the HBase operator.
+    if isinstance(stream.oport.schema, CommonSchema):
+        raise ValueError("Salted row keys require a structured input schema.")
+    return stream.map(_SaltRowKey(row_attr, salt_buckets), schema=stream.oport.schema, name='HBaseSaltRowKey')
+
+
+def _strip_salt(stream, row_attr, salt_buckets):
+    # Removes the salt from the row keys of the results, results without the row attribute are not changed.
+    schema = stream.oport.schema
+    if isinstance(schema, CommonSchema) or row_attr not in [attr_name for attr_type, attr_name in schema._types]:
+        return stream
+    width = len(str(salt_buckets - 1))
+    _op = streamsx.spl.op.Map('spl.relational::Functor', stream, schema=schema, name='HBaseUnsaltRowKey')
+    _op.colocate(stream)
+    setattr(_op, row_attr, _op.output('substring(' + row_attr + ', ' + str(width) + ', length(' + row_attr + ') - ' + str(width) + ')'))
+    return _op.stream
+
+
+def _salted_key_ranges(salt_buckets, start_row, end_row, row_prefix):
+    # One key range (startRow, endRow, rowPrefix) for each salt bucket
+    key_ranges = []
+    for bucket in range(salt_buckets):
+        salt = _salt_prefix(bucket, salt_buckets)
+        if row_prefix is not None:
+            key_ranges.append((salt + start_row if start_row is not None else None,
+                               salt + end_row if end_row is not None else None, salt + row_prefix))
+        else:
+            next_salt = _salt_prefix(bucket + 1, salt_buckets) if bucket + 1 < salt_buckets else None
+            key_ranges.append((salt + (start_row or ''), salt + end_row if end_row is not None else next_salt, None))
+    return key_ranges
+
+
+# the first fused operator of each connection of a topology
+_fused_operators = weakref.WeakKeyDictionary()
+
+
+def _fuse_with_hbase_operators(topology, op, connection, auth_principal, vm_arg):
+    # Fuses the operators with the same connection, principal and JVM arguments into one processing element.
+    key = json.dumps([connection, auth_principal, vm_arg], sort_keys=True, default=str)
+    operators = _fused_operators.setdefault(topology, dict())
+    if key in operators:
+        op.colocate(operators[key])
+    else:
+        operators[key] = op.outputs[0]
+
+
+def colocate(*streams):
+    """Fuses the HBase operators that produce the streams into one processing element.
+
+    The Java operators of a processing element run in one JVM and share the Kerberos login of the JVM, the topology uses fewer processes and starts faster.
+    The operators do not share the HBase connection, each operator opens its own connection and ZooKeeper session.
+    Use this function to fuse HBase operators with different connections or principals,
+    the operators with the same connection use the ``fuseWithHBaseOperators`` option of the composites.
+    The JVM arguments (``vmArg``) of the fused operators must be the same.
+
+    Example, fuses a get and a put operator::
+
+        enriched = events.map(hbase.HBaseGet(tableName='profiles', rowAttrName='who', schema=profile_schema))
+        written = enriched.map(hbase.HBasePut(tableName='events', rowAttrName='who', valueAttrName='value'))
+        hbase.colocate(enriched, written)
+
+    Args:
+        *streams(Stream): The output streams of the HBase composites.
+
+    Returns:
+        Stream: The first stream.
+
+    .. versionadded:: 1.6
+    """
+    if len(streams) < 2:
+        raise ValueError("At least two streams are required.")
+    return streams[0].colocate(list(streams[1:]))
+
+
+# names of the Python operators of this module that publish custom metrics
+_METRICS_OPERATOR_NAMES = frozenset([
+    'HBaseRateLimit', 'HBaseHotKeys', 'HBaseWarmupGate', 'HBaseWarmupResults',
+    'HBaseMetricsRequest', 'HBaseMetricsResponse',
+    'HBaseMetricsPutRequest', 'HBaseMetricsDeleteRequest', 'HBaseMetricsIncrementRequest',
+    'HBaseMetricsPutResponse', 'HBaseMetricsDeleteResponse', 'HBaseMutateUnknown'])
+
+
+def _base_operator_name(op_name):
+    # removes the channel index of a parallel region and the suffix that makes a duplicate operator name unique
+    if op_name.endswith(']') and '[' in op_name:
+        op_name = op_name[:op_name.rindex('[')]
+    base, sep, suffix = op_name.rpartition('_')
+    if sep and suffix.isdigit():
+        return base
+    return op_name
+
+
+def operator_metrics(job, name=None):
+    """Reads the metrics of the HBase operators of a running job.
+
+    Returns the custom metrics of the operators of the ``com.ibm.streamsx.hbase`` toolkit and of the
+    probes that are added with the ``metrics`` option of :py:class:`HBaseGet`, :py:class:`HBasePut`,
+    :py:class:`HBaseScan` and :py:class:`HBaseMutate`. The probes publish the number of requests, results, estimated RPCs and failures,
+    the bytes in and out and the p50, p95 and p99 latencies of HBaseGet requests.
+    The probes count the tuples on the ports of the operators, the retries of the HBase client are not visible to them.
+    The throttled time of the rate limits is returned as the metric ``throttledTimeMillis``, the hot keys of the
+    ``hotKeysInterval`` option as ``hotKeyRate`` and ``hotKeyPercent`` and the warmup time as ``warmupTimeMillis``.
+    A :py:class:`HBaseHotKeys` composite that is invoked with its own name is not included.
+
+    Example, checks the failures of a job from a tester::
+
+        def check_failures():
+            for op, metrics in hbase.operator_metrics(tester.submission_result.job).items():
+                assert metrics.get('nFailures', 0) == 0, op
+        tester.local_check = check_failures
+
+    Args:
+        job(Job): The running job, for example ``submission_result.job``.
+        name(str): Optional regular expression that the operator names must match.
+
+    Returns:
+        dict: The metric values of each operator by operator name.
+
+    .. versionadded:: 1.6
+    """
+    result = dict()
+    for op in job.get_operators():
+        op_name = op.name
+        if name is not None and re.search(name, op_name) is None:
+            continue
+        if not (op.operatorKind.startswith('com.ibm.streamsx.hbase::') or _base_operator_name(op_name) in _METRICS_OPERATOR_NAMES):
+            continue
+        metrics = dict()
+        for metric in op.get_metrics():
+            # the system metrics of the operator ports are not included
+            if metric.metricType != 'system':
+                metrics[metric.name] = metric.value
+        result[op_name] = metrics
+    return result
+
+
 # HBASEGet
 class _HBASEGet(streamsx.spl.op.Invoke):
     """
@@ -346,9 +1752,9 @@ class _HBASEScan(streamsx.spl.op.Invoke):
     
     def __init__(self, topology, schema=None, authKeytab=None, authPrincipal=None, channel=None, endRow=None, hbaseSite=None, initDelay=None, 
                  maxChannels=None, maxThreads=None,  maxVersions=None, minTimestamp=None, outAttrName=None, outputCountAttr=None, rowPrefix=None, 
-                 startRow=None, staticColumnFamily=None, staticColumnQualifier=None, tableName=None, tableNameAttribute=None, triggerCount=None, vmArg=None, name=None):
+                 startRow=None, staticColumnFamily=None, staticColumnQualifier=None, tableName=None, tableNameAttribute=None, triggerCount=None, vmArg=None, name=None, stream=None):
         kind="com.ibm.streamsx.hbase::HBASEScan"
-        inputs=None
+        inputs=stream
         params = dict()
         if authKeytab is not None:
             params['authKeytab'] = authKeytab
@@ -605,8 +2011,25 @@ class HBaseGet(streamsx.topology.composite.Map):
         self.tableName = tableName
         self.tableNameAttribute = None
         self.vmArg = None
+        self.clientFilter = None
+        self.cellsPerSecond = None
+        self.bytesPerSecond = None
+        self.rpcsPerSecond = None
+        self.metrics = False
+        self.traceSampleRate = None
+        self.traceAttrName = None
+        self.traceFile = None
+        self.fuseWithHBaseOperators = False
+        self.saltBuckets = None
+        self.hotKeys = False
+        self.hotKeysPrefixLength = None
+        self.hotKeysInterval = 60.0
+        self.warmupRows = None
+        self.warmupTimeout = 60.0
   
 
+        if 'fuseWithHBaseOperators' in options:
+            self.fuseWithHBaseOperators = options.get('fuseWithHBaseOperators')
         if 'rowAttrName' in options:
             self.rowAttrName = options.get('rowAttrName')
         if 'valueAttrName' in options:
@@ -621,6 +2044,8 @@ class HBaseGet(streamsx.topology.composite.Map):
             self.columnQualifierAttrName = options.get('columnQualifierAttrName')
         if 'hbaseSite' in options:
             self.hbaseSite = options.get('hbaseSite')
+        if 'clientFilter' in options:
+            self.clientFilter = options.get('clientFilter')
         if 'maxVersions' in options:
             self.maxVersions = options.get('maxVersions')
         if 'minTimestamp' in options:
@@ -639,6 +2064,32 @@ class HBaseGet(streamsx.topology.composite.Map):
             self.tableNameAttribute = options.get('tableNameAttribute')
         if 'vmArg' in options:
             self.vmArg = options.get('vmArg')
+        if 'saltBuckets' in options:
+            self.saltBuckets = options.get('saltBuckets')
+        if 'hotKeys' in options:
+            self.hotKeys = options.get('hotKeys')
+        if 'hotKeysPrefixLength' in options:
+            self.hotKeysPrefixLength = options.get('hotKeysPrefixLength')
+        if 'hotKeysInterval' in options:
+            self.hotKeysInterval = options.get('hotKeysInterval')
+        if 'warmupRows' in options:
+            self.warmupRows = options.get('warmupRows')
+        if 'warmupTimeout' in options:
+            self.warmupTimeout = options.get('warmupTimeout')
+        if 'cellsPerSecond' in options:
+            self.cellsPerSecond = options.get('cellsPerSecond')
+        if 'bytesPerSecond' in options:
+            self.bytesPerSecond = options.get('bytesPerSecond')
+        if 'rpcsPerSecond' in options:
+            self.rpcsPerSecond = options.get('rpcsPerSecond')
+        if 'metrics' in options:
+            self.metrics = options.get('metrics')
+        if 'traceSampleRate' in options:
+            self.traceSampleRate = options.get('traceSampleRate')
+        if 'traceAttrName' in options:
+            self.traceAttrName = options.get('traceAttrName')
+        if 'traceFile' in options:
+            self.traceFile = options.get('traceFile')
   
 
 
@@ -816,49 +2267,295 @@ class HBaseGet(streamsx.topology.composite.Map):
     def vmArg(self, value):
         self._vmArg = value
 
-    def populate(self, topology, stream, schema, name, **options):
-  
-        if self.maxVersions is not None:
-            self.maxVersions = streamsx.spl.types.int32(self.maxVersions)
-        if self.minTimestamp is not None:
-            self.minTimestamp = streamsx.spl.types.int64(self.minTimestamp)
-             
-        # check streamsx.hbase version
-        _add_toolkit_dependency(topology)
+    @property
+    def clientFilter(self):
+        """
+            filter expression: The optional parameter clientFilter specifies a filter expression that is evaluated on the client side, for example ``hbase.ValueFilter('>=', '100') & hbase.ColumnPrefixFilter('begin')``. The HBASEGet operator has no parameter for server side filters, the cells are transferred from the region servers and filtered by a Filter operator on the output of the operator, this reduces the tuples downstream but not the network traffic or the work of the region servers. A KeyOnlyFilter clears the value attribute. The expression and the attributes of the output schema that it reads are validated when the topology is built.
+        """
+        return self._clientFilter
 
-        if (_generate_hbase_site_xml(stream.topology, self.connection)):
-            self.hbaseSite = 'etc/hbase-site.xml'
-            _op = _HBASEGet(stream=stream, \
-                        schema=self.schema, \
-                        rowAttrName=self.rowAttrName, \
-                        authKeytab=self.authKeytab, \
-                        authPrincipal=self.authPrincipal, \
-                        columnFamilyAttrName=self.columnFamilyAttrName, \
-                        columnQualifierAttrName=self.columnQualifierAttrName, \
-                        hbaseSite=self.hbaseSite, \
-                        maxVersions=self.maxVersions, \
-                        minTimestamp=self.minTimestamp, \
-                        outAttrName=self.outAttrName, \
-                        outputCountAttr=self.outputCountAttr, \
-                        staticColumnFamily=self.staticColumnFamily, \
-                        staticColumnQualifier=self.staticColumnQualifier, \
-                        tableName=self.tableName, \
-                        tableNameAttribute=self.tableNameAttribute, \
-                        vmArg=self.vmArg, \
-                        name=name)
+    @clientFilter.setter
+    def clientFilter(self, value):
+        self._clientFilter = value
 
-            return _op.outputs[0]
-        else:
-            return None
+    @property
+    def cellsPerSecond(self):
+        """
+            int|float|callable: The optional parameter cellsPerSecond limits the throughput to this number of cells per second. Each input tuple is one Get request and counts as one cell and one RPC. The time that the operator was throttled is the custom metric throttledTimeMillis, see :ref:`fused-operators`. The limits apply to each instance of the operator, in a parallel region to each channel.
+        """
+        return self._cellsPerSecond
 
-class HBasePut(streamsx.topology.composite.Map):
-    """
-    HBasePut puts the incoming tuples into an Hbase table. 
+    @cellsPerSecond.setter
+    def cellsPerSecond(self, value):
+        self._cellsPerSecond = value
 
+    @property
+    def bytesPerSecond(self):
+        """
+            int|float|callable: The optional parameter bytesPerSecond limits the throughput to this number of bytes per second, the size of a tuple is the size of its string attributes.
+        """
+        return self._bytesPerSecond
 
-    Example, puts tuples into HBase table 'streamsSample_lotr'::
+    @bytesPerSecond.setter
+    def bytesPerSecond(self, value):
+        self._bytesPerSecond = value
 
-        import streamsx.hbase as hbase
+    @property
+    def rpcsPerSecond(self):
+        """
+            int|float|callable: The optional parameter rpcsPerSecond limits the number of RPCs per second.
+        """
+        return self._rpcsPerSecond
+
+    @rpcsPerSecond.setter
+    def rpcsPerSecond(self, value):
+        self._rpcsPerSecond = value
+
+    @property
+    def metrics(self):
+        """
+            bool: The optional parameter metrics adds probes to the HBASEGet operator that publish custom metrics: the number of requests, results and estimated RPCs, the bytes in and out and the p50, p95 and p99 request latencies in microseconds. The results are paired with the requests by the rowAttrName attribute, the latencies are measured if the output schema contains this attribute. The retries of the HBase client are part of the latency, they are not counted. See :ref:`fused-operators`. Defaults to False.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, value):
+        self._metrics = value
+
+    @property
+    def traceSampleRate(self):
+        """
+            float: The optional parameter traceSampleRate enables tracing of the requests and specifies the fraction of the requests that are traced. A request with a sampled trace context in the traceAttrName attribute is always traced. The span of a request covers the time between the request and its result in the HBASEGet operator. The results are paired with the requests by the rowAttrName attribute, it is required in the output schema.
+        """
+        return self._traceSampleRate
+
+    @traceSampleRate.setter
+    def traceSampleRate(self, value):
+        self._traceSampleRate = value
+
+    @property
+    def traceAttrName(self):
+        """
+            str: The optional parameter traceAttrName specifies the name of the rstring attribute that contains the W3C trace context (traceparent) of a tuple. The span of a request is a child of the trace context of the input tuple, the trace context of the span is set in this attribute of the output tuple.
+        """
+        return self._traceAttrName
+
+    @traceAttrName.setter
+    def traceAttrName(self, value):
+        self._traceAttrName = value
+
+    @property
+    def traceFile(self):
+        """
+            str: The path of the file that the spans are appended to as JSON lines in the OpenTelemetry span format. Required with traceSampleRate.
+        """
+        return self._traceFile
+
+    @traceFile.setter
+    def traceFile(self, value):
+        self._traceFile = value
+
+    @property
+    def fuseWithHBaseOperators(self):
+        """
+            bool: If True, the HBASEGet operator is fused with the other HBase operators of the topology that set fuseWithHBaseOperators, see :ref:`fused-operators`. Defaults to False.
+        """
+        return self._fuseWithHBaseOperators
+
+    @fuseWithHBaseOperators.setter
+    def fuseWithHBaseOperators(self, value):
+        self._fuseWithHBaseOperators = value
+
+    @property
+    def warmupRows(self):
+        """
+            list|str|dict: The optional parameter warmupRows enables the warm-up of the region location cache at startup. The start keys of the regions of the table are specified as list of row keys or as name of a file with one row key per line, for example the split points of the table. With tableNameAttribute, specify a dict of table names to row keys. The operator gets these rows before the first input tuple, the input tuples are held until the warm-up has completed or warmupTimeout has expired. The results of the warm-up requests are dropped, also the results that arrive after warmupTimeout, and they are not counted by the metrics and tracing probes. The warm-up requires structured input and output schemas, the input schema must not contain the attribute ``hbaseWarmupRequest``. The warm-up time is written to the application trace and published as the custom metric warmupTimeMillis.
+        """
+        return self._warmupRows
+
+    @warmupRows.setter
+    def warmupRows(self, value):
+        self._warmupRows = value
+
+    @property
+    def warmupTimeout(self):
+        """
+            float: The maximum time in seconds that the input tuples are held for the warm-up. Defaults to 60 seconds.
+        """
+        return self._warmupTimeout
+
+    @warmupTimeout.setter
+    def warmupTimeout(self, value):
+        self._warmupTimeout = value
+
+    @property
+    def hotKeys(self):
+        """
+            bool: If True, a filter on the input port of the HBASEGet operator tracks the hot row keys of the input tuples with a heavy hitters summary. The rate and the percentage of the requests of the hottest row key (and row key prefix) in each interval are published as the custom metrics hotKeyRate, hotKeyPercent, hotPrefixRate and hotPrefixPercent. To get the top keys as stream, apply :py:class:`HBaseHotKeys` to the input stream. Defaults to False.
+        """
+        return self._hotKeys
+
+    @hotKeys.setter
+    def hotKeys(self, value):
+        self._hotKeys = value
+
+    @property
+    def hotKeysPrefixLength(self):
+        """
+            int: The length of the row key prefixes that are tracked with hotKeys, for example the length of a salt or tenant prefix. Defaults to None, no prefixes are tracked.
+        """
+        return self._hotKeysPrefixLength
+
+    @hotKeysPrefixLength.setter
+    def hotKeysPrefixLength(self, value):
+        self._hotKeysPrefixLength = value
+
+    @property
+    def hotKeysInterval(self):
+        """
+            float: The interval in seconds of the hot key metrics. Defaults to 60 seconds.
+        """
+        return self._hotKeysInterval
+
+    @hotKeysInterval.setter
+    def hotKeysInterval(self, value):
+        self._hotKeysInterval = value
+
+    @property
+    def saltBuckets(self):
+        """
+            int: The optional parameter saltBuckets enables salted row keys, the row keys are prefixed with a salt to distribute monotonically increasing keys over the regions of the table. The salt is the zero padded bucket number, the bucket is the CRC32 checksum of the UTF-8 row key modulo saltBuckets, for example ``07`` for one of 16 buckets. The salt is removed from the row key in the output tuples. Use the same number of buckets with HBasePut, HBaseGet and HBaseScan.
+        """
+        return self._saltBuckets
+
+    @saltBuckets.setter
+    def saltBuckets(self, value):
+        self._saltBuckets = value
+
+    def populate(self, topology, stream, schema, name, **options):
+  
+        max_versions = self.maxVersions
+        if max_versions is not None:
+            max_versions = streamsx.spl.types.int32(max_versions)
+        min_timestamp = self.minTimestamp
+        if min_timestamp is not None:
+            min_timestamp = streamsx.spl.types.int64(min_timestamp)
+
+        filter_conjuncts = None
+        if self.clientFilter is not None:
+            filter_conjuncts = _check_filter(self.clientFilter)
+        trace_sample_rate = _check_tracing(self.traceSampleRate, self.traceFile, self.rowAttrName, self.schema)
+        salt_buckets = _check_salt_buckets(self.saltBuckets)
+        hot_keys_interval = _check_hot_keys(self.hotKeysPrefixLength, self.hotKeysInterval) if self.hotKeys else None
+
+        warmup_requests = None
+        if self.warmupRows is not None:
+            if not _schema_attr_names(stream.oport.schema) or not _schema_attr_names(self.schema):
+                raise ValueError("The warm-up requires structured input and output schemas.")
+            if _WARMUP_ATTR in _schema_attr_names(stream.oport.schema):
+                raise ValueError("The attribute " + _WARMUP_ATTR + " is reserved for the warm-up.")
+            warmup_requests = _read_warmup_rows(self.warmupRows)
+            if any(table is not None for table, row in warmup_requests) and self.tableNameAttribute is None:
+                raise ValueError("Warm-up rows of several tables require the parameter tableNameAttribute.")
+            warmup_timeout = _check_duration_param(self.warmupTimeout, 'warmupTimeout')
+
+        cells_per_second = _check_rate_param(self.cellsPerSecond, 'cellsPerSecond')
+        bytes_per_second = _check_rate_param(self.bytesPerSecond, 'bytesPerSecond')
+        rpcs_per_second = _check_rate_param(self.rpcsPerSecond, 'rpcsPerSecond')
+             
+        # check streamsx.hbase version
+        _add_toolkit_dependency(topology)
+
+        hbaseSite = _generate_hbase_site_xml(stream.topology, self.connection)
+        if (hbaseSite):
+            # the filters on the input port are fused with the operator
+            fused = []
+            if salt_buckets is not None:
+                stream = _apply_salt(stream, self.rowAttrName, salt_buckets)
+                fused.append(stream)
+            limited = _apply_rate_limit(stream, cells_per_second, bytes_per_second, rpcs_per_second)
+            if limited is not stream:
+                fused.append(limited)
+            if hot_keys_interval is not None:
+                limited = limited.filter(_HotKeys(self.rowAttrName, 1, self.hotKeysPrefixLength, hot_keys_interval, False), name='HBaseHotKeys')
+                fused.append(limited)
+            # the gate holds the input tuples during the warm-up and tags them, the tagged warm-up requests are not seen by the probes
+            get_schema = self.schema
+            if warmup_requests:
+                warmup_id = str(uuid.uuid4())
+                tagged_schema = stream.oport.schema.extend(StreamSchema('tuple<boolean ' + _WARMUP_ATTR + '>'))
+                limited = limited.map(_Warmup(warmup_id, 'gate', len(warmup_requests), warmup_timeout), schema=tagged_schema, name='HBaseWarmupGate')
+                fused.append(limited)
+                get_schema = streamsx.topology.schema._normalize(self.schema).extend(StreamSchema('tuple<boolean ' + _WARMUP_ATTR + '>'))
+            if self.metrics:
+                probe_id = str(uuid.uuid4())
+                # the latency is measured if the results contain the row key
+                latency = self.rowAttrName in _schema_attr_names(self.schema)
+                limited = limited.filter(_HBaseMetrics(probe_id, 'request', latency=latency, row_attr=self.rowAttrName), name='HBaseMetricsRequest')
+                fused.append(limited)
+            if trace_sample_rate is not None:
+                tracer_id = str(uuid.uuid4())
+                limited = limited.filter(_HBaseTracer(tracer_id, 'request', 'Get', self.tableName, self.rowAttrName, trace_sample_rate, self.traceAttrName, table_attr=self.tableNameAttribute), name='HBaseTraceRequest')
+                fused.append(limited)
+            if warmup_requests:
+                warmup = topology.source(_WarmupRequests(warmup_requests, self.rowAttrName, self.tableNameAttribute), name='HBaseWarmupRequests')
+                warmup = warmup.map(None, schema=tagged_schema)
+                limited = _union([limited, warmup], tagged_schema, 'HBaseWarmupUnion')
+                fused.append(limited)
+            _op = _HBASEGet(stream=limited, \
+                        schema=get_schema, \
+                        rowAttrName=self.rowAttrName, \
+                        authKeytab=self.authKeytab, \
+                        authPrincipal=self.authPrincipal, \
+                        columnFamilyAttrName=self.columnFamilyAttrName, \
+                        columnQualifierAttrName=self.columnQualifierAttrName, \
+                        hbaseSite=hbaseSite, \
+                        maxVersions=max_versions, \
+                        minTimestamp=min_timestamp, \
+                        outAttrName=self.outAttrName, \
+                        outputCountAttr=self.outputCountAttr, \
+                        staticColumnFamily=self.staticColumnFamily, \
+                        staticColumnQualifier=self.staticColumnQualifier, \
+                        tableName=self.tableName, \
+                        tableNameAttribute=self.tableNameAttribute, \
+                        vmArg=self.vmArg, \
+                        name=name)
+            _op.colocate(fused)
+            if self.fuseWithHBaseOperators:
+                _fuse_with_hbase_operators(topology, _op, self.connection, self.authPrincipal, self.vmArg)
+
+            # the probes see the salted row keys of the requests
+            result = _op.outputs[0]
+            if warmup_requests:
+                warmed_up = result.map(_Warmup(warmup_id, 'response', len(warmup_requests), warmup_timeout), schema=self.schema, name='HBaseWarmupResults')
+                warmed_up.colocate(result)
+                result = warmed_up
+            if self.metrics:
+                probe = result.filter(_HBaseMetrics(probe_id, 'response', latency=latency, row_attr=self.rowAttrName), name='HBaseMetricsResponse')
+                probe.colocate(result)
+                result = probe
+            if trace_sample_rate is not None:
+                traced = result.map(_HBaseTracer(tracer_id, 'response', 'Get', self.tableName, self.rowAttrName, trace_attr=self.traceAttrName, trace_file=self.traceFile, count_attr=self.outputCountAttr), schema=result.oport.schema, name='HBaseTraceResponse')
+                traced.colocate(result)
+                result = traced
+            if salt_buckets is not None:
+                result = _strip_salt(result, self.rowAttrName, salt_buckets)
+            if filter_conjuncts is not None:
+                attrs = {'row': self.rowAttrName, 'family': self.columnFamilyAttrName or 'columnFamily',
+                         'qualifier': self.columnQualifierAttrName or 'columnQualifier', 'value': self.outAttrName or 'value'}
+                return _apply_filter(result, filter_conjuncts, attrs)
+            return result
+        else:
+            return None
+
+class HBasePut(streamsx.topology.composite.Map):
+    """
+    HBasePut puts the incoming tuples into an Hbase table. 
+
+
+    Example, puts tuples into HBase table 'streamsSample_lotr'::
+
+        import streamsx.hbase as hbase
 
         output_schema = StreamSchema('tuple<rstring who, rstring infoType, rstring requestedDetail, rstring value, int32 numResults>')
 
@@ -871,8 +2568,10 @@ class HBasePut(streamsx.topology.composite.Map):
         put_rows = inputStream.map(hbase.HBasePut(tableName='streamsSample_lotr', rowAttrName='who', schema=output_schema, **HBasePutParameters))
  
         get_rows.print()
- 
- 
+
+    The mutations are written with the durability of the table. To trade durability for throughput, for example for caches and rollups that can be rebuilt,
+    set the durability 'ASYNC_WAL' or 'SKIP_WAL' of the table with :py:func:`alter_table`.
+
 
     Attributes
     ----------
@@ -909,8 +2608,22 @@ class HBasePut(streamsx.topology.composite.Map):
         self.Timestamp = None
         self.TimestampAttrName = None
         self.vmArg = None
+        self.cellsPerSecond = None
+        self.bytesPerSecond = None
+        self.rpcsPerSecond = None
+        self.metrics = False
+        self.traceSampleRate = None
+        self.traceAttrName = None
+        self.traceFile = None
+        self.fuseWithHBaseOperators = False
+        self.saltBuckets = None
+        self.hotKeys = False
+        self.hotKeysPrefixLength = None
+        self.hotKeysInterval = 60.0
   
 
+        if 'fuseWithHBaseOperators' in options:
+            self.fuseWithHBaseOperators = options.get('fuseWithHBaseOperators')
         if 'rowAttrName' in options:
             self.rowAttrName = options.get('rowAttrName')
         if 'valueAttrName' in options:
@@ -945,6 +2658,28 @@ class HBasePut(streamsx.topology.composite.Map):
             self.TimestampAttrName = options.get('TimestampAttrName')
         if 'vmArg' in options:
             self.vmArg = options.get('vmArg')
+        if 'saltBuckets' in options:
+            self.saltBuckets = options.get('saltBuckets')
+        if 'hotKeys' in options:
+            self.hotKeys = options.get('hotKeys')
+        if 'hotKeysPrefixLength' in options:
+            self.hotKeysPrefixLength = options.get('hotKeysPrefixLength')
+        if 'hotKeysInterval' in options:
+            self.hotKeysInterval = options.get('hotKeysInterval')
+        if 'cellsPerSecond' in options:
+            self.cellsPerSecond = options.get('cellsPerSecond')
+        if 'bytesPerSecond' in options:
+            self.bytesPerSecond = options.get('bytesPerSecond')
+        if 'rpcsPerSecond' in options:
+            self.rpcsPerSecond = options.get('rpcsPerSecond')
+        if 'metrics' in options:
+            self.metrics = options.get('metrics')
+        if 'traceSampleRate' in options:
+            self.traceSampleRate = options.get('traceSampleRate')
+        if 'traceAttrName' in options:
+            self.traceAttrName = options.get('traceAttrName')
+        if 'traceFile' in options:
+            self.traceFile = options.get('traceFile')
   
 
     @property
@@ -1155,48 +2890,225 @@ class HBasePut(streamsx.topology.composite.Map):
     def vmArg(self, value):
         self._vmArg = value
 
+    @property
+    def cellsPerSecond(self):
+        """
+            int|float|callable: The optional parameter cellsPerSecond limits the throughput to this number of cells per second. Each input tuple is one cell, the tuples of a batch (batchSize) are sent with one RPC. The time that the operator was throttled is the custom metric throttledTimeMillis, see :ref:`fused-operators`. The limits apply to each instance of the operator, in a parallel region to each channel.
+        """
+        return self._cellsPerSecond
+
+    @cellsPerSecond.setter
+    def cellsPerSecond(self, value):
+        self._cellsPerSecond = value
+
+    @property
+    def bytesPerSecond(self):
+        """
+            int|float|callable: The optional parameter bytesPerSecond limits the throughput to this number of bytes per second, the size of a tuple is the size of its string attributes.
+        """
+        return self._bytesPerSecond
+
+    @bytesPerSecond.setter
+    def bytesPerSecond(self, value):
+        self._bytesPerSecond = value
+
+    @property
+    def rpcsPerSecond(self):
+        """
+            int|float|callable: The optional parameter rpcsPerSecond limits the number of RPCs per second.
+        """
+        return self._rpcsPerSecond
+
+    @rpcsPerSecond.setter
+    def rpcsPerSecond(self, value):
+        self._rpcsPerSecond = value
+
+    @property
+    def metrics(self):
+        """
+            bool: The optional parameter metrics adds probes to the HBASEPut operator that publish custom metrics: the number of requests, results, failures (with successAttr) and estimated RPCs, the batch size and the bytes out and in. The probes count the tuples on the ports of the operator: the RPCs are estimated from batchSize, the buffered mutations of enableBuffer are counted when they enter the buffer and the retries of the HBase client are not counted. See :ref:`fused-operators`. Defaults to False.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, value):
+        self._metrics = value
+
+    @property
+    def traceSampleRate(self):
+        """
+            float: The optional parameter traceSampleRate enables tracing of the requests and specifies the fraction of the requests that are traced. A request with a sampled trace context in the traceAttrName attribute is always traced. The span of a request covers the time between the request and its result in the HBASEPut operator, including the wait of the mutation in the batch. The results are paired with the requests by the rowAttrName attribute, it is required in the output schema.
+        """
+        return self._traceSampleRate
+
+    @traceSampleRate.setter
+    def traceSampleRate(self, value):
+        self._traceSampleRate = value
+
+    @property
+    def traceAttrName(self):
+        """
+            str: The optional parameter traceAttrName specifies the name of the rstring attribute that contains the W3C trace context (traceparent) of a tuple. The span of a request is a child of the trace context of the input tuple, the trace context of the span is set in this attribute of the output tuple.
+        """
+        return self._traceAttrName
+
+    @traceAttrName.setter
+    def traceAttrName(self, value):
+        self._traceAttrName = value
+
+    @property
+    def traceFile(self):
+        """
+            str: The path of the file that the spans are appended to as JSON lines in the OpenTelemetry span format. Required with traceSampleRate.
+        """
+        return self._traceFile
+
+    @traceFile.setter
+    def traceFile(self, value):
+        self._traceFile = value
+
+    @property
+    def fuseWithHBaseOperators(self):
+        """
+            bool: If True, the HBASEPut operator is fused with the other HBase operators of the topology that set fuseWithHBaseOperators, see :ref:`fused-operators`. Defaults to False.
+        """
+        return self._fuseWithHBaseOperators
+
+    @fuseWithHBaseOperators.setter
+    def fuseWithHBaseOperators(self, value):
+        self._fuseWithHBaseOperators = value
+
+    @property
+    def hotKeys(self):
+        """
+            bool: If True, a filter on the input port of the HBASEPut operator tracks the hot row keys of the input tuples with a heavy hitters summary. The rate and the percentage of the requests of the hottest row key (and row key prefix) in each interval are published as the custom metrics hotKeyRate, hotKeyPercent, hotPrefixRate and hotPrefixPercent. To get the top keys as stream, apply :py:class:`HBaseHotKeys` to the input stream. Defaults to False.
+        """
+        return self._hotKeys
+
+    @hotKeys.setter
+    def hotKeys(self, value):
+        self._hotKeys = value
+
+    @property
+    def hotKeysPrefixLength(self):
+        """
+            int: The length of the row key prefixes that are tracked with hotKeys, for example the length of a salt or tenant prefix. Defaults to None, no prefixes are tracked.
+        """
+        return self._hotKeysPrefixLength
+
+    @hotKeysPrefixLength.setter
+    def hotKeysPrefixLength(self, value):
+        self._hotKeysPrefixLength = value
+
+    @property
+    def hotKeysInterval(self):
+        """
+            float: The interval in seconds of the hot key metrics. Defaults to 60 seconds.
+        """
+        return self._hotKeysInterval
+
+    @hotKeysInterval.setter
+    def hotKeysInterval(self, value):
+        self._hotKeysInterval = value
+
+    @property
+    def saltBuckets(self):
+        """
+            int: The optional parameter saltBuckets enables salted row keys, the row keys are prefixed with a salt to distribute monotonically increasing keys over the regions of the table. The salt is the zero padded bucket number, the bucket is the CRC32 checksum of the UTF-8 row key modulo saltBuckets, for example ``07`` for one of 16 buckets. The salt is removed from the row key in the output tuples. Use the same number of buckets with HBasePut, HBaseGet and HBaseScan.
+        """
+        return self._saltBuckets
+
+    @saltBuckets.setter
+    def saltBuckets(self, value):
+        self._saltBuckets = value
+
     def populate(self, topology, stream, schema, name, **options):
-  
-        if self.batchSize is not None:
-            self.batchSize = streamsx.spl.types.int32(self.batchSize)
-        if self.Timestamp is not None:
-            self.Timestamp = streamsx.spl.types.int64(self.Timestamp)
-
-        if self.enableBuffer is not None:
-            if self.enableBuffer is True:
-                self.enableBuffer = streamsx.spl.op.Expression.expression('true')
-            else:
-                self.enableBuffer = streamsx.spl.op.Expression.expression('false')
 
+        # the mutations of a batch are sent with one RPC
+        cells_per_rpc = self.batchSize if isinstance(self.batchSize, int) and self.batchSize > 0 else 1
+        batch_size = self.batchSize
+        if batch_size is not None:
+            batch_size = streamsx.spl.types.int32(batch_size)
+        timestamp = self.Timestamp
+        if timestamp is not None:
+            timestamp = streamsx.spl.types.int64(timestamp)
+
+        enable_buffer = self.enableBuffer
+        if enable_buffer is not None:
+            if enable_buffer is True:
+                enable_buffer = streamsx.spl.op.Expression.expression('true')
+            else:
+                enable_buffer = streamsx.spl.op.Expression.expression('false')
+
+        cells_per_second = _check_rate_param(self.cellsPerSecond, 'cellsPerSecond')
+        bytes_per_second = _check_rate_param(self.bytesPerSecond, 'bytesPerSecond')
+        rpcs_per_second = _check_rate_param(self.rpcsPerSecond, 'rpcsPerSecond')
+        trace_sample_rate = _check_tracing(self.traceSampleRate, self.traceFile, self.rowAttrName, self.schema)
+        salt_buckets = _check_salt_buckets(self.saltBuckets)
+        hot_keys_interval = _check_hot_keys(self.hotKeysPrefixLength, self.hotKeysInterval) if self.hotKeys else None
              
         # check streamsx.hbase version
         _add_toolkit_dependency(topology)
 
-        if (_generate_hbase_site_xml(stream.topology, self.connection)):
-            self.hbaseSite = 'etc/hbase-site.xml'
-            _op = _HBASEPut(stream=stream, \
+        hbaseSite = _generate_hbase_site_xml(stream.topology, self.connection)
+        if (hbaseSite):
+            # the filters on the input port are fused with the operator
+            fused = []
+            if salt_buckets is not None:
+                stream = _apply_salt(stream, self.rowAttrName, salt_buckets)
+                fused.append(stream)
+            limited = _apply_rate_limit(stream, cells_per_second, bytes_per_second, rpcs_per_second, cells_per_rpc)
+            if limited is not stream:
+                fused.append(limited)
+            if hot_keys_interval is not None:
+                limited = limited.filter(_HotKeys(self.rowAttrName, 1, self.hotKeysPrefixLength, hot_keys_interval, False), name='HBaseHotKeys')
+                fused.append(limited)
+            if self.metrics:
+                limited = limited.filter(_HBaseMetrics(None, 'request', cells_per_rpc), name='HBaseMetricsRequest')
+                fused.append(limited)
+            if trace_sample_rate is not None:
+                tracer_id = str(uuid.uuid4())
+                limited = limited.filter(_HBaseTracer(tracer_id, 'request', 'Put', self.tableName, self.rowAttrName, trace_sample_rate, self.traceAttrName, table_attr=self.tableNameAttribute), name='HBaseTraceRequest')
+                fused.append(limited)
+            _op = _HBASEPut(stream=limited, \
                         schema=self.schema, \
                         rowAttrName=self.rowAttrName, \
                         valueAttrName=self.valueAttrName, \
                         authKeytab=self.authKeytab, \
                         authPrincipal=self.authPrincipal, \
-                        batchSize=self.batchSize, \
+                        batchSize=batch_size, \
                         checkAttrName=self.checkAttrName, \
                         columnFamilyAttrName=self.columnFamilyAttrName, \
                         columnQualifierAttrName=self.columnQualifierAttrName, \
-                        enableBuffer=self.enableBuffer, \
-                        hbaseSite=self.hbaseSite, \
+                        enableBuffer=enable_buffer, \
+                        hbaseSite=hbaseSite, \
                         staticColumnFamily=self.staticColumnFamily, \
                         staticColumnQualifier=self.staticColumnQualifier, \
                         successAttr=self.successAttr, \
                         tableName=self.tableName, \
                         tableNameAttribute=self.tableNameAttribute, \
-                        Timestamp=self.Timestamp, \
+                        Timestamp=timestamp, \
                         TimestampAttrName=self.TimestampAttrName, \
                         vmArg=self.vmArg, \
                         name=name)
-
-            return _op.outputs[0]
+            _op.colocate(fused)
+            if self.fuseWithHBaseOperators:
+                _fuse_with_hbase_operators(topology, _op, self.connection, self.authPrincipal, self.vmArg)
+
+            # the probes see the salted row keys of the requests
+            result = _op.outputs[0]
+            if self.metrics:
+                # the buffered mutations of a batch are submitted when the batch is sent, a latency is not measured
+                probe = result.filter(_HBaseMetrics(None, 'response', success_attr=self.successAttr), name='HBaseMetricsResponse')
+                probe.colocate(result)
+                result = probe
+            if trace_sample_rate is not None:
+                traced = result.map(_HBaseTracer(tracer_id, 'response', 'Put', self.tableName, self.rowAttrName, trace_attr=self.traceAttrName, trace_file=self.traceFile, success_attr=self.successAttr), schema=result.oport.schema, name='HBaseTraceResponse')
+                traced.colocate(result)
+                result = traced
+            if salt_buckets is not None:
+                result = _strip_salt(result, self.rowAttrName, salt_buckets)
+            return result
         else:
             return None
 
@@ -1205,6 +3117,7 @@ class HBaseScan(streamsx.topology.composite.Source):
     HBaseScan operator scans an HBase table. Like the FileSource operator, it has an optional input port.
     If no input port is specifed, then the operator scans the table according to the parameters that you specify, and sends the final punctuation.
 
+    .. note:: The scan always reads through the region servers, scans of table snapshots that read the HFiles directly are not supported.
 
     Example, puts tuples into HBase table 'streamsSample_lotr'::
 
@@ -1259,8 +3172,32 @@ class HBaseScan(streamsx.topology.composite.Source):
         self.tableNameAttribute = None
         self.triggerCount = None
         self.vmArg = None
+        self.parallelWidth = None
+        self.splitPoints = None
+        self.watermarkFile = None
+        self.watermarkClockSkew = 60.0
+        self.clientFilter = None
+        self.rowMode = None
+        self.consistentRegion = None
+        self.scannerCaching = None
+        self.scannerMaxResultSize = None
+        self.scannerTimeout = None
+        self.sampleRate = None
+        self.sampleSize = None
+        self.estimatedRowCount = None
+        self.sampleSeed = ''
+        self.limit = None
+        self.limitPrefixLength = None
+        self.cellsPerSecond = None
+        self.bytesPerSecond = None
+        self.rpcsPerSecond = None
+        self.metrics = False
+        self.fuseWithHBaseOperators = False
+        self.saltBuckets = None
   
 
+        if 'fuseWithHBaseOperators' in options:
+            self.fuseWithHBaseOperators = options.get('fuseWithHBaseOperators')
         if 'authKeytab' in options:
             self.authKeytab = options.get('authKeytab')
         if 'authPrincipal' in options:
@@ -1293,16 +3230,58 @@ class HBaseScan(streamsx.topology.composite.Source):
             self.startRow = options.get('startRow')
         if 'staticColumnFamily' in options:
             self.staticColumnFamily = options.get('staticColumnFamily')
-        if 'staticColumnFamily' in options:
-            self.staticColumnFamily = options.get('staticColumnFamily')
+        if 'staticColumnQualifier' in options:
+            self.staticColumnQualifier = options.get('staticColumnQualifier')
         if 'tableNameAttribute' in options:
             self.tableNameAttribute = options.get('tableNameAttribute')
         if 'tableName' in options:
             self.tableName = options.get('tableName')
         if 'triggerCount' in options:
             self.triggerCount = options.get('triggerCount')
+        if 'parallelWidth' in options:
+            self.parallelWidth = options.get('parallelWidth')
+        if 'splitPoints' in options:
+            self.splitPoints = options.get('splitPoints')
+        if 'watermarkFile' in options:
+            self.watermarkFile = options.get('watermarkFile')
+        if 'watermarkClockSkew' in options:
+            self.watermarkClockSkew = options.get('watermarkClockSkew')
+        if 'clientFilter' in options:
+            self.clientFilter = options.get('clientFilter')
+        if 'rowMode' in options:
+            self.rowMode = options.get('rowMode')
+        if 'consistentRegion' in options:
+            self.consistentRegion = options.get('consistentRegion')
+        if 'scannerCaching' in options:
+            self.scannerCaching = options.get('scannerCaching')
+        if 'scannerMaxResultSize' in options:
+            self.scannerMaxResultSize = options.get('scannerMaxResultSize')
+        if 'scannerTimeout' in options:
+            self.scannerTimeout = options.get('scannerTimeout')
+        if 'sampleRate' in options:
+            self.sampleRate = options.get('sampleRate')
+        if 'sampleSize' in options:
+            self.sampleSize = options.get('sampleSize')
+        if 'estimatedRowCount' in options:
+            self.estimatedRowCount = options.get('estimatedRowCount')
+        if 'sampleSeed' in options:
+            self.sampleSeed = options.get('sampleSeed')
+        if 'limit' in options:
+            self.limit = options.get('limit')
+        if 'limitPrefixLength' in options:
+            self.limitPrefixLength = options.get('limitPrefixLength')
         if 'vmArg' in options:
             self.vmArg = options.get('vmArg')
+        if 'saltBuckets' in options:
+            self.saltBuckets = options.get('saltBuckets')
+        if 'cellsPerSecond' in options:
+            self.cellsPerSecond = options.get('cellsPerSecond')
+        if 'bytesPerSecond' in options:
+            self.bytesPerSecond = options.get('bytesPerSecond')
+        if 'rpcsPerSecond' in options:
+            self.rpcsPerSecond = options.get('rpcsPerSecond')
+        if 'metrics' in options:
+            self.metrics = options.get('metrics')
   
   
     @property
@@ -1536,55 +3515,2000 @@ class HBaseScan(streamsx.topology.composite.Source):
     def vmArg(self, value):
         self._vmArg = value
 
-    def populate(self, topology, stream, **options):
-  
-        if self.channel is not None:
-            self.channel = streamsx.spl.types.int32(self.channel)
-        if self.initDelay is not None:
-            self.initDelay = streamsx.spl.types.float64(self.initDelay)
-        if self.maxChannels is not None:
-            self.maxChannels = streamsx.spl.types.int32(self.maxChannels)
-        if self.maxThreads is not None:
-            self.maxThreads = streamsx.spl.types.int32(self.maxThreads)
-        if self.maxVersions is not None:
-            self.maxVersions = streamsx.spl.types.int32(self.maxVersions)
-        if self.minTimestamp is not None:
-            self.minTimestamp = streamsx.spl.types.int64(self.minTimestamp)
-        if self.triggerCount is not None:
-            self.triggerCount = streamsx.spl.types.int64(self.triggerCount)
-              
-        # check streamsx.hbase version
-        _add_toolkit_dependency(topology)
+    @property
+    def parallelWidth(self):
+        """
+            int: The optional parameter parallelWidth enables the automatic parallel scan. The scan is executed in a parallel region with this number of channels and every channel scans a contiguous range of regions. Without splitPoints the operator divides the regions of the table among the channels. The returned stream is in the parallel region, call end_parallel() to merge the channels. The number of scanned rows per channel is available with the 'nTuplesSubmitted' metric of the output port of each channel.
+        """
+        return self._parallelWidth
 
-        if (_generate_hbase_site_xml(topology, self.connection)):
-            self.hbaseSite = 'etc/hbase-site.xml'
+    @parallelWidth.setter
+    def parallelWidth(self, value):
+        self._parallelWidth = value
 
+    @property
+    def splitPoints(self):
+        """
+            list|str: The optional parameter splitPoints specifies the region boundaries of the table as list of row keys or as name of a file with one row key per line. It is used with parallelWidth: the regions between startRow and endRow are assigned to the channels as balanced key ranges, when the topology is built.
+        """
+        return self._splitPoints
 
-            _op = _HBASEScan(topology=topology, \
-                        schema=self.schema, \
-                        authKeytab=self.authKeytab, \
-                        authPrincipal=self.authPrincipal, \
-                        channel=self.channel, \
-                        endRow=self.endRow, \
-                        hbaseSite=self.hbaseSite, \
-                        initDelay=self.initDelay, \
-                        maxChannels=self.maxChannels, \
-                        maxThreads=self.maxThreads, \
-                        maxVersions=self.maxVersions, \
-                        minTimestamp=self.minTimestamp, \
-                        outAttrName=self.outAttrName, \
-                        outputCountAttr=self.outputCountAttr, \
-                        rowPrefix=self.rowPrefix, \
-                        startRow=self.startRow, \
-                        staticColumnFamily=self.staticColumnFamily, \
-                        staticColumnQualifier=self.staticColumnQualifier, \
-                        tableName=self.tableName, \
-                        tableNameAttribute=self.tableNameAttribute, \
-                        triggerCount=self.triggerCount, \
-                        vmArg=self.vmArg, \
-                        name='HBaseScan')
+    @splitPoints.setter
+    def splitPoints(self, value):
+        self._splitPoints = value
 
-            return _op.outputs[0]
-        else:
-            return None
+    @property
+    def watermarkFile(self):
+        """
+            str: The optional parameter watermarkFile enables the incremental scan. The file contains the timestamp in milliseconds of the last successful scan and the operator returns only cells that are newer than this watermark. The file is read when the topology is built and the time of the build minus watermarkClockSkew is stored as pending watermark next to it, the processing elements do not access the file. Call :py:func:`commit_watermark` after the scan has completed successfully. The directory of the file must exist and be writable on the host where the topology is built, otherwise ValueError is raised. Cells written with an explicit timestamp older than the watermark are not returned by the next scan.
+        """
+        return self._watermarkFile
+
+    @watermarkFile.setter
+    def watermarkFile(self, value):
+        self._watermarkFile = value
+
+    @property
+    def watermarkClockSkew(self):
+        """
+            float|datetime.timedelta: The maximum difference in seconds between the clock of the host where the topology is built and the clocks of the region servers, which set the cell timestamps. It is subtracted from the pending watermark of the watermarkFile, cells of this period are returned again by the next scan. Defaults to 60 seconds.
+        """
+        return self._watermarkClockSkew
+
+    @watermarkClockSkew.setter
+    def watermarkClockSkew(self, value):
+        self._watermarkClockSkew = value
+
+    @property
+    def clientFilter(self):
+        """
+            filter expression: The optional parameter clientFilter specifies a filter expression that is evaluated on the client side, for example ``hbase.ValueFilter('>=', '100') & hbase.ColumnPrefixFilter('begin')``. Only a PrefixFilter is executed by the region servers, with the rowPrefix parameter. The HBASEScan operator has no parameter for server side filters, the other cells are transferred from the region servers and filtered by a Filter operator on the output of the operator, this reduces the tuples downstream but not the network traffic or the work of the region servers. A KeyOnlyFilter clears the value attribute. The expression and the attributes of the output schema that it reads are validated when the topology is built.
+        """
+        return self._clientFilter
+
+    @clientFilter.setter
+    def clientFilter(self, value):
+        self._clientFilter = value
+
+    @property
+    def rowMode(self):
+        """
+            bool: When set to true, the operator submits one tuple per row that contains all requested cells of the row instead of one tuple per cell. The attribute given by outAttrName has the type map<rstring, map<rstring, rstring>> (column family to column qualifier to value), or map<rstring, rstring> (column qualifier to value) with one staticColumnFamily. If schema is not specified, HBASEScanRowOutputSchema or HBASEScanFamilyRowOutputSchema is used. Alternatively, the schema can map the cells to attributes with an outAttrName attribute of type tuple, the attribute names are used as column qualifiers.
+        """
+        return self._rowMode
+
+    @rowMode.setter
+    def rowMode(self, value):
+        self._rowMode = value
+
+    @property
+    def consistentRegion(self):
+        """
+            ConsistentRegionConfig: The optional parameter consistentRegion makes the scan the start of a consistent region. The operator checkpoints the key of the last submitted row of its channel with each drain and checkpoint cycle. After a restart of the processing element the scan resumes after this row instead of the startRow. Use ConsistentRegionConfig.operator_driven() together with triggerCount to checkpoint every triggerCount rows, or ConsistentRegionConfig.periodic(). The tuples are emitted exactly once to operators in the consistent region that participate in the checkpointing, for example consistent sinks. Operators outside the region and non-consistent sinks receive the tuples after the checkpoint again (at least once).
+        """
+        return self._consistentRegion
+
+    @consistentRegion.setter
+    def consistentRegion(self, value):
+        self._consistentRegion = value
+
+    @property
+    def scannerCaching(self):
+        """
+            int|str: The optional parameter scannerCaching specifies the number of rows that are fetched with one RPC from the region server. Use large values for tables with small rows. With the value 'auto' the number of rows is not limited and every RPC returns rows up to scannerMaxResultSize bytes (2 MB if not specified). This is size bounded caching, the number of rows per RPC follows from the size of the rows, it is not adapted to the latency or the throughput of the scan. The value is set as client property 'hbase.client.scanner.caching' in the hbase-site.xml file of the operator, defaults to the value of the configuration file.
+        """
+        return self._scannerCaching
+
+    @scannerCaching.setter
+    def scannerCaching(self, value):
+        self._scannerCaching = value
+
+    @property
+    def scannerMaxResultSize(self):
+        """
+            int: The optional parameter scannerMaxResultSize specifies the maximum size in bytes of the rows returned with one RPC. With scannerCaching 'auto' it defaults to 2097152 (2 MB). The value is set as client property 'hbase.client.scanner.max.result.size' in the hbase-site.xml file of the operator.
+        """
+        return self._scannerMaxResultSize
+
+    @scannerMaxResultSize.setter
+    def scannerMaxResultSize(self, value):
+        self._scannerMaxResultSize = value
+
+    @property
+    def scannerTimeout(self):
+        """
+            int|float|datetime.timedelta: The optional parameter scannerTimeout specifies the client side scanner timeout in seconds, the time the operator waits for the response of a scanner RPC. The value is set as client property 'hbase.client.scanner.timeout.period' in the hbase-site.xml file of the operator. It does not change the scanner lease of the region servers, which is a server setting: to keep scanners open longer between two RPCs, for example for scans of large rows or slow consumers, set 'hbase.client.scanner.timeout.period' in the configuration of the region servers of the cluster as well.
+        """
+        return self._scannerTimeout
+
+    @scannerTimeout.setter
+    def scannerTimeout(self, value):
+        self._scannerTimeout = value
+
+    @property
+    def sampleRate(self):
+        """
+            float: The optional parameter sampleRate enables the sampling scan. Rows are selected with this probability (greater than 0 and at most 1) by the hash of the row key, so that all cells of a sampled row are returned and the sample is spread over all regions. The attribute 'samplingWeight' of type float64 is added to the output schema, it contains the inverse of the sample rate to estimate totals from the sample. The sampling is a client side thinning of the scan output: the rows are selected by a Functor operator on the output of the HBASEScan operator, the region servers still read and transfer all rows of the key range, so the scan takes as long as a full scan. To reduce the scan time, restrict the key range with startRow, endRow or rowPrefix. Requires an output schema with the attribute 'row'.
+        """
+        return self._sampleRate
+
+    @sampleRate.setter
+    def sampleRate(self, value):
+        self._sampleRate = value
+
+    @property
+    def sampleSize(self):
+        """
+            int: The optional parameter sampleSize specifies the target number of sampled rows, the sample rate is sampleSize divided by estimatedRowCount. Cannot be used with sampleRate.
+        """
+        return self._sampleSize
+
+    @sampleSize.setter
+    def sampleSize(self, value):
+        self._sampleSize = value
+
+    @property
+    def estimatedRowCount(self):
+        """
+            int: The estimated number of rows in the scanned key range. It is required with sampleSize.
+        """
+        return self._estimatedRowCount
+
+    @estimatedRowCount.setter
+    def estimatedRowCount(self, value):
+        self._estimatedRowCount = value
+
+    @property
+    def sampleSeed(self):
+        """
+            str: Seed of the row selection. Scans with the same seed and sample rate return the same rows. Defaults to an empty string.
+        """
+        return self._sampleSeed
+
+    @sampleSeed.setter
+    def sampleSeed(self, value):
+        self._sampleSeed = value
+
+    @property
+    def limit(self):
+        """
+            int: The optional parameter limit specifies the maximum number of rows that are submitted. With limitPrefixLength it is the maximum number of rows for each row key prefix, for example the latest events of each entity. The limit truncates the output on the client side: the HBASEScan operator has no parameter to stop a scan, it still scans and transfers the complete key range and a filter on its output drops the rows above the limit. Restrict the key range with startRow, endRow or rowPrefix to reduce the work of the scan. Cannot be used with parallelWidth, the limit applies to the merged output of the scan. To get the latest rows first, use row keys with a reversed timestamp (Long.MAX_VALUE - timestamp) after the entity prefix, the HBASEScan operator does not support reverse scans.
+        """
+        return self._limit
+
+    @limit.setter
+    def limit(self, value):
+        self._limit = value
+
+    @property
+    def limitPrefixLength(self):
+        """
+            int: The optional parameter limitPrefixLength specifies the length of the row key prefix that the limit applies to. Rows with the same first limitPrefixLength characters of the row key count against the same limit.
+        """
+        return self._limitPrefixLength
+
+    @limitPrefixLength.setter
+    def limitPrefixLength(self, value):
+        self._limitPrefixLength = value
 
+    @property
+    def cellsPerSecond(self):
+        """
+            int|float|callable: The optional parameter cellsPerSecond limits the throughput to this number of cells per second. Each output tuple counts as one cell, in rowMode a row counts as the number of its cells given by outputCountAttr. scannerCaching tuples are fetched with one RPC. The time that the operator was throttled is the custom metric throttledTimeMillis, see :ref:`fused-operators`. The limits apply to the complete scan, with parallelWidth every channel is limited to its share of the limits.
+        """
+        return self._cellsPerSecond
+
+    @cellsPerSecond.setter
+    def cellsPerSecond(self, value):
+        self._cellsPerSecond = value
+
+    @property
+    def bytesPerSecond(self):
+        """
+            int|float|callable: The optional parameter bytesPerSecond limits the throughput to this number of bytes per second, the size of a tuple is the size of its string attributes.
+        """
+        return self._bytesPerSecond
+
+    @bytesPerSecond.setter
+    def bytesPerSecond(self, value):
+        self._bytesPerSecond = value
+
+    @property
+    def rpcsPerSecond(self):
+        """
+            int|float|callable: The optional parameter rpcsPerSecond limits the number of RPCs per second. It requires an integer scannerCaching value.
+        """
+        return self._rpcsPerSecond
+
+    @rpcsPerSecond.setter
+    def rpcsPerSecond(self, value):
+        self._rpcsPerSecond = value
+
+    @property
+    def metrics(self):
+        """
+            bool: The optional parameter metrics adds a probe to the HBASEScan operator that publishes the number of results and the bytes in as custom metrics. See :ref:`fused-operators`. Defaults to False.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, value):
+        self._metrics = value
+
+    @property
+    def fuseWithHBaseOperators(self):
+        """
+            bool: If True, the HBASEScan operator is fused with the other HBase operators of the topology that set fuseWithHBaseOperators, see :ref:`fused-operators`. Defaults to False.
+        """
+        return self._fuseWithHBaseOperators
+
+    @fuseWithHBaseOperators.setter
+    def fuseWithHBaseOperators(self, value):
+        self._fuseWithHBaseOperators = value
+
+    @property
+    def saltBuckets(self):
+        """
+            int: The optional parameter saltBuckets specifies the number of salt buckets of a table that is written by :py:class:`HBasePut` with saltBuckets. One scan operator is invoked for each bucket, startRow, endRow and rowPrefix are applied to the row keys without salt. The results of the buckets are merged and the salt is removed from the row keys, the rows of different buckets are interleaved. Cannot be used with parallelWidth, consistentRegion or limit.
+        """
+        return self._saltBuckets
+
+    @saltBuckets.setter
+    def saltBuckets(self, value):
+        self._saltBuckets = value
+
+    def populate(self, topology, stream, **options):
+
+        min_timestamp = self.minTimestamp
+        if self.watermarkFile is not None:
+            _store_pending_watermark(self.watermarkFile, _check_duration_param(self.watermarkClockSkew, 'watermarkClockSkew'))
+            watermark = _read_watermark(self.watermarkFile)
+            # cells with the timestamp of the watermark are returned again, no cell is missed
+            if watermark is not None:
+                if min_timestamp is None or watermark > min_timestamp:
+                    min_timestamp = watermark
+
+        output_schema = self.schema
+        out_attr_name = self.outAttrName
+        output_count_attr = self.outputCountAttr
+        if self.rowMode:
+            if self.staticColumnQualifier is not None:
+                raise ValueError("The parameter rowMode cannot be used with staticColumnQualifier.")
+            if output_schema is CommonSchema.String:
+                if isinstance(self.staticColumnFamily, str):
+                    output_schema = HBASEScanFamilyRowOutputSchema
+                else:
+                    output_schema = HBASEScanRowOutputSchema
+            if out_attr_name is None:
+                out_attr_name = 'value'
+            if output_count_attr is None:
+                output_count_attr = 'numResults'
+
+        sample_rate = self.sampleRate
+        if self.sampleSize is not None:
+            if sample_rate is not None:
+                raise ValueError("The parameter sampleSize cannot be used with sampleRate.")
+            if self.estimatedRowCount is None or self.estimatedRowCount < 1:
+                raise ValueError("The parameter estimatedRowCount is required with sampleSize.")
+            sample_rate = min(1.0, float(self.sampleSize) / self.estimatedRowCount)
+        if sample_rate is not None:
+            if not isinstance(sample_rate, (int, float)) or sample_rate * 1000000 < 1 or sample_rate > 1:
+                raise ValueError("Invalid sampleRate value. Value must be greater than 0.000001 and at most 1.")
+
+        salt_buckets = _check_salt_buckets(self.saltBuckets)
+        if salt_buckets is not None:
+            if self.parallelWidth is not None or self.consistentRegion is not None or self.limit is not None:
+                raise ValueError("The parameter saltBuckets cannot be used with parallelWidth, consistentRegion or limit.")
+
+        if self.limit is not None:
+            if not isinstance(self.limit, int) or self.limit < 1:
+                raise ValueError("Invalid limit value. Value must be at least one.")
+            if self.limitPrefixLength is not None and (not isinstance(self.limitPrefixLength, int) or self.limitPrefixLength < 1):
+                raise ValueError("Invalid limitPrefixLength value. Value must be at least one.")
+            if isinstance(output_schema, CommonSchema):
+                raise ValueError("A scan with limit requires an output schema with the attribute row.")
+            if self.parallelWidth is not None:
+                # every channel would apply its own limit
+                raise ValueError("The parameter limit cannot be used with parallelWidth.")
+        elif self.limitPrefixLength is not None:
+            raise ValueError("The parameter limitPrefixLength requires the parameter limit.")
+
+        filter_conjuncts = None
+        row_prefix = self.rowPrefix
+        if self.clientFilter is not None:
+            filter_conjuncts = _check_filter(self.clientFilter)
+            if row_prefix is None:
+                row_prefix, filter_conjuncts = _push_down_row_prefix(filter_conjuncts)
+  
+        channel = self.channel
+        if channel is not None:
+            channel = streamsx.spl.types.int32(channel)
+        init_delay = self.initDelay
+        if init_delay is not None:
+            init_delay = streamsx.spl.types.float64(init_delay)
+        max_channels = self.maxChannels
+        if max_channels is not None:
+            max_channels = streamsx.spl.types.int32(max_channels)
+        max_threads = self.maxThreads
+        if max_threads is not None:
+            max_threads = streamsx.spl.types.int32(max_threads)
+        max_versions = self.maxVersions
+        if max_versions is not None:
+            max_versions = streamsx.spl.types.int32(max_versions)
+        if min_timestamp is not None:
+            min_timestamp = streamsx.spl.types.int64(min_timestamp)
+        if self.consistentRegion is not None:
+            if not isinstance(self.consistentRegion, ConsistentRegionConfig):
+                raise TypeError(self.consistentRegion)
+            if self.consistentRegion.trigger == ConsistentRegionConfig.Trigger.OPERATOR_DRIVEN:
+                if self.triggerCount is None:
+                    raise ValueError("The parameter triggerCount is required for an operator driven consistent region.")
+            elif self.triggerCount is not None:
+                raise ValueError("The parameter triggerCount is valid only in an operator driven consistent region.")
+
+        trigger_count = self.triggerCount
+        if trigger_count is not None:
+            trigger_count = streamsx.spl.types.int64(trigger_count)
+
+        start_row = self.startRow
+        end_row = self.endRow
+        if self.parallelWidth is not None:
+            if self.splitPoints is not None:
+                # every channel scans its own key range, selected by the channel number
+                key_ranges = _balanced_key_ranges(_read_split_points(self.splitPoints), self.parallelWidth, start_row, end_row)
+                start_row = streamsx.spl.op.Expression.expression(_spl_list_literal([r[0] for r in key_ranges]) + '[getChannel()]')
+                end_row = streamsx.spl.op.Expression.expression(_spl_list_literal([r[1] for r in key_ranges]) + '[getChannel()]')
+            else:
+                # the operator divides the regions of the table among the channels
+                channel = streamsx.spl.op.Expression.expression('getChannel()')
+                max_channels = streamsx.spl.op.Expression.expression('getMaxChannels()')
+              
+        # HBase client properties, these are set in the hbase-site.xml file of this operator
+        properties = dict()
+        scanner_max_result_size = self.scannerMaxResultSize
+        if self.scannerCaching is not None:
+            if self.scannerCaching == 'auto':
+                # size bounded caching, the rows of a RPC are limited by the result size only
+                properties['hbase.client.scanner.caching'] = 2147483647
+                if scanner_max_result_size is None:
+                    scanner_max_result_size = 2097152
+            elif isinstance(self.scannerCaching, int) and self.scannerCaching > 0:
+                properties['hbase.client.scanner.caching'] = self.scannerCaching
+            else:
+                raise ValueError("Invalid scannerCaching value. Value must be 'auto' or at least one.")
+        if scanner_max_result_size is not None:
+            if not isinstance(scanner_max_result_size, int) or scanner_max_result_size < 1:
+                raise ValueError("Invalid scannerMaxResultSize value. Value must be at least one.")
+            properties['hbase.client.scanner.max.result.size'] = scanner_max_result_size
+        if self.scannerTimeout is not None:
+            properties['hbase.client.scanner.timeout.period'] = int(_check_time_param(self.scannerTimeout, 'scannerTimeout') * 1000)
+
+        cells_per_second = _check_rate_param(self.cellsPerSecond, 'cellsPerSecond')
+        bytes_per_second = _check_rate_param(self.bytesPerSecond, 'bytesPerSecond')
+        rpcs_per_second = _check_rate_param(self.rpcsPerSecond, 'rpcsPerSecond')
+        if rpcs_per_second is not None and not isinstance(self.scannerCaching, int):
+            raise ValueError("The parameter rpcsPerSecond requires an integer scannerCaching value.")
+
+        # check streamsx.hbase version
+        _add_toolkit_dependency(topology)
+
+        hbaseSite = _generate_hbase_site_xml(topology, self.connection, properties)
+        if (hbaseSite):
+            if salt_buckets is not None:
+                # one scan for each salt bucket
+                key_ranges = _salted_key_ranges(salt_buckets, start_row, end_row, row_prefix)
+            else:
+                key_ranges = [(start_row, end_row, row_prefix)]
+            scans = []
+            for range_start_row, range_end_row, range_row_prefix in key_ranges:
+                _op = _HBASEScan(topology=topology, \
+                        schema=output_schema, \
+                        authKeytab=self.authKeytab, \
+                        authPrincipal=self.authPrincipal, \
+                        channel=channel, \
+                        endRow=range_end_row, \
+                        hbaseSite=hbaseSite, \
+                        initDelay=init_delay, \
+                        maxChannels=max_channels, \
+                        maxThreads=max_threads, \
+                        maxVersions=max_versions, \
+                        minTimestamp=min_timestamp, \
+                        outAttrName=out_attr_name, \
+                        outputCountAttr=output_count_attr, \
+                        rowPrefix=range_row_prefix, \
+                        startRow=range_start_row, \
+                        staticColumnFamily=self.staticColumnFamily, \
+                        staticColumnQualifier=self.staticColumnQualifier, \
+                        tableName=self.tableName, \
+                        tableNameAttribute=self.tableNameAttribute, \
+                        triggerCount=trigger_count, \
+                        vmArg=self.vmArg, \
+                        name='HBaseScan')
+                if self.fuseWithHBaseOperators:
+                    _fuse_with_hbase_operators(topology, _op, self.connection, self.authPrincipal, self.vmArg)
+                scans.append(_op.outputs[0])
+
+            scanned_rows = scans[0]
+            if salt_buckets is not None:
+                scanned_rows = _union(scans, output_schema, 'HBaseSaltedScanUnion')
+                scanned_rows.colocate(scans)
+                scanned_rows = _strip_salt(scanned_rows, 'row', salt_buckets)
+            if self.consistentRegion is not None:
+                scanned_rows.set_consistent(self.consistentRegion)
+            if self.parallelWidth is not None:
+                scanned_rows.set_parallel(self.parallelWidth)
+            # the limiter is in the parallel region, the limits are divided among the channels
+            limited_rows = _apply_rate_limit(scanned_rows, cells_per_second, bytes_per_second, rpcs_per_second, self.scannerCaching if isinstance(self.scannerCaching, int) else 1,
+                                             self.parallelWidth if self.parallelWidth is not None else 1, output_count_attr if self.rowMode else None)
+            if limited_rows is not scanned_rows:
+                # a throttled filter blocks the fused scan operator
+                limited_rows.colocate(scanned_rows)
+                scanned_rows = limited_rows
+            if self.metrics:
+                probe = scanned_rows.filter(_HBaseMetrics(None, 'response'), name='HBaseMetricsResponse')
+                probe.colocate(scanned_rows)
+                scanned_rows = probe
+            if filter_conjuncts:
+                if self.rowMode:
+                    # the cells of a row are in one attribute, only the row key can be filtered
+                    attrs = {'row': 'row', 'family': None, 'qualifier': None, 'value': None}
+                else:
+                    attrs = {'row': 'row', 'family': 'columnFamily', 'qualifier': 'columnQualifier', 'value': out_attr_name or 'value'}
+                scanned_rows = _apply_filter(scanned_rows, filter_conjuncts, attrs)
+            if self.limit is not None:
+                limited_rows = scanned_rows.filter(_RowLimit(self.limit, self.limitPrefixLength), name='HBaseLimit')
+                limited_rows.colocate(scanned_rows)
+                scanned_rows = limited_rows
+            if sample_rate is not None:
+                scanned_rows = _apply_sampling(scanned_rows, sample_rate, self.sampleSeed)
+            return scanned_rows
+        else:
+            return None
+
+
+class HBaseTriggeredScan(streamsx.topology.composite.Map):
+    """
+    HBaseTriggeredScan scans an HBase table for each tuple of the input stream.
+
+    The input tuple specifies the key range of the scan with the attributes ``startRow`` and ``endRow``, or with the attribute ``rowPrefix`` (all of type rstring).
+    The rows of a scan are followed by a window punctuation, so that the results of each trigger are delimited in the output stream.
+    The operator executes the scans of the input tuples one after the other, ``maxThreads`` is the number of threads that the operator uses within one scan,
+    it does not run several scans at once. To run scans concurrently, use the composite in a parallel region, every channel runs one scan at a time.
+
+    Example, scans the rows with the prefix of each event::
+
+        import streamsx.hbase as hbase
+
+        triggers = events.map(lambda e: {'rowPrefix': e['who']}, schema='tuple<rstring rowPrefix>')
+
+        options = {
+          'outAttrName' : 'value',
+          'outputCountAttr' : 'numResults',
+          'maxThreads' : 8
+        }
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        scanned_rows = triggers.parallel(4).map(hbase.HBaseTriggeredScan(tableName='streamsSample_lotr', schema=schema, **options)).end_parallel()
+
+    Attributes
+    ----------
+    tableName : str
+        The name of HBase table.
+    connection : dict|str
+        Specify the connection to HBASE either with a filename of a HBase configuration file or as string in format "HOST:PORT" or as dict containing the properties 'host' and 'port'. If not specified the environment variables ``HADOOP_HOST_PORT`` or ``HBASE_SITE_XML`` are used.
+    schema : StreamSchema
+        Output schema, defaults to CommonSchema.String
+    options : kwargs
+        The additional optional parameters as variable keyword arguments.
+    """
+
+    def __init__(self, tableName, connection=None, schema=CommonSchema.String, **options):
+        self.schema = schema
+        self.connection = connection
+        self.authKeytab = None
+        self.authPrincipal = None
+        self.hbaseSite = None
+        self.maxThreads = None
+        self.maxVersions = None
+        self.minTimestamp = None
+        self.outAttrName = None
+        self.outputCountAttr = None
+        self.staticColumnFamily = None
+        self.staticColumnQualifier = None
+        self.tableName = tableName
+        self.tableNameAttribute = None
+        self.vmArg = None
+        self.fuseWithHBaseOperators = False
+  
+
+        if 'fuseWithHBaseOperators' in options:
+            self.fuseWithHBaseOperators = options.get('fuseWithHBaseOperators')
+        if 'authKeytab' in options:
+            self.authKeytab = options.get('authKeytab')
+        if 'authPrincipal' in options:
+            self.authPrincipal = options.get('authPrincipal')
+        if 'hbaseSite' in options:
+            self.hbaseSite = options.get('hbaseSite')
+        if 'maxThreads' in options:
+            self.maxThreads = options.get('maxThreads')
+        if 'maxVersions' in options:
+            self.maxVersions = options.get('maxVersions')
+        if 'minTimestamp' in options:
+            self.minTimestamp = options.get('minTimestamp')
+        if 'outAttrName' in options:
+            self.outAttrName = options.get('outAttrName')
+        if 'outputCountAttr' in options:
+            self.outputCountAttr = options.get('outputCountAttr')
+        if 'staticColumnFamily' in options:
+            self.staticColumnFamily = options.get('staticColumnFamily')
+        if 'staticColumnQualifier' in options:
+            self.staticColumnQualifier = options.get('staticColumnQualifier')
+        if 'tableName' in options:
+            self.tableName = options.get('tableName')
+        if 'tableNameAttribute' in options:
+            self.tableNameAttribute = options.get('tableNameAttribute')
+        if 'vmArg' in options:
+            self.vmArg = options.get('vmArg')
+
+    @property
+    def authKeytab(self):
+        """
+            str: The optional parameter authKeytab specifies the file that contains the encrypted keys for the user that is specified by the authPrincipal parameter. The operator uses this keytab file to authenticate the user. The keytab file is generated by the administrator. You must specify this parameter to use Kerberos authentication.
+        """
+        return self._authKeytab
+
+    @authKeytab.setter
+    def authKeytab(self, value):
+        self._authKeytab = value
+
+    @property
+    def authPrincipal(self):
+        """
+            str: The optional parameter authPrincipal specifies the Kerberos principal that you use for authentication. This value is set to the principal that is created for the IBM Streams instance owner. You must specify this parameter if you want to use Kerberos authentication. 
+        """
+        return self._authPrincipal
+
+    @authPrincipal.setter
+    def authPrincipal(self, value):
+        self._authPrincipal = value
+
+    @property
+    def hbaseSite(self):
+        """
+            str: The hbaseSite parameter specifies the path of hbase-site.xml file. This is the recommended way to specify the HBASE configuration. 
+        """
+        return self._hbaseSite
+
+    @hbaseSite.setter
+    def hbaseSite(self, value):
+        self._hbaseSite = value
+
+    @property
+    def maxThreads(self):
+        """
+            int: Maximum number of threads to use to scan the table. The threads are used within a scan, the scans of the input tuples are executed one after the other. Defaults to one. 
+        """
+        return self._maxThreads
+
+    @maxThreads.setter
+    def maxThreads(self, value):
+        self._maxThreads = value
+
+    @property
+    def maxVersions(self):
+        """
+            int: This parameter specifies the maximum number of versions that the operator returns. It defaults to a value of one. A value of 0 indicates that the operator gets all versions. 
+        """
+        return self._maxVersions
+
+    @maxVersions.setter
+    def maxVersions(self, value):
+        self._maxVersions = value
+
+    @property
+    def minTimestamp(self):
+        """
+            int: This parameter specifies the minimum timestamp that is used for queries. The operator does not return any entries with a timestamp older than this value. Unless you specify the maxVersions parameter, the opertor returns only one entry in this time range.
+        """
+        return self._minTimestamp
+
+    @minTimestamp.setter
+    def minTimestamp(self, value):
+        self._minTimestamp = value
+
+    @property
+    def outAttrName(self):
+        """
+            str: This parameter specifies the name of the attribute in which to put the value. It defaults to value. If the attribute is a tuple data type, the attribute names are used as columnQualifiers. 
+        """
+        return self._outAttrName
+
+    @outAttrName.setter
+    def outAttrName(self, value):
+        self._outAttrName = value
+
+    @property
+    def outputCountAttr(self):
+        """
+            str: This parameter specifies the output attribute in which to put the number of results that are found. When the result is a tuple, this parameter value is the number attributes that were populated in that tuple.
+        """
+        return self._outputCountAttr
+
+    @outputCountAttr.setter
+    def outputCountAttr(self, value):
+        self._outputCountAttr = value
+
+    @property
+    def staticColumnFamily(self):
+        """
+            str: If this parameter is specified, it will be used as the columnFamily for all operations. It can have cardinality greater than one. 
+        """
+        return self._staticColumnFamily
+
+    @staticColumnFamily.setter
+    def staticColumnFamily(self, value):
+        self._staticColumnFamily = value
+
+    @property
+    def staticColumnQualifier(self):
+        """
+            str: If this parameter is specified, it will be used as the columnQualifier for all tuples. It can be specified multiple times. 
+        """
+        return self._staticColumnQualifier
+    
+    @staticColumnQualifier.setter
+    def staticColumnQualifier(self, value):
+        self._staticColumnQualifier = value
+
+    @property
+    def tableName(self):
+        """
+            str: Name of the HBASE table. It is an optional parameter but one of these parameters must be set in opeartor: 'tableName' or 'tableNameAttribute'. Cannot be used with 'tableNameAttribute'. If the table does not exist, the operator will throw an exception. 
+        """
+        return self._tableName
+
+    @tableName.setter
+    def tableName(self, value):
+        self._tableName = value
+
+    @property
+    def tableNameAttribute(self):
+        """
+            str: Name of the attribute on the input tuple containing the tableName. Use this parameter to pass the table name to the operator via input port. Cannot be used with parameter 'tableName'. This is suitable for tables with the same schema. 
+        """
+        return self._tableNameAttribute
+
+    @tableNameAttribute.setter
+    def tableNameAttribute(self, value):
+        self._tableNameAttribute = value
+
+    @property
+    def vmArg(self):
+        """
+            str: The optional parameter vmArg parameter to specify additional JVM arguments that are required by the specific invocation of the operator. 
+        """
+        return self._vmArg
+
+    @vmArg.setter
+    def vmArg(self, value):
+        self._vmArg = value
+
+    @property
+    def fuseWithHBaseOperators(self):
+        """
+            bool: If True, the HBASEScan operator is fused with the other HBase operators of the topology that set fuseWithHBaseOperators, see :ref:`fused-operators`. Defaults to False.
+        """
+        return self._fuseWithHBaseOperators
+
+    @fuseWithHBaseOperators.setter
+    def fuseWithHBaseOperators(self, value):
+        self._fuseWithHBaseOperators = value
+
+    def populate(self, topology, stream, schema, name, **options):
+
+        max_threads = self.maxThreads
+        if max_threads is not None:
+            max_threads = streamsx.spl.types.int32(max_threads)
+        max_versions = self.maxVersions
+        if max_versions is not None:
+            max_versions = streamsx.spl.types.int32(max_versions)
+        min_timestamp = self.minTimestamp
+        if min_timestamp is not None:
+            min_timestamp = streamsx.spl.types.int64(min_timestamp)
+
+        # check streamsx.hbase version
+        _add_toolkit_dependency(topology)
+
+        hbaseSite = _generate_hbase_site_xml(topology, self.connection)
+        if (hbaseSite):
+            _op = _HBASEScan(topology=topology, \
+                        stream=stream, \
+                        schema=self.schema, \
+                        authKeytab=self.authKeytab, \
+                        authPrincipal=self.authPrincipal, \
+                        hbaseSite=hbaseSite, \
+                        maxThreads=max_threads, \
+                        maxVersions=max_versions, \
+                        minTimestamp=min_timestamp, \
+                        outAttrName=self.outAttrName, \
+                        outputCountAttr=self.outputCountAttr, \
+                        staticColumnFamily=self.staticColumnFamily, \
+                        staticColumnQualifier=self.staticColumnQualifier, \
+                        tableName=self.tableName, \
+                        tableNameAttribute=self.tableNameAttribute, \
+                        vmArg=self.vmArg, \
+                        name=name)
+            if self.fuseWithHBaseOperators:
+                _fuse_with_hbase_operators(topology, _op, self.connection, self.authPrincipal, self.vmArg)
+
+            return _op.outputs[0]
+        else:
+            return None
+
+
+class _ArrowFileWriter(object):
+    # Pivots the scan output into columnar Arrow record batches and writes them into Parquet or Arrow files.
+    # The memory is bounded by the batch size, a file is completed after rows_per_file rows.
+    def __init__(self, directory, file_format, columns, batch_size, rows_per_file):
+        self.directory = directory
+        self.file_format = file_format
+        self.columns = columns
+        self.batch_size = batch_size
+        self.rows_per_file = rows_per_file
+
+    def __enter__(self):
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("The package pyarrow is required to export HBase scans: pip install pyarrow")
+        self._pa = pyarrow
+        if self.columns:
+            fields = [pyarrow.field(column, pyarrow.string()) for column in self.columns]
+        else:
+            fields = [pyarrow.field('cells', pyarrow.map_(pyarrow.string(), pyarrow.string()))]
+        self._schema = pyarrow.schema([pyarrow.field('row', pyarrow.string())] + fields)
+        self._prefix = 'hbase-scan-' + str(os.getpid())
+        if streamsx.ec.is_active():
+            self._prefix = self._prefix + '-' + str(streamsx.ec.channel(self))
+        self._file_number = 0
+        self._writer = None
+        self._rows = []
+        self._current_row = None
+        self._current_cells = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __call__(self, tuple_):
+        value = tuple_.get('value')
+        if 'columnQualifier' in tuple_:
+            # one tuple per cell, the cells of a row are submitted one after the other
+            if tuple_['row'] != self._current_row:
+                self._add_current_row()
+                self._current_row = tuple_['row']
+            self._current_cells[tuple_['columnFamily'] + ':' + tuple_['columnQualifier']] = value
+        else:
+            # row mode, the value is a map of families to maps of qualifiers or a map of qualifiers
+            self._add_current_row()
+            self._current_row = tuple_['row']
+            for key, cell in value.items():
+                if isinstance(cell, dict):
+                    for qualifier, cell_value in cell.items():
+                        self._current_cells[key + ':' + qualifier] = cell_value
+                else:
+                    self._current_cells[key] = cell
+            self._add_current_row()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # the current file is incomplete, it is not published
+            self._discard_file()
+            return
+        self._add_current_row()
+        self._write_batch()
+        self._close_file()
+
+    def _add_current_row(self):
+        if self._current_row is not None:
+            self._rows.append((self._current_row, self._current_cells))
+            self._current_row = None
+            self._current_cells = {}
+            if len(self._rows) >= self.batch_size:
+                self._write_batch()
+
+    def _write_batch(self):
+        if not self._rows:
+            return
+        pa = self._pa
+        arrays = [pa.array([row for row, cells in self._rows], pa.string())]
+        if self.columns:
+            for column in self.columns:
+                arrays.append(pa.array([cells.get(column) for row, cells in self._rows], pa.string()))
+        else:
+            arrays.append(pa.array([list(cells.items()) for row, cells in self._rows], self._schema.field('cells').type))
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+        self._rows = []
+
+        if self._writer is None:
+            self._open_file()
+        if self.file_format == 'parquet':
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self._file_rows += batch.num_rows
+        if self._file_rows >= self.rows_per_file:
+            self._close_file()
+
+    def _open_file(self):
+        self._file_number += 1
+        self._file_name = os.path.join(self.directory, self._prefix + '-' + str(self._file_number) + '.' + self.file_format)
+        # the file is written with a temporary name, readers see completed files only
+        if self.file_format == 'parquet':
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(self._file_name + '.tmp', self._schema)
+        else:
+            self._writer = self._pa.ipc.new_file(self._file_name + '.tmp', self._schema)
+        self._file_rows = 0
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._file_name + '.tmp', self._file_name)
+
+    def _discard_file(self):
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            finally:
+                self._writer = None
+                if os.path.exists(self._file_name + '.tmp'):
+                    os.remove(self._file_name + '.tmp')
+
+
+class HBaseScanExport(streamsx.topology.composite.ForEach):
+    """
+    HBaseScanExport writes the output of a :py:class:`HBaseScan` into columnar files for batch analytics.
+
+    The cells of the scanned rows are pivoted into Arrow record batches with one column per cell and written as Parquet files,
+    or as Arrow IPC files that can be memory-mapped by the readers. The memory is bounded by ``batchSize`` rows.
+    The rows and cells to export are selected with the parameters of HBaseScan, for example ``startRow``, ``endRow``, ``rowPrefix``, ``staticColumnFamily`` or ``staticColumnQualifier``.
+    The scan can use the default per cell output schema or the row mode.
+
+    This composite requires the package ``pyarrow`` at runtime.
+
+    Example, exports the location column family of the table 'streamsSample_lotr'::
+
+        import streamsx.hbase as hbase
+
+        options = {
+          'staticColumnFamily' : 'location',
+          'rowMode' : True
+        }
+        scanned_rows = topo.source(hbase.HBaseScan(tableName='streamsSample_lotr', **options))
+        scanned_rows.for_each(hbase.HBaseScanExport(directory='/data/export/lotr', columns=['beginTwoTowers', 'endTwoTowers']))
+
+    Attributes
+    ----------
+    directory : str
+        Directory on the hosts of the processing elements to write the files to.
+    options : kwargs
+        The additional optional parameters as variable keyword arguments.
+    """
+
+    def __init__(self, directory, **options):
+        self.directory = directory
+        self.fileFormat = 'parquet'
+        self.columns = None
+        self.batchSize = 10000
+        self.rowsPerFile = 1000000
+
+        if 'fileFormat' in options:
+            self.fileFormat = options.get('fileFormat')
+        if 'columns' in options:
+            self.columns = options.get('columns')
+        if 'batchSize' in options:
+            self.batchSize = options.get('batchSize')
+        if 'rowsPerFile' in options:
+            self.rowsPerFile = options.get('rowsPerFile')
+
+    @property
+    def fileFormat(self):
+        """
+            str: The format of the files, 'parquet' or 'arrow' (Arrow IPC file format). Defaults to 'parquet'.
+        """
+        return self._fileFormat
+
+    @fileFormat.setter
+    def fileFormat(self, value):
+        self._fileFormat = value
+
+    @property
+    def columns(self):
+        """
+            list: Names of the exported columns. A column name is 'family:qualifier', or the qualifier in row mode with one static column family. Each column is a string column, cells of other columns are not exported. If not set, the cells of a row are exported in the map column 'cells'. Every file contains the string column 'row' with the row key.
+        """
+        return self._columns
+
+    @columns.setter
+    def columns(self, value):
+        self._columns = value
+
+    @property
+    def batchSize(self):
+        """
+            int: Number of rows of an Arrow record batch. Defaults to 10000.
+        """
+        return self._batchSize
+
+    @batchSize.setter
+    def batchSize(self, value):
+        self._batchSize = value
+
+    @property
+    def rowsPerFile(self):
+        """
+            int: Number of rows after which a file is completed and a new file is started. Defaults to 1000000. A file is also completed when the processing element stops.
+        """
+        return self._rowsPerFile
+
+    @rowsPerFile.setter
+    def rowsPerFile(self, value):
+        self._rowsPerFile = value
+
+    def populate(self, topology, stream, name, **options):
+        if self.fileFormat not in ('parquet', 'arrow'):
+            raise ValueError("Invalid fileFormat value. Valid values are: parquet, arrow")
+        for value, parameter_name in ((self.batchSize, 'batchSize'), (self.rowsPerFile, 'rowsPerFile')):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError("Invalid " + parameter_name + " value. Value must be at least one.")
+        columns = list(self.columns) if self.columns is not None else None
+
+        writer = _ArrowFileWriter(self.directory, self.fileFormat, columns, self.batchSize, self.rowsPerFile)
+        return stream.for_each(writer, name=name if name is not None else 'HBaseScanExport')
+
+
+
+
+class HBaseHotKeys(streamsx.topology.composite.Map):
+    """
+    HBaseHotKeys reports the hot row keys of a stream of HBase requests, for example the input stream of :py:class:`HBasePut` or :py:class:`HBaseGet`.
+
+    The row keys and optionally the row key prefixes are counted with a heavy hitters summary (Space-Saving) with bounded memory.
+    After each interval the top keys of the interval are submitted with the schema :py:const:`HBASEHotKeySchema`, the summary is reset then.
+    There is no timer, the keys are reported when the first request after the end of the interval arrives. An idle stream reports nothing,
+    the keys of the last interval before an idle period are reported with the next request and their rates are averaged over the idle period too.
+
+    Example, reports the 10 hottest row keys and salt prefixes of the puts every minute::
+
+        import streamsx.hbase as hbase
+
+        hot_keys = events.map(hbase.HBaseHotKeys(rowAttrName='who', topK=10, prefixLength=2, interval=60.0))
+        events.map(hbase.HBasePut(tableName='events', rowAttrName='who', valueAttrName='value'))
+
+    Attributes
+    ----------
+    rowAttrName : str
+        Name of the attribute on the input tuple containing the row.
+    options : kwargs
+        The additional optional parameters as variable keyword arguments.
+
+    .. versionadded:: 1.6
+    """
+
+    def __init__(self, rowAttrName, **options):
+        self.rowAttrName = rowAttrName
+        self.topK = 10
+        self.prefixLength = None
+        self.interval = 60.0
+
+        if 'topK' in options:
+            self.topK = options.get('topK')
+        if 'prefixLength' in options:
+            self.prefixLength = options.get('prefixLength')
+        if 'interval' in options:
+            self.interval = options.get('interval')
+
+    @property
+    def topK(self):
+        """
+            int: The number of hot keys that are reported. Defaults to 10.
+        """
+        return self._topK
+
+    @topK.setter
+    def topK(self, value):
+        self._topK = value
+
+    @property
+    def prefixLength(self):
+        """
+            int: The length of the row key prefixes that are reported in addition to the row keys, for example the length of a salt or tenant prefix. Defaults to None, no prefixes are reported.
+        """
+        return self._prefixLength
+
+    @prefixLength.setter
+    def prefixLength(self, value):
+        self._prefixLength = value
+
+    @property
+    def interval(self):
+        """
+            float: The interval in seconds. Defaults to 60 seconds.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, value):
+        self._interval = value
+
+    def populate(self, topology, stream, schema, name, **options):
+        if not isinstance(self.topK, int) or self.topK < 1:
+            raise ValueError("Invalid topK value. Value must be at least one.")
+        if self.prefixLength is not None and (not isinstance(self.prefixLength, int) or self.prefixLength < 1):
+            raise ValueError("Invalid prefixLength value. Value must be at least one.")
+        interval = _check_duration_param(self.interval, 'interval')
+        hot_keys = stream.flat_map(_HotKeys(self.rowAttrName, self.topK, self.prefixLength, interval, True), name=name if name is not None else 'HBaseHotKeys')
+        return hot_keys.map(None, schema=HBASEHotKeySchema)
+
+
+class _RowKeySample(object):
+    # Reservoir sample of the row keys, the sample file is replaced periodically and when the processing element stops.
+    def __init__(self, sample_file, row_attr, sample_size, interval):
+        self.sample_file = sample_file
+        self.row_attr = row_attr
+        self.sample_size = sample_size
+        self.interval = interval
+
+    def __enter__(self):
+        self._rnd = random.Random()
+        self._sample = []
+        self._count = 0
+        self._written = time.time()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._write()
+
+    def __call__(self, tuple_):
+        self._count += 1
+        if len(self._sample) < self.sample_size:
+            self._sample.append(str(tuple_[self.row_attr]))
+        else:
+            i = self._rnd.randrange(self._count)
+            if i < self.sample_size:
+                self._sample[i] = str(tuple_[self.row_attr])
+        if time.time() - self._written >= self.interval:
+            self._write()
+
+    def _write(self):
+        self._written = time.time()
+        directory = os.path.dirname(self.sample_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.sample_file + '.tmp', 'w', encoding='utf-8') as f:
+            for key in sorted(self._sample):
+                f.write(key + '\n')
+        os.replace(self.sample_file + '.tmp', self.sample_file)
+
+
+class HBaseRowKeySample(streamsx.topology.composite.ForEach):
+    """
+    HBaseRowKeySample writes a uniform random sample of the row keys of a stream into a file, one row key per line.
+
+    Use the sample of the expected row keys to compute the split points of a new table with :py:func:`compute_split_points`.
+    The file is replaced every ``interval`` seconds and when the processing element stops.
+
+    Example, samples the row keys of an event stream::
+
+        import streamsx.hbase as hbase
+
+        events.for_each(hbase.HBaseRowKeySample(sampleFile='/tmp/row_keys.txt', rowAttrName='who', sampleSize=10000))
+
+    Attributes
+    ----------
+    sampleFile : str
+        The file on the host of the processing element.
+    rowAttrName : str
+        Name of the attribute on the input tuple containing the row.
+    options : kwargs
+        The additional optional parameters as variable keyword arguments.
+
+    .. versionadded:: 1.6
+    """
+
+    def __init__(self, sampleFile, rowAttrName, **options):
+        self.sampleFile = sampleFile
+        self.rowAttrName = rowAttrName
+        self.sampleSize = 10000
+        self.interval = 60.0
+
+        if 'sampleSize' in options:
+            self.sampleSize = options.get('sampleSize')
+        if 'interval' in options:
+            self.interval = options.get('interval')
+
+    @property
+    def sampleSize(self):
+        """
+            int: The number of row keys in the sample. Defaults to 10000.
+        """
+        return self._sampleSize
+
+    @sampleSize.setter
+    def sampleSize(self, value):
+        self._sampleSize = value
+
+    @property
+    def interval(self):
+        """
+            float: The interval in seconds between the writes of the sample file. Defaults to 60 seconds.
+        """
+        return self._interval
+
+    @interval.setter
+    def interval(self, value):
+        self._interval = value
+
+    def populate(self, topology, stream, name, **options):
+        if not isinstance(self.sampleSize, int) or self.sampleSize < 1:
+            raise ValueError("Invalid sampleSize value. Value must be at least one.")
+        interval = _check_duration_param(self.interval, 'interval')
+        sampler = _RowKeySample(self.sampleFile, self.rowAttrName, self.sampleSize, interval)
+        return stream.for_each(sampler, name=name if name is not None else 'HBaseRowKeySample')
+
+
+class _UnknownOperation(object):
+    # Sink of the tuples of HBaseMutate with an unknown operation, the tuples are counted, logged and dropped
+    def __init__(self, op_attr, row_attr):
+        self.op_attr = op_attr
+        self.row_attr = row_attr
+
+    def __enter__(self):
+        self._metric = None
+        if streamsx.ec.is_active():
+            self._metric = streamsx.ec.CustomMetric(self, name='nUnknownOperations', kind='Counter',
+                description='Number of dropped tuples with an unknown operation.')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_metric', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __call__(self, tuple_):
+        logging.getLogger(__name__).warning("Unknown operation '" + str(tuple_[self.op_attr]) + "' of row '" + str(tuple_[self.row_attr]) +
+            "' dropped, valid operations are 'put', 'delete' and 'increment'.")
+        if self._metric is not None:
+            self._metric += 1
+
+
+class HBaseMutate(streamsx.topology.composite.Map):
+    """
+    HBaseMutate applies puts, deletes and increments to an HBase table, the operation of a tuple is given by an attribute of the tuple.
+
+    HBaseMutate is a router only: the tuples are routed by their operation with the SPL Split operator to the HBASEPut, HBASEDelete and HBASEIncrement operators. The operators are fused into one
+    processing element and run in one JVM. A tuple is processed completely before the next tuple, so the mutations of a row are applied
+    in the order of the input tuples, even if the operations of a row are mixed.
+
+    The order has a cost: every mutation is sent with its own RPC, the mutations are neither batched by region nor buffered. The throughput is
+    one mutation per round trip to the region server, typically an order of magnitude lower than the throughput of :py:class:`HBasePut`
+    with ``batchSize`` or ``enableBuffer``. Use HBaseMutate for mixed operations whose order matters and HBasePut for bulk puts.
+
+    A tuple with another operation than 'put', 'delete' or 'increment' is logged and dropped, the dropped tuples are counted by the metric
+    ``nUnknownOperations`` of the operator ``HBaseMutateUnknown``, see :py:func:`operator_metrics`.
+
+    The output tuples of the puts and deletes are submitted with the output schema, increments have no output tuples.
+
+    Example, applies the puts, deletes and increments of a change stream::
+
+        import streamsx.hbase as hbase
+
+        changes_schema = StreamSchema('tuple<rstring op, rstring who, rstring value, int64 count>')
+        changes.map(hbase.HBaseMutate(tableName='users', rowAttrName='who', opAttrName='op', valueAttrName='value', incrementAttrName='count',
+                                      staticColumnFamily='info', staticColumnQualifier='visits'))
+
+    Attributes
+    ----------
+    tableName : str
+        Name of the HBASE table.
+    rowAttrName : str
+        Name of the attribute on the input tuple containing the row.
+    opAttrName : str
+        Name of the rstring attribute on the input tuple containing the operation: 'put', 'delete' or 'increment'. Tuples with other operations are dropped.
+    connection : dict|str
+        Specify the connection to HBASE either with a filename of a HBase configuration file or as string in format "HOST:PORT" or as dict containing the properties 'host' and 'port'. If not specified the environment variables ``HADOOP_HOST_PORT`` or ``HBASE_SITE_XML`` are used.
+    schema : StreamSchema
+        Output schema, defaults to CommonSchema.String
+    options : kwargs
+        The additional optional parameters as variable keyword arguments.
+
+    .. versionadded:: 1.6
+    """
+
+    def __init__(self, tableName, rowAttrName, opAttrName, connection=None, schema=CommonSchema.String, **options):
+        self.tableName = tableName
+        self.rowAttrName = rowAttrName
+        self.opAttrName = opAttrName
+        self.connection = connection
+        self.schema = schema
+        self.valueAttrName = None
+        self.incrementAttrName = None
+        self.increment = None
+        self.authKeytab = None
+        self.authPrincipal = None
+        self.columnFamilyAttrName = None
+        self.columnQualifierAttrName = None
+        self.staticColumnFamily = None
+        self.staticColumnQualifier = None
+        self.deleteAllVersions = None
+        self.successAttr = None
+        self.vmArg = None
+        self.metrics = False
+        self.fuseWithHBaseOperators = False
+
+        if 'valueAttrName' in options:
+            self.valueAttrName = options.get('valueAttrName')
+        if 'incrementAttrName' in options:
+            self.incrementAttrName = options.get('incrementAttrName')
+        if 'increment' in options:
+            self.increment = options.get('increment')
+        if 'authKeytab' in options:
+            self.authKeytab = options.get('authKeytab')
+        if 'authPrincipal' in options:
+            self.authPrincipal = options.get('authPrincipal')
+        if 'columnFamilyAttrName' in options:
+            self.columnFamilyAttrName = options.get('columnFamilyAttrName')
+        if 'columnQualifierAttrName' in options:
+            self.columnQualifierAttrName = options.get('columnQualifierAttrName')
+        if 'staticColumnFamily' in options:
+            self.staticColumnFamily = options.get('staticColumnFamily')
+        if 'staticColumnQualifier' in options:
+            self.staticColumnQualifier = options.get('staticColumnQualifier')
+        if 'deleteAllVersions' in options:
+            self.deleteAllVersions = options.get('deleteAllVersions')
+        if 'successAttr' in options:
+            self.successAttr = options.get('successAttr')
+        if 'vmArg' in options:
+            self.vmArg = options.get('vmArg')
+        if 'metrics' in options:
+            self.metrics = options.get('metrics')
+        if 'fuseWithHBaseOperators' in options:
+            self.fuseWithHBaseOperators = options.get('fuseWithHBaseOperators')
+
+    @property
+    def valueAttrName(self):
+        """
+            str: Name of the attribute on the input tuple containing the value of a put. It is required.
+        """
+        return self._valueAttrName
+
+    @valueAttrName.setter
+    def valueAttrName(self, value):
+        self._valueAttrName = value
+
+    @property
+    def incrementAttrName(self):
+        """
+            str: Name of the int64 attribute on the input tuple containing the value of an increment. Cannot be used with increment.
+        """
+        return self._incrementAttrName
+
+    @incrementAttrName.setter
+    def incrementAttrName(self, value):
+        self._incrementAttrName = value
+
+    @property
+    def increment(self):
+        """
+            int: The value of all increments. Cannot be used with incrementAttrName. If neither is specified, the cells are incremented by one.
+        """
+        return self._increment
+
+    @increment.setter
+    def increment(self, value):
+        self._increment = value
+
+    @property
+    def authKeytab(self):
+        """
+            str: The optional parameter authKeytab specifies the file that contains the encrypted keys for the user that is specified by the authPrincipal parameter. The operators use this keytab file to authenticate the user.
+        """
+        return self._authKeytab
+
+    @authKeytab.setter
+    def authKeytab(self, value):
+        self._authKeytab = value
+
+    @property
+    def authPrincipal(self):
+        """
+            str: The optional parameter authPrincipal specifies the Kerberos principal that you use for authentication.
+        """
+        return self._authPrincipal
+
+    @authPrincipal.setter
+    def authPrincipal(self, value):
+        self._authPrincipal = value
+
+    @property
+    def columnFamilyAttrName(self):
+        """
+            str: Name of the attribute on the input tuple containing the columnFamily. Cannot be used with staticColumnFamily.
+        """
+        return self._columnFamilyAttrName
+
+    @columnFamilyAttrName.setter
+    def columnFamilyAttrName(self, value):
+        self._columnFamilyAttrName = value
+
+    @property
+    def columnQualifierAttrName(self):
+        """
+            str: Name of the attribute on the input tuple containing the columnQualifier. Cannot be used with staticColumnQualifier.
+        """
+        return self._columnQualifierAttrName
+
+    @columnQualifierAttrName.setter
+    def columnQualifierAttrName(self, value):
+        self._columnQualifierAttrName = value
+
+    @property
+    def staticColumnFamily(self):
+        """
+            str: The columnFamily of all mutations. Cannot be used with columnFamilyAttrName.
+        """
+        return self._staticColumnFamily
+
+    @staticColumnFamily.setter
+    def staticColumnFamily(self, value):
+        self._staticColumnFamily = value
+
+    @property
+    def staticColumnQualifier(self):
+        """
+            str: The columnQualifier of all mutations. Cannot be used with columnQualifierAttrName.
+        """
+        return self._staticColumnQualifier
+
+    @staticColumnQualifier.setter
+    def staticColumnQualifier(self, value):
+        self._staticColumnQualifier = value
+
+    @property
+    def deleteAllVersions(self):
+        """
+            bool: If True, a delete removes all versions of the cell, otherwise the latest version only.
+        """
+        return self._deleteAllVersions
+
+    @deleteAllVersions.setter
+    def deleteAllVersions(self, value):
+        self._deleteAllVersions = value
+
+    @property
+    def successAttr(self):
+        """
+            str: Attribute on the output port to be set to true if the put or delete is successful.
+        """
+        return self._successAttr
+
+    @successAttr.setter
+    def successAttr(self, value):
+        self._successAttr = value
+
+    @property
+    def vmArg(self):
+        """
+            str: The optional parameter vmArg parameter to specify additional JVM arguments that are required by the specific invocation of the operators.
+        """
+        return self._vmArg
+
+    @vmArg.setter
+    def vmArg(self, value):
+        self._vmArg = value
+
+    @property
+    def metrics(self):
+        """
+            bool: The optional parameter metrics adds probes to the operators that publish custom metrics for each operation: the number of put, delete and increment requests and the bytes out, the number of put and delete results, failures (with successAttr) and the bytes in. Increments have no results. See :ref:`fused-operators`. Defaults to False.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, value):
+        self._metrics = value
+
+    @property
+    def fuseWithHBaseOperators(self):
+        """
+            bool: If True, the operators are fused with the other HBase operators of the topology that set fuseWithHBaseOperators, see :ref:`fused-operators`. Defaults to False.
+        """
+        return self._fuseWithHBaseOperators
+
+    @fuseWithHBaseOperators.setter
+    def fuseWithHBaseOperators(self, value):
+        self._fuseWithHBaseOperators = value
+
+    def populate(self, topology, stream, schema, name, **options):
+        if self.valueAttrName is None:
+            raise ValueError("valueAttrName is required.")
+        if self.increment is not None and self.incrementAttrName is not None:
+            raise ValueError("Only one of increment and incrementAttrName can be specified.")
+        increment = streamsx.spl.types.int64(self.increment) if self.increment is not None else None
+        deleteAllVersions = None
+        if self.deleteAllVersions is not None:
+            deleteAllVersions = streamsx.spl.op.Expression.expression('true' if self.deleteAllVersions else 'false')
+
+        # check streamsx.hbase version
+        _add_toolkit_dependency(topology)
+
+        hbaseSite = _generate_hbase_site_xml(topology, self.connection)
+        if (hbaseSite):
+            cells = {'authKeytab': self.authKeytab, 'authPrincipal': self.authPrincipal, 'columnFamilyAttrName': self.columnFamilyAttrName,
+                     'columnQualifierAttrName': self.columnQualifierAttrName, 'hbaseSite': hbaseSite, 'staticColumnFamily': self.staticColumnFamily,
+                     'staticColumnQualifier': self.staticColumnQualifier, 'tableName': self.tableName, 'vmArg': self.vmArg}
+            # the Split operator is fused with the HBase operators, a tuple is processed by its operator before the next tuple is routed
+            op = self.opAttrName
+            index = op + ' == "put" ? 0l : ' + op + ' == "delete" ? 1l : ' + op + ' == "increment" ? 2l : 3l'
+            _split = streamsx.spl.op.Invoke(topology, 'spl.utility::Split', inputs=stream, schemas=[stream.oport.schema] * 4,
+                                            params={'index': streamsx.spl.op.Expression.expression(index)}, name='HBaseMutateRoute')
+            puts, deletes, increments, unknown = _split.outputs
+            unknown_ops = unknown.for_each(_UnknownOperation(self.opAttrName, self.rowAttrName), name='HBaseMutateUnknown')
+            if self.metrics:
+                puts = puts.filter(_HBaseMetrics(None, 'request'), name='HBaseMetricsPutRequest')
+                deletes = deletes.filter(_HBaseMetrics(None, 'request'), name='HBaseMetricsDeleteRequest')
+                increments = increments.filter(_HBaseMetrics(None, 'request'), name='HBaseMetricsIncrementRequest')
+            _put = _HBASEPut(stream=puts, schema=self.schema, rowAttrName=self.rowAttrName, valueAttrName=self.valueAttrName,
+                             successAttr=self.successAttr, name='HBaseMutatePut', **cells)
+            _delete = _HBASEDelete(stream=deletes, schema=self.schema, rowAttrName=self.rowAttrName, deleteAllVersions=deleteAllVersions,
+                                   successAttr=self.successAttr, name='HBaseMutateDelete', **cells)
+            _increment = _HBASEIncrement(stream=increments, rowAttrName=self.rowAttrName, increment=increment,
+                                         incrementAttrName=self.incrementAttrName, name='HBaseMutateIncrement', **cells)
+            put_results = _put.outputs[0]
+            delete_results = _delete.outputs[0]
+            if self.metrics:
+                put_results = put_results.filter(_HBaseMetrics(None, 'response', success_attr=self.successAttr), name='HBaseMetricsPutResponse')
+                delete_results = delete_results.filter(_HBaseMetrics(None, 'response', success_attr=self.successAttr), name='HBaseMetricsDeleteResponse')
+            result = _union([put_results, delete_results], self.schema, name if name is not None else 'HBaseMutate')
+            _put.colocate([puts, deletes, increments, unknown_ops, put_results, _delete.outputs[0], delete_results, result])
+            _increment.colocate(puts)
+            if self.fuseWithHBaseOperators:
+                _fuse_with_hbase_operators(topology, _put, self.connection, self.authPrincipal, self.vmArg)
+            return result
+        else:
+            return None
+
+
+# YCSB core workloads: operation proportions and request distribution
+_WORKLOADS = {
+    'A': ({'read': 0.5, 'update': 0.5}, 'zipfian'),
+    'B': ({'read': 0.95, 'update': 0.05}, 'zipfian'),
+    'C': ({'read': 1.0}, 'zipfian'),
+    'D': ({'read': 0.95, 'insert': 0.05}, 'latest'),
+    'E': ({'scan': 0.95, 'insert': 0.05}, 'zipfian'),
+    'F': ({'read': 0.5, 'readmodifywrite': 0.5}, 'zipfian'),
+}
+
+_WorkloadRequestSchema = StreamSchema('tuple<rstring op, int64 opId, float64 startTime, rstring row, rstring value, rstring startRow, rstring endRow>')
+_WorkloadResultSchema = StreamSchema('tuple<rstring op, int64 opId, float64 startTime, rstring row, boolean success>')
+
+# runtime state of the workloads by workload id, shared by the fused generator, insert acknowledgements and scan completions
+_workload_states = dict()
+
+
+def _workload_state(workload_id, record_count):
+    # readable is the number of keys that are written, the keys user0 .. user<readable - 1>
+    return _workload_states.setdefault(workload_id, {'lock': threading.Lock(), 'readable': record_count, 'acknowledged': set(),
+                                                     'scans': collections.deque(), 'scan_count': None, 'scans_completed': 0, 'markers': queue.Queue()})
+
+
+def _fnv_hash(value):
+    # FNV-1a 64 bit, scrambles the zipfian popular keys over the key space
+    h = 0xcbf29ce484222325
+    for i in range(8):
+        h = ((h ^ ((value >> (i * 8)) & 0xff)) * 0x100000001b3) & 0xffffffffffffffff
+    return h
+
+
+class _ZipfianGenerator(object):
+    # Zipfian distribution of the items 0 .. item_count - 1 (Gray et al., Quickly Generating Billion-Record Synthetic Databases)
+    def __init__(self, item_count, rnd, theta=0.99):
+        self.item_count = item_count
+        self.rnd = rnd
+        self.theta = theta
+        self.zetan = sum(1.0 / (i + 1) ** theta for i in range(item_count))
+        self.alpha = 1.0 / (1.0 - theta)
+        zeta2 = 1.0 + 0.5 ** theta
+        self.eta = (1.0 - (2.0 / item_count) ** (1.0 - theta)) / (1.0 - zeta2 / self.zetan)
+
+    def next(self):
+        u = self.rnd.random()
+        uz = u * self.zetan
+        if uz < 1.0:
+            return 0
+        if uz < 1.0 + 0.5 ** self.theta:
+            return 1
+        return min(self.item_count - 1, int(self.item_count * (self.eta * u - self.eta + 1.0) ** self.alpha))
+
+
+class _WorkloadGenerator(object):
+    # Iterable of the requests of a workload, the source of HBaseWorkload.
+    # The records are inserted in key order, so that a scan of n records is the key range of n consecutive keys.
+    # The requested keys are chosen from the written keys, the inserts of the workload are readable when they are acknowledged.
+    def __init__(self, workload_id, proportions, distribution, record_count, operation_count, record_size, max_scan_length, target_throughput, seed, load):
+        self.workload_id = workload_id
+        self.proportions = proportions
+        self.distribution = distribution
+        self.record_count = record_count
+        self.operation_count = operation_count
+        self.record_size = record_size
+        self.max_scan_length = max_scan_length
+        self.target_throughput = target_throughput
+        self.seed = seed
+        self.load = load
+
+    @staticmethod
+    def _key(index):
+        return 'user' + str(index).zfill(12)
+
+    def __iter__(self):
+        rnd = random.Random(self.seed)
+        zipfian = _ZipfianGenerator(self.record_count, rnd) if self.distribution != 'uniform' else None
+        operations = sorted(self.proportions.items())
+        state = _workload_state(self.workload_id, self.record_count)
+        inserted = self.record_count
+        scan_count = 0
+        start = time.time()
+        for op_id in range(self.record_count if self.load else self.operation_count):
+            if self.target_throughput:
+                delay = start + op_id / float(self.target_throughput) - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+            value = ''
+            start_row = ''
+            end_row = ''
+            if self.load:
+                op = 'insert'
+                row = self._key(op_id)
+            else:
+                choice = rnd.random()
+                for op, proportion in operations:
+                    choice -= proportion
+                    if choice < 0:
+                        break
+                if op == 'insert':
+                    row = self._key(inserted)
+                    inserted += 1
+                else:
+                    readable = state['readable']
+                    if self.distribution == 'uniform':
+                        index = rnd.randrange(readable)
+                    elif self.distribution == 'latest':
+                        index = max(0, readable - 1 - zipfian.next())
+                    else:
+                        index = _fnv_hash(zipfian.next()) % readable
+                    row = self._key(index)
+                    if op == 'scan':
+                        scan_count += 1
+                        start_row = row
+                        end_row = self._key(index + rnd.randint(1, self.max_scan_length))
+            if op in ('insert', 'update', 'readmodifywrite'):
+                value = ''.join(rnd.choice('abcdefghijklmnopqrstuvwxyz0123456789') for i in range(self.record_size))
+            yield {'op': op, 'opId': op_id, 'startTime': time.time(), 'row': row, 'value': value, 'startRow': start_row, 'endRow': end_row}
+        with state['lock']:
+            state['scan_count'] = scan_count
+            if state['scans_completed'] == scan_count:
+                state['markers'].put(None)
+
+
+class _InsertAcknowledgements(object):
+    # Filter on the results of the puts, the keys of the acknowledged inserts become readable for the generator
+    # up to the first insert that is not acknowledged (YCSB acknowledged counter).
+    def __init__(self, workload_id, record_count):
+        self.workload_id = workload_id
+        self.record_count = record_count
+
+    def __call__(self, tuple_):
+        if tuple_['op'] == 'insert' and tuple_['success']:
+            state = _workload_state(self.workload_id, self.record_count)
+            with state['lock']:
+                state['acknowledged'].add(int(tuple_['row'][4:]))
+                while state['readable'] in state['acknowledged']:
+                    state['acknowledged'].remove(state['readable'])
+                    state['readable'] += 1
+        return True
+
+
+class _ScanRequests(object):
+    # Filter on the scan requests, the scans are completed in the order of the requests.
+    def __init__(self, workload_id, record_count):
+        self.workload_id = workload_id
+        self.record_count = record_count
+
+    def __call__(self, tuple_):
+        _workload_state(self.workload_id, self.record_count)['scans'].append((tuple_['opId'], tuple_['startTime']))
+        return True
+
+
+class _ScanCompletions(object):
+    # Sink of the scanned rows, the window punctuation after the rows of a scan completes the scan, also an empty scan.
+    # The completion markers are submitted by the source _ScanMarkers.
+    def __init__(self, workload_id, record_count):
+        self.workload_id = workload_id
+        self.record_count = record_count
+
+    def __call__(self, tuple_):
+        pass
+
+    def on_punct(self):
+        state = _workload_state(self.workload_id, self.record_count)
+        with state['lock']:
+            if not state['scans']:
+                return
+            op_id, start_time = state['scans'].popleft()
+            state['markers'].put({'op': 'scan', 'opId': op_id, 'startTime': start_time, 'row': '', 'success': True})
+            state['scans_completed'] += 1
+            if state['scans_completed'] == state['scan_count']:
+                state['markers'].put(None)
+
+
+class _ScanMarkers(object):
+    # Source of the completion markers of the scans, ends after the last scan of the workload
+    def __init__(self, workload_id, record_count):
+        self.workload_id = workload_id
+        self.record_count = record_count
+
+    def __iter__(self):
+        markers = _workload_state(self.workload_id, self.record_count)['markers']
+        while True:
+            marker = markers.get()
+            if marker is None:
+                return
+            yield marker
+
+
+class _OperationFilter(object):
+    def __init__(self, operations):
+        self.operations = operations
+
+    def __call__(self, tuple_):
+        return tuple_['op'] in self.operations
+
+
+class _OperationResult(object):
+    # Maps the results of the HBase operators to the result schema of the workload.
+    def __call__(self, tuple_):
+        return {'op': tuple_['op'], 'opId': tuple_['opId'], 'startTime': tuple_['startTime'], 'row': tuple_['row'], 'success': tuple_.get('success', True)}
+
+
+class _WriteRequest(object):
+    # Maps the result of the read of a read-modify-write operation to its write request.
+    def __call__(self, tuple_):
+        return dict((name, tuple_[name]) for name in ('op', 'opId', 'startTime', 'row', 'value', 'startRow', 'endRow'))
+
+
+def _union(streams, schema, name):
+    # Stream.union cannot be used in a composite, the streams are merged by the SPL Union operator
+    if len(streams) == 1:
+        return streams[0]
+    _op = streamsx.spl.op.Invoke(streams[0].topology, 'spl.utility::Union', inputs=streams, schemas=schema, name=name)
+    return _op.outputs[0]
+
+
+class _WorkloadSummary(object):
+    # Collects the latencies of the operations and submits the throughput and latency percentiles of each operation type.
+    # Every operation has one result, a scan has the completion marker of the scan.
+    def __init__(self, expected_operations, interval):
+        self.expected_operations = expected_operations
+        self.interval = interval
+
+    def __enter__(self):
+        self._latencies = dict()
+        self._failures = dict()
+        self._start = None
+        self._last_summary = time.time()
+        self._completed = 0
+        self._final = False
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def __call__(self, tuple_):
+        now = time.time()
+        if self._final:
+            return []
+        if self._start is None or tuple_['startTime'] < self._start:
+            self._start = tuple_['startTime']
+        op = tuple_['op']
+        self._latencies.setdefault(op, []).append(now - tuple_['startTime'])
+        self._failures[op] = self._failures.get(op, 0) + (0 if tuple_['success'] else 1)
+        self._completed += 1
+        if self._completed >= self.expected_operations:
+            self._final = True
+        elif now - self._last_summary < self.interval:
+            return []
+        self._last_summary = now
+        return self._summary(now)
+
+    def _summary(self, now):
+        elapsed = max(now - self._start, 0.001)
+        summaries = []
+        all_latencies = []
+        for op in sorted(self._latencies):
+            latencies = sorted(self._latencies[op])
+            all_latencies.extend(latencies)
+            summaries.append(self._op_summary(op, latencies, self._failures[op], elapsed))
+        summaries.append(self._op_summary('OVERALL', sorted(all_latencies), sum(self._failures.values()), elapsed))
+        return summaries
+
+    def _op_summary(self, op, latencies, failures, elapsed):
+        def percentile(q):
+            return latencies[int(q * (len(latencies) - 1))] * 1000.0 if latencies else 0.0
+        return {'operation': op, 'operations': len(latencies), 'failures': failures, 'throughput': len(latencies) / elapsed,
+                'latencyAvgMillis': sum(latencies) * 1000.0 / len(latencies) if latencies else 0.0,
+                'latencyP50Millis': percentile(0.5), 'latencyP95Millis': percentile(0.95), 'latencyP99Millis': percentile(0.99),
+                'final': self._final}
+
+
+class HBaseWorkload(streamsx.topology.composite.Source):
+    """
+    HBaseWorkload generates a YCSB (Yahoo! Cloud Serving Benchmark) core workload for an HBase table and submits throughput and latency summaries.
+
+    The requests of the workload are executed by :py:class:`HBaseGet` (read), :py:class:`HBasePut` (insert, update) and :py:class:`HBaseTriggeredScan` (scan).
+    A read-modify-write operation of workload F is a get followed by a put of the same row.
+
+    ========  ==========================================  ============
+    Workload  Operations                                  Distribution
+    ========  ==========================================  ============
+    A         50% read, 50% update                        zipfian
+    B         95% read, 5% update                         zipfian
+    C         100% read                                   zipfian
+    D         95% read, 5% insert                         latest
+    E         95% scan, 5% insert                         zipfian
+    F         50% read, 50% read-modify-write             zipfian
+    ========  ==========================================  ============
+
+    A record is one cell with the column family ``columnFamily`` and the column qualifier ``field0``, the value has ``recordSize`` characters.
+    Load the table with ``load=True`` before running the workloads, the load inserts ``recordCount`` records with the keys ``user000000000000`` to ``user<recordCount - 1>``.
+    The latency of an operation is the time between the request and its result, the latency of a scan is the time to its last row.
+
+    The reads, updates and scans request the keys of the loaded records and of the inserts that are acknowledged, with every distribution.
+    A scan is complete when the window punctuation after its rows arrives, also a scan without rows. The operators that track the inserts
+    and the scans are fused into one processing element.
+
+    The output stream contains one tuple for each operation type and one tuple for all operations (operation ``OVERALL``) with the schema
+    ``tuple<rstring operation, int64 operations, int64 failures, float64 throughput, float64 latencyAvgMillis, float64 latencyP50Millis, float64 latencyP95Millis, float64 latencyP99Millis, boolean final>``.
+    The throughput is in operations per second. The summaries of the operations since the start of the workload are submitted every ``summaryInterval`` seconds,
+    the last summary has the attribute ``final`` set to true.
+
+    Example, runs workload A on the table 'usertable'::
+
+        import streamsx.hbase as hbase
+
+        topo = Topology()
+        summaries = topo.source(hbase.HBaseWorkload(tableName='usertable', workload='A', recordCount=100000, operationCount=1000000))
+        summaries.print()
+
+    Attributes
+    ----------
+    tableName : str
+        The name of HBase table.
+    workload : str
+        The core workload 'A', 'B', 'C', 'D', 'E' or 'F'.
+    connection : dict|str
+        Specify the connection to HBASE either with a filename of a HBase configuration file or as string in format "HOST:PORT" or as dict containing the properties 'host' and 'port'. If not specified the environment variables ``HADOOP_HOST_PORT`` or ``HBASE_SITE_XML`` are used.
+    options : kwargs
+        The additional optional parameters as variable keyword arguments.
+
+    .. versionadded:: 1.6
+    """
+
+    def __init__(self, tableName, workload='A', connection=None, **options):
+        self.tableName = tableName
+        self.workload = workload
+        self.connection = connection
+        self.load = False
+        self.recordCount = 1000
+        self.operationCount = 1000
+        self.recordSize = 100
+        self.distribution = None
+        self.maxScanLength = 100
+        self.targetThroughput = None
+        self.columnFamily = 'cf'
+        self.summaryInterval = 10.0
+        self.seed = None
+
+        if 'load' in options:
+            self.load = options.get('load')
+        if 'recordCount' in options:
+            self.recordCount = options.get('recordCount')
+        if 'operationCount' in options:
+            self.operationCount = options.get('operationCount')
+        if 'recordSize' in options:
+            self.recordSize = options.get('recordSize')
+        if 'distribution' in options:
+            self.distribution = options.get('distribution')
+        if 'maxScanLength' in options:
+            self.maxScanLength = options.get('maxScanLength')
+        if 'targetThroughput' in options:
+            self.targetThroughput = options.get('targetThroughput')
+        if 'columnFamily' in options:
+            self.columnFamily = options.get('columnFamily')
+        if 'summaryInterval' in options:
+            self.summaryInterval = options.get('summaryInterval')
+        if 'seed' in options:
+            self.seed = options.get('seed')
+
+    @property
+    def load(self):
+        """
+            bool: If True, the records of the table are inserted (YCSB load phase) instead of running the workload. Defaults to False.
+        """
+        return self._load
+
+    @load.setter
+    def load(self, value):
+        self._load = value
+
+    @property
+    def recordCount(self):
+        """
+            int: The number of records in the table when the workload starts. Defaults to 1000.
+        """
+        return self._recordCount
+
+    @recordCount.setter
+    def recordCount(self, value):
+        self._recordCount = value
+
+    @property
+    def operationCount(self):
+        """
+            int: The number of operations of the workload. Defaults to 1000.
+        """
+        return self._operationCount
+
+    @operationCount.setter
+    def operationCount(self, value):
+        self._operationCount = value
+
+    @property
+    def recordSize(self):
+        """
+            int: The size of the value of a record in characters. Defaults to 100.
+        """
+        return self._recordSize
+
+    @recordSize.setter
+    def recordSize(self, value):
+        self._recordSize = value
+
+    @property
+    def distribution(self):
+        """
+            str: The distribution of the requested keys, 'uniform', 'zipfian' or 'latest' (the recently inserted records are the most popular). Defaults to the distribution of the workload.
+        """
+        return self._distribution
+
+    @distribution.setter
+    def distribution(self, value):
+        self._distribution = value
+
+    @property
+    def maxScanLength(self):
+        """
+            int: The maximum number of records of a scan, the number of records of a scan is uniformly distributed. Defaults to 100.
+        """
+        return self._maxScanLength
+
+    @maxScanLength.setter
+    def maxScanLength(self, value):
+        self._maxScanLength = value
+
+    @property
+    def targetThroughput(self):
+        """
+            int|float: The target number of operations per second. Defaults to None, as fast as possible.
+        """
+        return self._targetThroughput
+
+    @targetThroughput.setter
+    def targetThroughput(self, value):
+        self._targetThroughput = value
+
+    @property
+    def columnFamily(self):
+        """
+            str: The column family of the records. Defaults to 'cf'.
+        """
+        return self._columnFamily
+
+    @columnFamily.setter
+    def columnFamily(self, value):
+        self._columnFamily = value
+
+    @property
+    def summaryInterval(self):
+        """
+            float: The interval in seconds between the summaries. Defaults to 10 seconds.
+        """
+        return self._summaryInterval
+
+    @summaryInterval.setter
+    def summaryInterval(self, value):
+        self._summaryInterval = value
+
+    @property
+    def seed(self):
+        """
+            int: The seed of the random generator, workloads with the same seed request the same keys. The keys of workloads with inserts depend on the acknowledged inserts. Defaults to None.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(self, value):
+        self._seed = value
+
+    def populate(self, topology, name, **options):
+        workload = str(self.workload).upper()
+        if workload not in _WORKLOADS:
+            raise ValueError("Invalid workload value. Valid values are 'A', 'B', 'C', 'D', 'E' and 'F'.")
+        proportions, distribution = _WORKLOADS[workload]
+        if self.distribution is not None:
+            distribution = self.distribution
+        if distribution not in ('uniform', 'zipfian', 'latest'):
+            raise ValueError("Invalid distribution value. Valid values are 'uniform', 'zipfian' and 'latest'.")
+        for parameter_name in ('recordCount', 'operationCount', 'recordSize', 'maxScanLength'):
+            value = getattr(self, parameter_name)
+            if not isinstance(value, int) or value < 1:
+                raise ValueError("Invalid " + parameter_name + " value. Value must be at least one.")
+        if self.load:
+            proportions = {'insert': 1.0}
+
+        workload_id = str(uuid.uuid4())
+        generator = _WorkloadGenerator(workload_id, proportions, distribution, self.recordCount, self.operationCount, self.recordSize,
+                                       self.maxScanLength, self.targetThroughput, self.seed, self.load)
+        source = topology.source(generator, name=name if name is not None else 'HBaseWorkload')
+        requests = source.map(None, schema=_WorkloadRequestSchema)
+        # the generator shares the state of the workload with these operators
+        fused = []
+
+        cells = {'staticColumnFamily': self.columnFamily, 'staticColumnQualifier': 'field0'}
+        results = []
+        if 'read' in proportions or 'readmodifywrite' in proportions:
+            reads = requests.filter(_OperationFilter(('read', 'readmodifywrite')), name='HBaseWorkloadReads')
+            read_results = reads.map(HBaseGet(tableName=self.tableName, rowAttrName='row', connection=self.connection,
+                schema=_WorkloadRequestSchema.extend(StreamSchema('tuple<rstring readValue>')), outAttrName='readValue', **cells), name='HBaseWorkloadGet')
+            results.append(read_results.filter(_OperationFilter(('read',))))
+        writes = None
+        if 'insert' in proportions or 'update' in proportions:
+            writes = requests.filter(_OperationFilter(('insert', 'update')), name='HBaseWorkloadWrites')
+        if 'readmodifywrite' in proportions:
+            # the modified value is written after the read of the row
+            modified = read_results.filter(_OperationFilter(('readmodifywrite',))).map(_WriteRequest(), schema=_WorkloadRequestSchema)
+            writes = modified if writes is None else _union([writes, modified], _WorkloadRequestSchema, 'HBaseWorkloadWriteUnion')
+        if writes is not None:
+            write_results = writes.map(HBasePut(tableName=self.tableName, rowAttrName='row', valueAttrName='value', connection=self.connection,
+                schema=_WorkloadResultSchema, successAttr='success', **cells), name='HBaseWorkloadPut')
+            if 'insert' in proportions and not self.load:
+                write_results = write_results.filter(_InsertAcknowledgements(workload_id, self.recordCount), name='HBaseWorkloadInserts')
+                fused.append(write_results)
+            results.append(write_results)
+        if 'scan' in proportions:
+            scans = requests.filter(_OperationFilter(('scan',)), name='HBaseWorkloadScans')
+            scans = scans.filter(_ScanRequests(workload_id, self.recordCount), name='HBaseWorkloadScanRequests')
+            # one scan at a time, the rows of a scan are followed by a window punctuation
+            scanned_rows = scans.map(HBaseTriggeredScan(tableName=self.tableName, connection=self.connection,
+                schema=StreamSchema('tuple<rstring row, rstring value>'), outAttrName='value', maxThreads=1, **cells), name='HBaseWorkloadScan')
+            completions = scanned_rows.for_each(_ScanCompletions(workload_id, self.recordCount), name='HBaseWorkloadScanCompletions', process_punct=True)
+            scan_markers = topology.source(_ScanMarkers(workload_id, self.recordCount), name='HBaseWorkloadScanMarkers')
+            fused += [scans, completions, scan_markers]
+            results.append(scan_markers)
+
+        results = [r.map(_OperationResult(), schema=_WorkloadResultSchema) for r in results]
+        source.colocate(fused)
+        result = _union(results, _WorkloadResultSchema, 'HBaseWorkloadResultUnion')
+        expected_operations = self.recordCount if self.load else self.operationCount
+        return result.flat_map(_WorkloadSummary(expected_operations, self.summaryInterval), name='HBaseWorkloadSummary').map(None, schema=HBASEWorkloadSummarySchema)
@@ -6,14 +6,24 @@ import streamsx.hbase as hbase
 
 from streamsx.topology.topology import streamsx, Topology
 from streamsx.topology.tester import Tester
-from streamsx.topology.schema import StreamSchema
+from streamsx.topology.schema import CommonSchema, StreamSchema
+from streamsx.topology.state import ConsistentRegionConfig
 import streamsx.spl.toolkit as tk
 import streamsx.spl.op as op
 
 
 import unittest
+import unittest.mock
+import datetime
+import itertools
 import os
+import json
+import pickle
+import tempfile
+import threading
 import time
+import xml.etree.ElementTree
+import zlib
 
 ##
 ## Test assumptions
@@ -61,6 +71,14 @@ def hadoop_host_port_env_var():
 #        print ("Missing HADOOP_HOST_PORT environment variable.")
     return result
 
+def pyarrow_installed():
+    result = True
+    try:
+        import pyarrow
+    except ImportError:
+        result = False
+    return result
+
 def cloud_creds_env_var():
     result = True
     try:
@@ -99,11 +117,76 @@ def _create_stream_for_put(topo):
     return createRows.stream
 
 
+def _read_site_properties(topo):
+    # properties of the hbase-site.xml file added last to the application bundle
+    site_xml = xml.etree.ElementTree.parse(topo._files['etc'][-1])
+    return {p.findtext('name'): p.findtext('value') for p in site_xml.getroot().findall('property')}
+
+
+def _export_writer(export):
+    # the sink function that HBaseScanExport adds to the scanned rows
+    scanned_rows = unittest.mock.Mock()
+    export.populate(None, scanned_rows, None)
+    return scanned_rows.for_each.call_args[0][0]
+
+
 def _get_table_name():
     tableName = 'streamsSample_lotr'
     return tableName
 
 
+class _FakeClock(object):
+    # clock of the rate limiter tests, sleeping advances the clock
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class _FakeMetric(object):
+    # custom metric of the fused operator tests
+    def __init__(self):
+        self.value = 0
+
+    def __iadd__(self, value):
+        self.value += value
+        return self
+
+
+def _patch_metrics(metrics):
+    # runs the fused operators as in a processing element, the created custom metrics are added to metrics by name
+    def create_metric(op, name, kind, description=None):
+        metrics[name] = _FakeMetric()
+        return metrics[name]
+    return unittest.mock.patch.multiple('streamsx.ec', is_active=lambda: True, channel=lambda op: 0, CustomMetric=create_metric)
+
+
+def _fused_operators(topo):
+    # names of the operators by processing element, operators that share a colocation tag are fused
+    groups = []
+    for o in topo.graph.operators:
+        tags = set(o._placement.get('colocateTags', [])) | set([o.name])
+        for group in [g for g in groups if g & tags]:
+            groups.remove(group)
+            tags |= group
+        groups.append(tags)
+    return groups
+
+
+def _create_hbase_shell(directory):
+    # a stand-in for the hbase command that records the shell script, exits with the environment variable EXIT_CODE
+    script = os.path.join(directory, 'commands.txt')
+    hbase_shell = os.path.join(directory, 'hbase')
+    with open(hbase_shell, 'w') as f:
+        f.write('#!/bin/sh\ncat > ' + script + '\nexit ${EXIT_CODE:-0}\n')
+    os.chmod(hbase_shell, 0o755)
+    return hbase_shell, script
+
+
 class StringData(object):
     def __init__(self, who, count, delay=True):
         self.who = who
@@ -122,9 +205,875 @@ class TestParams(unittest.TestCase):
     def test_hadoop_host_port(self):
         topo = Topology()
         hbase.scan(topo, table_name=_get_table_name(), max_versions=3)
-        s = _create_stream_for_get(topo) 
+        s = _create_stream_for_get(topo)
         hbase.get(s, table_name=_get_table_name(), row_attr_name='who')
 
+    def test_parallel_scan_split_points(self):
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', parallelWidth=3, splitPoints=['b', 'd', 'f', 'h', 'j'])).end_parallel()
+        scan_op = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEScan'][0]
+        self.assertEqual('["", "d", "h"][getChannel()]', str(scan_op.params['startRow']))
+        self.assertEqual('["d", "h", ""][getChannel()]', str(scan_op.params['endRow']))
+
+    def test_parallel_scan_split_points_key_range(self):
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', parallelWidth=2, splitPoints=['b', 'd', 'f', 'h', 'j'], startRow='c', endRow='i')).end_parallel()
+        scan_op = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEScan'][0]
+        self.assertEqual('["c", "f"][getChannel()]', str(scan_op.params['startRow']))
+        self.assertEqual('["f", "i"][getChannel()]', str(scan_op.params['endRow']))
+
+    def test_parallel_scan_split_points_invalid(self):
+        topo = Topology()
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', parallelWidth=3, splitPoints=['b']))
+
+    def test_parallel_scan_regions(self):
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', parallelWidth=3)).end_parallel()
+        scan_op = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEScan'][0]
+        self.assertEqual('getChannel()', str(scan_op.params['channel']))
+        self.assertEqual('getMaxChannels()', str(scan_op.params['maxChannels']))
+
+    def test_incremental_scan_watermark(self):
+        watermark_file = os.path.join(tempfile.mkdtemp(), 'scan.watermark')
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', watermarkFile=watermark_file))
+        ops = dict((o.kind, o) for o in topo.graph.operators)
+        self.assertNotIn('minTimestamp', ops['com.ibm.streamsx.hbase::HBASEScan'].params)
+        self.assertEqual(['com.ibm.streamsx.hbase::HBASEScan'], list(ops))
+        # the pending watermark is the build time minus the clock skew, a second build keeps it
+        with open(watermark_file + '.pending') as f:
+            pending = int(f.read())
+        self.assertLessEqual(pending, int((time.time() - 60) * 1000))
+        Topology().source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', watermarkFile=watermark_file, watermarkClockSkew=0.5))
+        self.assertEqual(pending, hbase.commit_watermark(watermark_file))
+
+    def test_incremental_scan_watermark_directory(self):
+        watermark_file = os.path.join(tempfile.mkdtemp(), 'missing', 'scan.watermark')
+        self.assertRaises(ValueError, Topology().source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', watermarkFile=watermark_file))
+
+    def test_commit_watermark(self):
+        watermark_file = os.path.join(tempfile.mkdtemp(), 'scan.watermark')
+        with open(watermark_file + '.pending', 'w') as f:
+            f.write('1570000000000\n')
+        self.assertEqual(1570000000000, hbase.commit_watermark(watermark_file))
+        self.assertFalse(os.path.exists(watermark_file + '.pending'))
+
+    def test_scan_from_watermark(self):
+        watermark_file = os.path.join(tempfile.mkdtemp(), 'scan.watermark')
+        with open(watermark_file + '.pending', 'w') as f:
+            f.write('1570000000000\n')
+        hbase.commit_watermark(watermark_file)
+        topo = Topology()
+        scan = hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', watermarkFile=watermark_file)
+        topo.source(scan)
+        self.assertIsNone(scan.minTimestamp)
+        ops = dict((o.kind, o) for o in topo.graph.operators)
+        self.assertEqual('1570000000000', str(ops['com.ibm.streamsx.hbase::HBASEScan'].params['minTimestamp']))
+
+    def test_filter_expression(self):
+        f = hbase.PrefixFilter('Gandalf') & ~(hbase.ValueFilter('>=', 'b') | hbase.QualifierRegexFilter('^begin'))
+        self.assertEqual("(PrefixFilter('Gandalf') AND (ValueFilter(<, 'binary:b') AND QualifierFilter(!=, 'regexstring:^begin')))", str(f))
+
+    def test_filter_expression_invalid(self):
+        self.assertRaises(ValueError, hbase.ValueFilter, '~', 'b')
+        self.assertRaises(ValueError, lambda: ~hbase.KeyOnlyFilter())
+
+    def test_filter_regex_posix(self):
+        hbase.RowRegexFilter('^Gandalf_[0-9]+$')
+        self.assertRaises(ValueError, hbase.RowRegexFilter, '(')
+        # valid in Python, but not a POSIX extended regular expression as evaluated by regexMatch
+        self.assertRaises(ValueError, hbase.RowRegexFilter, '(?i)gandalf')
+
+    def test_filter_regex_posix_constructs(self):
+        hbase.QualifierRegexFilter('^[[:alpha:]]+[0-9]{2}$')
+        self.assertRaises(ValueError, hbase.RowRegexFilter, '\\d+')
+        self.assertRaises(ValueError, hbase.RowRegexFilter, '[\\w]+')
+        self.assertRaises(ValueError, hbase.RowRegexFilter, 'Gandalf.*?_1')
+
+    def test_scan_client_filter(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        f = hbase.PrefixFilter('Gandalf') & hbase.ValueFilter('>=', 'b')
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, clientFilter=f & hbase.KeyOnlyFilter()))
+        kinds = [o.kind for o in topo.graph.operators]
+        self.assertEqual(['com.ibm.streamsx.hbase::HBASEScan', 'spl.relational::Filter', 'spl.relational::Functor'], kinds)
+        self.assertEqual('Gandalf', topo.graph.operators[0].params['rowPrefix'])
+
+    def test_scan_client_filter_type(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        self.assertRaises(TypeError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, clientFilter='ValueFilter(=, \'binary:b\')'))
+
+    def test_get_client_filter_attributes(self):
+        topo = Topology()
+        s = _create_stream_for_get(topo)
+        schema = StreamSchema('tuple<rstring who, rstring value>')
+        s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=schema, clientFilter=hbase.ValueFilter('=', 'b')))
+        self.assertRaises(ValueError, s.map, hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=schema, clientFilter=hbase.ColumnPrefixFilter('begin')))
+
+    def test_scan_row_mode(self):
+        topo = Topology()
+        rows = topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rowMode=True))
+        self.assertEqual('tuple<rstring row, int32 numResults, map<rstring, map<rstring, rstring>> value>', rows.oport.schema.schema())
+        rows = hbase.scan(topo, table_name=_get_table_name(), connection='localhost:8020', row_mode=True)
+        self.assertEqual('tuple<rstring row, int32 numResults, map<rstring, map<rstring, rstring>> value>', rows.oport.schema.schema())
+
+    def test_scan_row_mode_static_family(self):
+        topo = Topology()
+        rows = topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rowMode=True, staticColumnFamily='location'))
+        self.assertEqual('tuple<rstring row, int32 numResults, map<rstring, rstring> value>', rows.oport.schema.schema())
+
+    def test_scan_row_mode_invalid(self):
+        topo = Topology()
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rowMode=True, clientFilter=hbase.ValueFilter('=', 'b')))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rowMode=True, staticColumnFamily='location', staticColumnQualifier='beginTwoTowers'))
+
+    @unittest.skipIf(pyarrow_installed() == False, "Missing pyarrow")
+    def test_scan_export_parquet(self):
+        import pyarrow.parquet
+        directory = tempfile.mkdtemp()
+        writer = _export_writer(hbase.HBaseScanExport(directory=directory, batchSize=2, rowsPerFile=4))
+        writer.__enter__()
+        for i in range(5):
+            writer({'row': 'Gandalf_' + str(i), 'numResults': 1, 'columnFamily': 'location', 'columnQualifier': 'beginTwoTowers', 'value': 'travelling_' + str(i)})
+            writer({'row': 'Gandalf_' + str(i), 'numResults': 1, 'columnFamily': 'location', 'columnQualifier': 'endTwoTowers', 'value': 'home'})
+        writer.__exit__(None, None, None)
+        files = sorted(os.listdir(directory))
+        self.assertEqual(2, len(files))
+        table = pyarrow.parquet.read_table(os.path.join(directory, files[0]))
+        self.assertEqual(4, table.num_rows)
+        self.assertEqual([('location:beginTwoTowers', 'travelling_0'), ('location:endTwoTowers', 'home')], table.column('cells')[0].as_py())
+
+    @unittest.skipIf(pyarrow_installed() == False, "Missing pyarrow")
+    def test_scan_export_arrow_columns(self):
+        import pyarrow
+        directory = tempfile.mkdtemp()
+        writer = _export_writer(hbase.HBaseScanExport(directory=directory, fileFormat='arrow', columns=['beginTwoTowers'], batchSize=2, rowsPerFile=4))
+        writer.__enter__()
+        writer({'row': 'Gandalf_0', 'numResults': 2, 'value': {'beginTwoTowers': 'travelling_0', 'endTwoTowers': 'home'}})
+        writer.__exit__(None, None, None)
+        arrow_file = [f for f in os.listdir(directory) if f.endswith('.arrow')][0]
+        table = pyarrow.ipc.open_file(pyarrow.memory_map(os.path.join(directory, arrow_file))).read_all()
+        self.assertEqual(['row', 'beginTwoTowers'], table.column_names)
+
+    @unittest.skipIf(pyarrow_installed() == False, "Missing pyarrow")
+    def test_scan_export_failed(self):
+        directory = tempfile.mkdtemp()
+        writer = _export_writer(hbase.HBaseScanExport(directory=directory, batchSize=1, rowsPerFile=4))
+        writer.__enter__()
+        writer({'row': 'Gandalf_0', 'numResults': 1, 'columnFamily': 'location', 'columnQualifier': 'beginTwoTowers', 'value': 'travelling_0'})
+        writer({'row': 'Gandalf_1', 'numResults': 1, 'columnFamily': 'location', 'columnQualifier': 'beginTwoTowers', 'value': 'travelling_1'})
+        writer.__exit__(RuntimeError, RuntimeError('failed'), None)
+        # an incomplete file is not published when the processing element fails
+        self.assertEqual([], os.listdir(directory))
+
+    @unittest.skipIf(pyarrow_installed() == False, "Missing pyarrow")
+    def test_scan_export_options(self):
+        directory = tempfile.mkdtemp()
+        topo = Topology()
+        scanned_rows = topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rowMode=True))
+        scanned_rows.for_each(hbase.HBaseScanExport(directory=directory, fileFormat='arrow'))
+        self.assertRaises(ValueError, scanned_rows.for_each, hbase.HBaseScanExport(directory=directory, fileFormat='csv'))
+
+    def test_scan_consistent_region(self):
+        topo = Topology()
+        scanned_rows = topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', triggerCount=1000, consistentRegion=ConsistentRegionConfig.operator_driven()))
+        self.assertIsNotNone(scanned_rows.oport.operator._consistent)
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', consistentRegion=ConsistentRegionConfig.periodic(60)))
+
+    def test_scan_consistent_region_invalid(self):
+        topo = Topology()
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', consistentRegion=ConsistentRegionConfig.operator_driven()))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', triggerCount=1000, consistentRegion=ConsistentRegionConfig.periodic(60)))
+
+    def test_scanner_caching(self):
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', scannerCaching=1000, scannerTimeout=120))
+        site_xml = _read_site_properties(topo)
+        self.assertEqual('1000', site_xml['hbase.client.scanner.caching'])
+        self.assertEqual('120000', site_xml['hbase.client.scanner.timeout.period'])
+
+    def test_scanner_caching_auto(self):
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', scannerCaching='auto'))
+        site_xml = _read_site_properties(topo)
+        self.assertEqual('2147483647', site_xml['hbase.client.scanner.caching'])
+        self.assertEqual('2097152', site_xml['hbase.client.scanner.max.result.size'])
+
+    def test_scanner_caching_invalid(self):
+        topo = Topology()
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', scannerCaching=0))
+
+    def test_sampling_scan(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        sampled_rows = topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, sampleRate=0.01))
+        self.assertTrue(sampled_rows.oport.schema.schema().endswith('float64 samplingWeight>'))
+        self.assertEqual('((uint64)hashCode(row + "")) % 1000000ul < 10000ul', str(topo.graph.operators[-1].params['filter']))
+
+    def test_sampling_scan_size(self):
+        topo = Topology()
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rowMode=True, sampleSize=1000, estimatedRowCount=10000000))
+        self.assertEqual('((uint64)hashCode(row + "")) % 1000000ul < 100ul', str(topo.graph.operators[-1].params['filter']))
+
+    def test_sampling_scan_invalid(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, sampleRate=2))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, sampleSize=1000))
+
+    def test_sampling_scan_requires_row(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring columnQualifier, rstring value>')
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, sampleRate=0.01))
+
+    def test_triggered_scan(self):
+        topo = Topology()
+        triggers = op.Source(topo, "spl.utility::Beacon", 'tuple<rstring rowPrefix>', params = {'iterations':10})
+        triggers.rowPrefix = triggers.output('"Gandalf_" + (rstring) IterationCount()')
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        scanned_rows = triggers.stream.parallel(2).map(hbase.HBaseTriggeredScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, maxThreads=4)).end_parallel()
+        scan_op = topo.graph.operators[-2]
+        self.assertEqual('com.ibm.streamsx.hbase::HBASEScan', scan_op.kind)
+        self.assertEqual(1, len(scan_op.inputPorts))
+
+    def test_scan_limit(self):
+        row_limit = hbase._hbase._RowLimit(3, None)
+        rows = ['usr1-9', 'usr1-9', 'usr1-8', 'usr1-7', 'usr2-9', 'usr2-8', 'usr2-8', 'usr2-7']
+        self.assertEqual([True, True, True, True, False, False, False, False], [row_limit({'row': r}) for r in rows])
+
+    def test_scan_limit_prefix(self):
+        row_limit = hbase._hbase._RowLimit(2, 4)
+        rows = ['usr1-9', 'usr1-9', 'usr1-8', 'usr1-7', 'usr2-9', 'usr2-8', 'usr2-8', 'usr2-7']
+        self.assertEqual([True, True, True, False, True, True, True, False], [row_limit({'row': r}) for r in rows])
+
+    def test_scan_limit_options(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, limit=10, limitPrefixLength=4))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, limit=0))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, limitPrefixLength=4))
+
+    def test_scan_limit_parallel(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, limit=10, parallelWidth=2))
+
+    def test_rate_limit(self):
+        clock = _FakeClock()
+        limiter = hbase._hbase._RateLimiter(None, None, 100, 10, clock=clock, sleep=clock.sleep)
+        limiter.__enter__()
+        for i in range(2000):
+            self.assertTrue(limiter({'row': str(i)}))
+        # 200 RPCs, the first 100 RPCs are in the bucket
+        self.assertAlmostEqual(1.0, clock.now, places=1)
+
+    def test_rate_limit_callable(self):
+        clock = _FakeClock()
+        rate = [1000]
+        limiter = hbase._hbase._RateLimiter(lambda: rate[0], 5000, None, 1, clock=clock, sleep=clock.sleep)
+        limiter.__enter__()
+        for i in range(500):
+            limiter({'row': 'r', 'value': 'value'})
+        self.assertEqual(0.0, clock.now)
+        rate[0] = 100
+        clock.now += 1.0
+        for i in range(200):
+            limiter({'row': 'r', 'value': 'value'})
+        self.assertAlmostEqual(2.0, clock.now, places=1)
+
+    def test_rate_limit_parallel_scan(self):
+        clock = _FakeClock()
+        limiter = hbase._hbase._RateLimiter(100, None, None, 1, channels=4, clock=clock, sleep=clock.sleep)
+        limiter.__enter__()
+        for i in range(50):
+            limiter({'row': str(i)})
+        # every channel gets 25 cells per second
+        self.assertAlmostEqual(1.0, clock.now, places=1)
+
+    def test_rate_limit_row_mode(self):
+        clock = _FakeClock()
+        limiter = hbase._hbase._RateLimiter(100, None, None, 1, count_attr='numResults', clock=clock, sleep=clock.sleep)
+        limiter.__enter__()
+        for i in range(30):
+            limiter({'row': str(i), 'numResults': 10})
+        # a row counts as its cells
+        self.assertAlmostEqual(2.0, clock.now, places=1)
+
+    def test_rate_limit_checkpoint(self):
+        limiter = hbase._hbase._RateLimiter(100, None, None, 1)
+        # a custom metric cannot be saved in a checkpoint
+        with unittest.mock.patch.multiple('streamsx.ec', is_active=lambda: True, CustomMetric=lambda *args, **kwargs: threading.Lock()):
+            limiter.__enter__()
+            restored = pickle.loads(pickle.dumps(limiter))
+        self.assertEqual(100, restored.cells_per_second)
+
+    def test_rate_limit_options(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        s.map(hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020',
+            batchSize=10, cellsPerSecond=topo.create_submission_parameter('cells', type_=float), rpcsPerSecond=20))
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', bytesPerSecond=1000000))
+        kinds = [o.kind for o in topo.graph.operators]
+        self.assertEqual(2, kinds.count('com.ibm.streamsx.topology.functional.python::Filter'))
+
+    def test_rate_limit_options_invalid(self):
+        topo = Topology()
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', cellsPerSecond=0))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', rpcsPerSecond=10))
+
+    def test_operator_metrics_latency(self):
+        metrics = {}
+        request = hbase._hbase._HBaseMetrics('test_operator_metrics_latency', 'request', latency=True, row_attr='who')
+        response = hbase._hbase._HBaseMetrics('test_operator_metrics_latency', 'response', latency=True, row_attr='who')
+        # every probe call takes one second
+        with _patch_metrics(metrics), unittest.mock.patch('time.monotonic', side_effect=itertools.count()):
+            request.__enter__()
+            response.__enter__()
+            for i in range(100):
+                self.assertTrue(request({'who': 'row' + str(i)}))
+            # a failed request without a result does not shift the pairing of the other results
+            self.assertTrue(request({'who': 'failed'}))
+            for i in reversed(range(100)):
+                self.assertTrue(response({'who': 'row' + str(i), 'value': 'v'}))
+        self.assertEqual(101, metrics['nRequests'].value)
+        self.assertEqual(100, metrics['nResults'].value)
+        # the latency of the row i is 200 - 2 * i seconds
+        self.assertEqual(100000000, metrics['latencyP50Micros'].value)
+        self.assertEqual(190000000, metrics['latencyP95Micros'].value)
+        self.assertEqual(198000000, metrics['latencyP99Micros'].value)
+
+    def test_operator_metrics_probes(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x}, schema=StreamSchema('tuple<rstring who>'))
+        output_schema = StreamSchema('tuple<rstring who, rstring value>')
+        s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=output_schema, metrics=True, cellsPerSecond=100))
+        names = [o.name for o in topo.graph.operators]
+        self.assertEqual(1, len([n for n in names if n.startswith('HBaseMetricsRequest')]))
+        self.assertEqual(1, len([n for n in names if n.startswith('HBaseMetricsResponse')]))
+
+    def test_operator_metrics_read(self):
+        class _Metric(object):
+            def __init__(self, name, value, metricType='custom'):
+                self.name = name
+                self.value = value
+                self.metricType = metricType
+        class _Operator(object):
+            def __init__(self, name, operatorKind, metrics):
+                self.name = name
+                self.operatorKind = operatorKind
+                self.metrics = metrics
+            def get_metrics(self):
+                return self.metrics
+        class _Job(object):
+            def get_operators(self):
+                return [_Operator('HBaseGet', 'com.ibm.streamsx.hbase::HBASEGet', [_Metric('nDroppedTuples', 0, 'system')]),
+                        _Operator('HBaseMetricsResponse', 'com.ibm.streamsx.topology.functional.python::Filter', [_Metric('nResults', 10), _Metric('latencyP99Micros', 900)]),
+                        _Operator('Beacon', 'spl.utility::Beacon', [_Metric('nTuples', 1)])]
+        metrics = hbase.operator_metrics(_Job())
+        self.assertEqual({'HBaseGet': {}, 'HBaseMetricsResponse': {'nResults': 10, 'latencyP99Micros': 900}}, metrics)
+        self.assertEqual(['HBaseGet'], list(hbase.operator_metrics(_Job(), name='Get$')))
+
+    def test_operator_metrics_names(self):
+        class _Metric(object):
+            def __init__(self, name, value):
+                self.name = name
+                self.value = value
+                self.metricType = 'custom'
+        class _Operator(object):
+            def __init__(self, name, metrics):
+                self.name = name
+                self.operatorKind = 'com.ibm.streamsx.topology.functional.python::Filter'
+                self.metrics = metrics
+            def get_metrics(self):
+                return self.metrics
+        class _Job(object):
+            def get_operators(self):
+                return [_Operator('HBaseHotKeys', [_Metric('hotKeyRate', 50), _Metric('hotKeyPercent', 20)]),
+                        _Operator('HBaseWarmupResults_2[1]', [_Metric('warmupTimeMillis', 1500)]),
+                        _Operator('HBaseRateLimit_3', [_Metric('throttledTimeMillis', 10)]),
+                        _Operator('HBaseMetricsReport', [_Metric('nReports', 1)]),
+                        _Operator('MyHBaseRateLimit', [_Metric('nTuples', 1)])]
+        metrics = hbase.operator_metrics(_Job())
+        self.assertEqual({'HBaseHotKeys': {'hotKeyRate': 50, 'hotKeyPercent': 20}, 'HBaseWarmupResults_2[1]': {'warmupTimeMillis': 1500},
+                          'HBaseRateLimit_3': {'throttledTimeMillis': 10}}, metrics)
+
+    def test_tracing(self):
+        trace_file = os.path.join(tempfile.mkdtemp(), 'traces.jsonl')
+        request = hbase._hbase._HBaseTracer('test_tracing', 'request', 'Get', 'table', 'who', 0.0, 'trace')
+        response = hbase._hbase._HBaseTracer('test_tracing', 'response', 'Get', 'table', 'who', trace_attr='trace', trace_file=trace_file, count_attr='numResults')
+        request.__enter__()
+        response.__enter__()
+        parent = '00-' + 'a' * 32 + '-' + 'b' * 16 + '-01'
+        results = []
+        for trace in ['', parent, '']:
+            self.assertTrue(request({'who': 'row', 'trace': trace}))
+            results.append(response({'who': 'row', 'trace': trace, 'numResults': 2}))
+        response.__exit__(None, None, None)
+        with open(trace_file) as f:
+            spans = [json.loads(line) for line in f]
+        # not sampled without a sampled parent
+        self.assertEqual(1, len(spans))
+        self.assertEqual('a' * 32, spans[0]['traceId'])
+        self.assertEqual('b' * 16, spans[0]['parentSpanId'])
+        self.assertEqual(2, spans[0]['attributes']['hbase.row_count'])
+        self.assertEqual('00-' + 'a' * 32 + '-' + spans[0]['spanId'] + '-01', results[1]['trace'])
+        self.assertEqual('', results[2]['trace'])
+
+    def test_tracing_pairing(self):
+        trace_file = os.path.join(tempfile.mkdtemp(), 'traces.jsonl')
+        request = hbase._hbase._HBaseTracer('test_tracing_pairing', 'request', 'Put', 'table', 'who', 1.0, 'trace')
+        response = hbase._hbase._HBaseTracer('test_tracing_pairing', 'response', 'Put', 'table', 'who', trace_attr='trace', trace_file=trace_file)
+        request.__enter__()
+        response.__enter__()
+        for row in ['a', 'b', 'c']:
+            request({'who': row, 'trace': ''})
+        # the results of a batch are not in the order of the requests
+        results = dict((row, response({'who': row, 'trace': ''})) for row in ['c', 'a', 'b'])
+        response.__exit__(None, None, None)
+        with open(trace_file) as f:
+            spans = dict((span['spanId'], span) for span in (json.loads(line) for line in f))
+        self.assertEqual(3, len(spans))
+        for row in ['a', 'b', 'c']:
+            self.assertIn(results[row]['trace'].split('-')[2], spans)
+
+    def test_tracing_options(self):
+        trace_file = os.path.join(tempfile.mkdtemp(), 'traces.jsonl')
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'trace': ''}, schema=StreamSchema('tuple<rstring who, rstring trace>'))
+        output_schema = StreamSchema('tuple<rstring who, rstring trace, rstring value>')
+        s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=output_schema,
+            traceSampleRate=0.01, traceAttrName='trace', traceFile=trace_file))
+        names = [o.name for o in topo.graph.operators]
+        self.assertIn('HBaseTraceRequest', names)
+        self.assertIn('HBaseTraceResponse', names)
+
+    def test_tracing_options_invalid(self):
+        trace_file = os.path.join(tempfile.mkdtemp(), 'traces.jsonl')
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'trace': ''}, schema=StreamSchema('tuple<rstring who, rstring trace>'))
+        output_schema = StreamSchema('tuple<rstring who, rstring trace, rstring value>')
+        self.assertRaises(ValueError, s.map, hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=output_schema, traceSampleRate=0.01))
+        self.assertRaises(ValueError, s.map, hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=output_schema, traceSampleRate=2, traceFile=trace_file))
+        # the results are paired with the requests by the row attribute
+        self.assertRaises(ValueError, s.map, hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=StreamSchema('tuple<rstring value>'),
+            traceSampleRate=0.01, traceFile=trace_file))
+
+    def test_workload_generator(self):
+        generator = hbase._hbase._WorkloadGenerator('test_workload_generator', {'read': 0.5, 'update': 0.5}, 'zipfian', 100, 1000, 10, 100, None, 1, False)
+        requests = list(generator)
+        self.assertEqual(1000, len(requests))
+        self.assertTrue(all(r['row'] < 'user000000000100' for r in requests))
+        reads = len([r for r in requests if r['op'] == 'read'])
+        self.assertTrue(400 < reads < 600)
+        self.assertTrue(all(len(r['value']) == 10 for r in requests if r['op'] == 'update'))
+
+    def test_workload_generator_seed(self):
+        generator = hbase._hbase._WorkloadGenerator('test_workload_generator_seed', {'read': 0.5, 'update': 0.5}, 'zipfian', 100, 1000, 10, 100, None, 1, False)
+        requests = list(generator)
+        self.assertEqual(requests, [dict(r, startTime=t['startTime']) for r, t in zip(list(generator), requests)])
+
+    def test_workload_generator_zipfian(self):
+        generator = hbase._hbase._WorkloadGenerator('test_workload_generator_zipfian', {'read': 1.0}, 'zipfian', 100, 1000, 10, 100, None, 1, False)
+        rows = [r['row'] for r in generator]
+        # the most popular key is requested much more often than with a uniform distribution
+        self.assertGreater(max(rows.count(row) for row in set(rows)), 50)
+
+    def test_workload_scan_ranges(self):
+        generator = hbase._hbase._WorkloadGenerator('test_workload_scan_ranges', {'scan': 0.95, 'insert': 0.05}, 'zipfian', 100, 100, 10, 5, None, 1, False)
+        scans = [r for r in generator if r['op'] == 'scan']
+        self.assertTrue(all(s['startRow'] < s['endRow'] <= s['startRow'][:4] + str(int(s['startRow'][4:]) + 5).zfill(12) for s in scans))
+
+    def test_workload_latest_reads_acknowledged_inserts(self):
+        generator = hbase._hbase._WorkloadGenerator('test_workload_latest', {'read': 0.5, 'insert': 0.5}, 'latest', 10, 200, 10, 5, None, 1, False)
+        acknowledgements = hbase._hbase._InsertAcknowledgements('test_workload_latest', 10)
+        requests = []
+        for request in generator:
+            requests.append(request)
+            # the inserts of the first half are acknowledged
+            if request['op'] == 'insert' and len(requests) <= 100:
+                acknowledgements({'op': 'insert', 'row': request['row'], 'success': True})
+        inserts = [r['row'] for r in requests if r['op'] == 'insert']
+        written = set(inserts[:len([r for r in requests[:100] if r['op'] == 'insert'])])
+        reads = [r['row'] for r in requests if r['op'] == 'read']
+        self.assertTrue(all(row < 'user000000000010' or row in written for row in reads))
+        self.assertTrue(any(row in written for row in reads))
+
+    def test_workload_scan_completions(self):
+        generator = hbase._hbase._WorkloadGenerator('test_workload_scan_completions', {'scan': 1.0}, 'uniform', 10, 2, 10, 5, None, 1, False)
+        scan_requests = hbase._hbase._ScanRequests('test_workload_scan_completions', 10)
+        completions = hbase._hbase._ScanCompletions('test_workload_scan_completions', 10)
+        requests = list(generator)
+        for request in requests:
+            self.assertTrue(scan_requests(request))
+        # the first scan has rows, the second scan is empty
+        completions({'row': requests[0]['startRow'], 'value': 'v'})
+        completions.on_punct()
+        completions.on_punct()
+        markers = list(hbase._hbase._ScanMarkers('test_workload_scan_completions', 10))
+        self.assertEqual([0, 1], [m['opId'] for m in markers])
+        self.assertTrue(all(m['op'] == 'scan' and m['success'] for m in markers))
+
+    def test_workload_summary(self):
+        summary = hbase._hbase._WorkloadSummary(3, 1000)
+        summary.__enter__()
+        start = time.time()
+        self.assertEqual([], summary({'op': 'read', 'opId': 0, 'startTime': start, 'success': True}))
+        self.assertEqual([], summary({'op': 'scan', 'opId': 1, 'startTime': start, 'success': True}))
+        summaries = summary({'op': 'update', 'opId': 2, 'startTime': start, 'success': False})
+        self.assertEqual(['read', 'scan', 'update', 'OVERALL'], [s['operation'] for s in summaries])
+        self.assertEqual(3, summaries[-1]['operations'])
+        self.assertEqual(1, summaries[-1]['failures'])
+        self.assertTrue(summaries[-1]['final'])
+
+    def test_workload_options(self):
+        for workload in 'ABCDEF':
+            topo = Topology()
+            topo.source(hbase.HBaseWorkload(tableName=_get_table_name(), workload=workload, connection='localhost:8020'))
+        # workload F reads and writes
+        kinds = [o.kind for o in topo.graph.operators]
+        self.assertIn('com.ibm.streamsx.hbase::HBASEGet', kinds)
+        self.assertIn('com.ibm.streamsx.hbase::HBASEPut', kinds)
+
+    def test_workload_scans(self):
+        topo = Topology()
+        topo.source(hbase.HBaseWorkload(tableName=_get_table_name(), workload='E', connection='localhost:8020'))
+        names = [o.name for o in topo.graph.operators]
+        for name in ('HBaseWorkloadInserts', 'HBaseWorkloadScanRequests', 'HBaseWorkloadScanCompletions', 'HBaseWorkloadScanMarkers'):
+            self.assertIn(name, names)
+
+    def test_workload_options_invalid(self):
+        topo = Topology()
+        self.assertRaises(ValueError, topo.source, hbase.HBaseWorkload(tableName=_get_table_name(), workload='G', connection='localhost:8020'))
+        self.assertRaises(ValueError, topo.source, hbase.HBaseWorkload(tableName=_get_table_name(), distribution='normal', connection='localhost:8020'))
+
+    def test_fuse_with_hbase_operators(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        get_schema = StreamSchema('tuple<rstring who, rstring value>')
+        s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=get_schema, fuseWithHBaseOperators=True))
+        s.map(hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020', fuseWithHBaseOperators=True))
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', fuseWithHBaseOperators=True))
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='otherhost:8020', fuseWithHBaseOperators=True))
+        hbase_ops = [o.name for o in topo.graph.operators if o.kind.startswith('com.ibm.streamsx.hbase::')]
+        self.assertEqual(4, len(hbase_ops))
+        group = [g for g in _fused_operators(topo) if hbase_ops[0] in g][0]
+        self.assertTrue(hbase_ops[1] in group and hbase_ops[2] in group)
+        self.assertFalse(hbase_ops[3] in group)
+
+    def test_colocate(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        get_schema = StreamSchema('tuple<rstring who, rstring value>')
+        gets = s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=get_schema))
+        puts = s.map(hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='otherhost:8020'))
+        self.assertIs(gets, hbase.colocate(gets, puts))
+        hbase_ops = [o.name for o in topo.graph.operators if o.kind.startswith('com.ibm.streamsx.hbase::')]
+        group = [g for g in _fused_operators(topo) if hbase_ops[0] in g][0]
+        self.assertIn(hbase_ops[1], group)
+        self.assertRaises(ValueError, hbase.colocate, gets)
+
+    def test_warmup_requests(self):
+        requests = list(hbase._hbase._WarmupRequests([('t1', 'k'), (None, 'm')], 'who', 'table'))
+        self.assertEqual([{'who': 'k', 'table': 't1', 'hbaseWarmupRequest': True}, {'who': 'm', 'hbaseWarmupRequest': True}], requests)
+
+    def test_warmup_gate(self):
+        gate = hbase._hbase._Warmup('test_warmup_gate', 'gate', 2, 5.0)
+        response = hbase._hbase._Warmup('test_warmup_gate', 'response', 2, 5.0)
+        gate.__enter__()
+        response.__enter__()
+        passed = []
+        held = threading.Thread(target=lambda: passed.append(gate({'who': 'user'})))
+        held.start()
+        time.sleep(0.1)
+        self.assertEqual([], passed)
+        self.assertIsNone(response({'who': 'k', 'hbaseWarmupRequest': True}))
+        self.assertIsNone(response({'who': 'm', 'hbaseWarmupRequest': True}))
+        held.join(5.0)
+        self.assertEqual([{'who': 'user', 'hbaseWarmupRequest': False}], passed)
+        self.assertEqual({'who': 'user'}, response({'who': 'user', 'hbaseWarmupRequest': False}))
+
+    def test_warmup_timeout(self):
+        gate = hbase._hbase._Warmup('test_warmup_timeout', 'gate', 2, 0.0)
+        response = hbase._hbase._Warmup('test_warmup_timeout', 'response', 2, 0.0)
+        gate.__enter__()
+        response.__enter__()
+        self.assertEqual({'who': 'user', 'hbaseWarmupRequest': False}, gate({'who': 'user'}))
+        # the results of the warm-up requests are dropped after the timeout
+        self.assertEqual({'who': 'user'}, response({'who': 'user', 'hbaseWarmupRequest': False}))
+        self.assertIsNone(response({'who': 'k', 'hbaseWarmupRequest': True}))
+        self.assertIsNone(response({'who': 'm', 'hbaseWarmupRequest': True}))
+        self.assertIsNone(response({'who': 'k', 'hbaseWarmupRequest': True}))
+
+    def test_warmup_options(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x}, schema=StreamSchema('tuple<rstring who>'))
+        output_schema = StreamSchema('tuple<rstring who, rstring value>')
+        s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=output_schema, warmupRows=['m', 't'], metrics=True))
+        names = [o.name for o in topo.graph.operators]
+        for name in ['HBaseWarmupGate', 'HBaseWarmupRequests', 'HBaseWarmupUnion', 'HBaseWarmupResults']:
+            self.assertIn(name, names)
+        # the probes are between the gate and the union, the warm-up requests pass the union only
+        self.assertLess(names.index('HBaseWarmupGate'), names.index('HBaseMetricsRequest'))
+        self.assertLess(names.index('HBaseMetricsRequest'), names.index('HBaseWarmupUnion'))
+        self.assertLess(names.index('HBaseWarmupResults'), names.index('HBaseMetricsResponse'))
+        get = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEGet'][0]
+        self.assertIn('hbaseWarmupRequest', get.outputPorts[0].schema.schema())
+
+    def test_warmup_options_invalid(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x}, schema=StreamSchema('tuple<rstring who>'))
+        output_schema = StreamSchema('tuple<rstring who, rstring value>')
+        self.assertRaises(ValueError, s.map, hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=output_schema, warmupRows={'t1': ['m']}))
+        self.assertRaises(ValueError, s.map, hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', warmupRows=['m']))
+
+    def test_hot_keys_summary(self):
+        summary = hbase._hbase._SpaceSaving(3)
+        for key in ['a'] * 50 + ['b', 'c', 'd', 'e'] * 5 + ['f'] * 20:
+            summary.add(key)
+        top = summary.top(2)
+        self.assertEqual('a', top[0][0])
+        self.assertGreaterEqual(top[0][1], 50)
+        self.assertEqual('f', top[1][0])
+
+    def test_hot_keys_report(self):
+        hot_keys = hbase._hbase._HotKeys('who', 2, 3, 0.2, True)
+        hot_keys.__enter__()
+        self.assertEqual([], hot_keys({'who': 's2-a'}))
+        for i in range(100):
+            hot_keys({'who': 's1-hot' if i % 2 else 's2-' + str(i)})
+        time.sleep(0.25)
+        report = hot_keys({'who': 's2-x'})
+        self.assertEqual(['row', 'row', 'prefix', 'prefix'], [r['keyType'] for r in report])
+        self.assertEqual(('s1-hot', 1), (report[0]['key'], report[0]['rank']))
+        self.assertEqual(50, report[0]['count'])
+        self.assertEqual('s2-', report[2]['key'])
+        self.assertAlmostEqual(52.0 / 102, report[2]['share'])
+        self.assertEqual([], hot_keys({'who': 's1-a'}))
+
+    def test_hot_keys_checkpoint(self):
+        metrics = {}
+        hot_keys = hbase._hbase._HotKeys('who', 2, 3, 0.2, False)
+        with _patch_metrics(metrics):
+            hot_keys.__enter__()
+            hot_keys({'who': 's1-a'})
+            metrics.clear()
+            restored = pickle.loads(pickle.dumps(hot_keys))
+            # the metrics are created again when the state is restored
+            self.assertEqual(['hotKeyPercent', 'hotKeyRate', 'hotPrefixPercent', 'hotPrefixRate'], sorted(metrics))
+            time.sleep(0.25)
+            restored({'who': 's2-b'})
+        # the row keys of the interval before the checkpoint are counted
+        self.assertEqual(50, metrics['hotKeyPercent'].value)
+        self.assertEqual(50, metrics['hotPrefixPercent'].value)
+
+    def test_hot_keys_options(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        report = s.map(hbase.HBaseHotKeys(rowAttrName='who', topK=5, prefixLength=2))
+        self.assertEqual('tuple<rstring keyType, rstring key, int32 rank, int64 count, float64 rate, float64 share>', report.oport.schema.schema())
+        self.assertEqual(hbase.HBASEHotKeySchema.schema(), report.oport.schema.schema())
+        s.map(hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020', hotKeys=True, hotKeysPrefixLength=2))
+        self.assertIn('HBaseHotKeys_2', [o.name for o in topo.graph.operators])
+
+    def test_hot_keys_options_invalid(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        self.assertRaises(ValueError, s.map, hbase.HBaseHotKeys(rowAttrName='who', topK=0))
+        self.assertRaises(ValueError, s.map, hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020', hotKeys=True, hotKeysPrefixLength=0))
+
+    def test_salted_row_keys(self):
+        salted = hbase._hbase._SaltRowKey('who', 16)({'who': 'user1'})['who']
+        # the salt is the CRC32 checksum of the row key modulo the number of buckets
+        self.assertEqual(str(zlib.crc32(b'user1') % 16).zfill(2) + 'user1', salted)
+
+    def test_salted_put_and_get(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        s.map(hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020', saltBuckets=16))
+        s.map(hbase.HBaseGet(tableName=_get_table_name(), rowAttrName='who', connection='localhost:8020', schema=StreamSchema('tuple<rstring who, rstring value>'), saltBuckets=16))
+        names = [o.name for o in topo.graph.operators]
+        self.assertEqual(2, len([n for n in names if n.startswith('HBaseSaltRowKey')]))
+        # the output of the put has no row attribute
+        self.assertEqual(1, len([n for n in names if n.startswith('HBaseUnsaltRowKey')]))
+
+    def test_salted_scan(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, saltBuckets=4, startRow='user1'))
+        scans = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEScan']
+        self.assertEqual(['0user1', '1user1', '2user1', '3user1'], [str(o.params['startRow']) for o in scans])
+        self.assertEqual(['1', '2', '3'], [str(o.params['endRow']) for o in scans[:3]])
+        self.assertNotIn('endRow', scans[3].params)
+        self.assertIn('HBaseUnsaltRowKey', [o.name for o in topo.graph.operators])
+
+    def test_salted_scan_key_range(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, saltBuckets=2, startRow='a', endRow='m'))
+        scans = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEScan']
+        self.assertEqual([('0a', '0m'), ('1a', '1m')], [(str(o.params['startRow']), str(o.params['endRow'])) for o in scans])
+
+    def test_salted_scan_row_prefix(self):
+        topo = Topology()
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        topo.source(hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, saltBuckets=2, rowPrefix='usr'))
+        scans = [o for o in topo.graph.operators if o.kind == 'com.ibm.streamsx.hbase::HBASEScan']
+        self.assertEqual(['0usr', '1usr'], [str(o.params['rowPrefix']) for o in scans])
+
+    def test_salted_row_keys_invalid(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>'))
+        schema = StreamSchema('tuple<rstring row, int32 numResults, rstring columnFamily, rstring columnQualifier, rstring value>')
+        self.assertRaises(ValueError, topo.source, hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', schema=schema, saltBuckets=4, parallelWidth=2))
+        self.assertRaises(ValueError, s.map, hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020', saltBuckets=1))
+
+    def test_compute_split_points(self):
+        self.assertEqual(['c', 'e', 'g'], hbase.compute_split_points(['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h'], 4))
+        self.assertEqual([], hbase.compute_split_points([], 4))
+
+    def test_column_family_invalid(self):
+        self.assertRaises(ValueError, hbase.ColumnFamily, 'cf', compression='XZ')
+        self.assertRaises(ValueError, hbase.ColumnFamily, 'cf', max_versions=0)
+        self.assertRaises(ValueError, hbase.ColumnFamily, 'cf', block_size=65536.0)
+        self.assertRaises(ValueError, hbase.ColumnFamily, 'cf', ttl=0)
+        self.assertRaises(ValueError, hbase.ColumnFamily, 'cf', ttl=1.5)
+        self.assertRaises(ValueError, hbase.ColumnFamily, 'cf', ttl=datetime.timedelta(milliseconds=1500))
+
+    def test_column_family_ttl(self):
+        self.assertEqual(1, hbase.ColumnFamily('cf', ttl=1).ttl)
+        self.assertEqual(604800, hbase.ColumnFamily('cf', ttl=datetime.timedelta(days=7)).ttl)
+
+    def test_create_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hbase_shell, script = _create_hbase_shell(tmp)
+            cf = hbase.ColumnFamily('cf', compression='snappy', bloom_filter='ROW', block_size=65536, ttl=86400)
+            hbase.create_table('events', [cf, 'meta'], split_points=['m', 'g'], connection='localhost:8020', hbase_shell=hbase_shell)
+            with open(script) as f:
+                self.assertEqual("create 'events', {NAME => 'cf', COMPRESSION => 'SNAPPY', BLOOMFILTER => 'ROW', BLOCKSIZE => '65536', TTL => 86400}, "
+                                 "{NAME => 'meta'}, {SPLITS => ['g', 'm']}\nexit\n", f.read())
+
+    def test_alter_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hbase_shell, script = _create_hbase_shell(tmp)
+            hbase.alter_table('events', hbase.ColumnFamily('meta', max_versions=3), connection='localhost:8020', hbase_shell=hbase_shell)
+            with open(script) as f:
+                self.assertEqual("alter 'events', {NAME => 'meta', VERSIONS => 3}\nexit\n", f.read())
+
+    def test_alter_table_failure(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hbase_shell, script = _create_hbase_shell(tmp)
+            with unittest.mock.patch.dict(os.environ, {'EXIT_CODE': '1'}):
+                self.assertRaises(RuntimeError, hbase.alter_table, 'events', 'meta', connection='localhost:8020', hbase_shell=hbase_shell)
+
+    def test_row_key_sample(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sample_file = os.path.join(tmp, 'row_keys.txt')
+            sampler = hbase._hbase._RowKeySample(sample_file, 'who', 3, 60.0)
+            sampler.__enter__()
+            for key in ['d', 'a', 'c', 'b', 'e']:
+                sampler({'who': key})
+            sampler.__exit__(None, None, None)
+            self.assertEqual(3, len(hbase.compute_split_points(sample_file, 4)))
+
+    def test_row_key_sample_options(self):
+        topo = Topology()
+        s = topo.source(['row1']).map(lambda x: {'who': x}, schema=StreamSchema('tuple<rstring who>'))
+        s.for_each(hbase.HBaseRowKeySample(sampleFile='/tmp/row_keys.txt', rowAttrName='who', sampleSize=100))
+        self.assertRaises(ValueError, s.for_each, hbase.HBaseRowKeySample(sampleFile='/tmp/row_keys.txt', rowAttrName='who', sampleSize=0))
+
+    def test_create_table_durability(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hbase_shell, script = _create_hbase_shell(tmp)
+            hbase.create_table('rollups', 'cf', split_points=['m'], connection='localhost:8020', hbase_shell=hbase_shell, durability='async_wal')
+            with open(script) as f:
+                self.assertEqual("create 'rollups', {NAME => 'cf'}, {SPLITS => ['m'], DURABILITY => 'ASYNC_WAL'}\nexit\n", f.read())
+
+    def test_alter_table_durability(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hbase_shell, script = _create_hbase_shell(tmp)
+            hbase.alter_table('rollups', connection='localhost:8020', hbase_shell=hbase_shell, durability='SKIP_WAL')
+            with open(script) as f:
+                self.assertEqual("alter 'rollups', {DURABILITY => 'SKIP_WAL'}\nexit\n", f.read())
+
+    def test_table_durability_invalid(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hbase_shell, script = _create_hbase_shell(tmp)
+            self.assertRaises(ValueError, hbase.alter_table, 'rollups', connection='localhost:8020', hbase_shell=hbase_shell, durability='NO_WAL')
+            self.assertRaises(ValueError, hbase.alter_table, 'rollups', connection='localhost:8020', hbase_shell=hbase_shell)
+
+    def test_mutate(self):
+        topo = Topology()
+        s = topo.source(['u1']).map(lambda x: {'op': 'put', 'who': x, 'value': 'v', 'count': 1}, schema=StreamSchema('tuple<rstring op, rstring who, rstring value, int64 count>'))
+        s.map(hbase.HBaseMutate(tableName=_get_table_name(), rowAttrName='who', opAttrName='op', connection='localhost:8020',
+                                schema=StreamSchema('tuple<rstring who, boolean success>'), valueAttrName='value', incrementAttrName='count',
+                                staticColumnFamily='info', staticColumnQualifier='visits', successAttr='success'))
+        ops = dict((o.kind, o) for o in topo.graph.operators)
+        for kind in ('HBASEPut', 'HBASEDelete', 'HBASEIncrement'):
+            self.assertEqual('info', ops['com.ibm.streamsx.hbase::' + kind].params['staticColumnFamily'])
+        self.assertEqual('count', ops['com.ibm.streamsx.hbase::HBASEIncrement'].params['incrementAttrName'])
+        self.assertIn('spl.utility::Union', ops)
+
+    def test_mutate_fused(self):
+        topo = Topology()
+        s = topo.source(['u1']).map(lambda x: {'op': 'put', 'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring op, rstring who, rstring value>'))
+        s.map(hbase.HBaseMutate(tableName=_get_table_name(), rowAttrName='who', opAttrName='op', connection='localhost:8020',
+                                valueAttrName='value', staticColumnFamily='info', staticColumnQualifier='visits'))
+        # all operators of the mutations run in one processing element
+        routed = [o.name for o in topo.graph.operators if o.name.startswith('HBaseMutate')]
+        self.assertEqual(6, len(routed))
+        group = [g for g in _fused_operators(topo) if routed[0] in g][0]
+        self.assertTrue(all(name in group for name in routed))
+        self.assertNotIn(topo.graph.operators[1].name, group)
+
+    def test_mutate_invalid(self):
+        topo = Topology()
+        s = topo.source(['u1']).map(lambda x: {'op': 'put', 'who': x, 'value': 'v', 'count': 1}, schema=StreamSchema('tuple<rstring op, rstring who, rstring value, int64 count>'))
+        self.assertRaises(ValueError, s.map, hbase.HBaseMutate(tableName=_get_table_name(), rowAttrName='who', opAttrName='op', connection='localhost:8020', increment=2, incrementAttrName='count', valueAttrName='value'))
+
+    def test_mutate_routing(self):
+        topo = Topology()
+        s = topo.source(['u1']).map(lambda x: {'op': 'put', 'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring op, rstring who, rstring value>'))
+        s.map(hbase.HBaseMutate(tableName=_get_table_name(), rowAttrName='who', opAttrName='op', connection='localhost:8020',
+                                valueAttrName='value', staticColumnFamily='info', staticColumnQualifier='visits'))
+        split = [o for o in topo.graph.operators if o.kind == 'spl.utility::Split'][0]
+        self.assertEqual(4, len(split.outputPorts))
+        self.assertEqual('op == "put" ? 0l : op == "delete" ? 1l : op == "increment" ? 2l : 3l', split.params['index'].spl_json()['value'])
+        self.assertNotIn('com.ibm.streamsx.topology.functional.python::Filter', [o.kind for o in topo.graph.operators])
+        # tuples with an unknown operation are not dropped silently
+        self.assertIn('HBaseMutateUnknown', [o.name for o in topo.graph.operators])
+
+    def test_mutate_unknown_operation(self):
+        metrics = dict()
+        unknown = pickle.loads(pickle.dumps(hbase._hbase._UnknownOperation('op', 'who')))
+        with _patch_metrics(metrics):
+            unknown.__enter__()
+            with self.assertLogs('streamsx.hbase._hbase', level='WARNING'):
+                unknown({'op': 'upsert', 'who': 'u1'})
+        self.assertEqual(1, metrics['nUnknownOperations'].value)
+
+    def test_mutate_metrics(self):
+        topo = Topology()
+        s = topo.source(['u1']).map(lambda x: {'op': 'delete', 'who': x, 'value': 'v'}, schema=StreamSchema('tuple<rstring op, rstring who, rstring value>'))
+        s.map(hbase.HBaseMutate(tableName=_get_table_name(), rowAttrName='who', opAttrName='op', connection='localhost:8020',
+                                valueAttrName='value', staticColumnFamily='info', staticColumnQualifier='visits', metrics=True))
+        names = [op.name for op in topo.graph.operators]
+        for probe in ('PutRequest', 'DeleteRequest', 'IncrementRequest', 'PutResponse', 'DeleteResponse'):
+            self.assertIn('HBaseMetrics' + probe, names)
+
+    def test_populate_keeps_options(self):
+        scan = hbase.HBaseScan(tableName=_get_table_name(), connection='localhost:8020', maxVersions=3, parallelWidth=2, rowMode=True)
+        put = hbase.HBasePut(tableName=_get_table_name(), rowAttrName='who', valueAttrName='value', connection='localhost:8020', batchSize=10)
+        put.enableBuffer = True
+        for topo in (Topology(), Topology()):
+            topo.source(scan).end_parallel()
+            _create_stream_for_get(topo).map(lambda x: {'who': x['who'], 'value': 'v'}, schema=StreamSchema('tuple<rstring who, rstring value>')).map(put)
+        self.assertEqual(3, scan.maxVersions)
+        self.assertIsNone(scan.channel)
+        self.assertIs(CommonSchema.String, scan.schema)
+        self.assertIsNone(scan.hbaseSite)
+        self.assertEqual(10, put.batchSize)
+        self.assertIs(True, put.enableBuffer)
 
 
 class TestDistributedPut(unittest.TestCase):